@@ -239,7 +239,13 @@ def register():
 
 def unregister():
     from .functions import async_subprocess
+    from .functions.utils import disable_bvh_cache
+    from .functions.core import cleanup_addon_state
     async_subprocess.cancel_all()
+    disable_bvh_cache()
+    # Remove draw handlers too: a reloaded module starts with empty handler
+    # bookkeeping and would register a second set next to the stale one
+    cleanup_addon_state()
     unregister_keymap()
     properties.unregister()
     for cls in reversed(classes):
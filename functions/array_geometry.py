@@ -0,0 +1,172 @@
+"""Blender-free geometry helpers shared by the interactive operators.
+
+This module imports no Blender modules so the logic can be unit-tested
+outside Blender (see tests/test_array_geometry.py). Callers in utils/core
+read mesh data with ``foreach_get`` and convert results back to mathutils
+types where the operators need them.
+"""
+import numpy as np
+
+
+def concat_ranges(starts, lengths):
+    """Indices of the concatenated ranges [starts[i], starts[i] + lengths[i])."""
+    total = int(lengths.sum())
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def face_adjacency_csr(face_count, loop_total, loop_edges, edge_count):
+    """Face -> edge-neighbour faces in CSR form.
+
+    Returns (face_start, neighbors): the faces sharing an edge with face f
+    are neighbors[face_start[f]:face_start[f + 1]] (repeats possible).
+    """
+    loop_faces = np.repeat(np.arange(face_count, dtype=np.int32), loop_total)
+    order = np.argsort(loop_edges, kind='stable')
+    sorted_edges = loop_edges[order]
+    sorted_faces = loop_faces[order]
+    edge_start = np.searchsorted(sorted_edges, np.arange(edge_count + 1))
+
+    # Pair every loop with every loop of the same edge
+    group_start = edge_start[sorted_edges]
+    group_size = edge_start[sorted_edges + 1] - group_start
+    src = np.repeat(sorted_faces, group_size)
+    dst = sorted_faces[concat_ranges(group_start, group_size)]
+    keep = src != dst
+    src = src[keep]
+    dst = dst[keep]
+
+    order = np.argsort(src, kind='stable')
+    face_start = np.searchsorted(src[order], np.arange(face_count + 1))
+    return face_start, dst[order]
+
+
+def coplanar_from_normals(normals, adjacency, seed_idx, cos_thresh, degenerate=None):
+    """Walk edge-connected faces whose normal is within cos_thresh of the seed.
+
+    The walk expands a whole BFS frontier per step with array ops, so its
+    Python overhead scales with the depth of the region, not its face count.
+
+    Args:
+        normals: (F, 3) array of face normals
+        adjacency: (face_start, neighbors) CSR arrays from face_adjacency_csr
+        seed_idx: Face the walk starts from
+        cos_thresh: Cosine of the angle tolerance
+        degenerate: Optional (F,) bool mask of zero-length normals, which
+            count as parallel to anything
+
+    Returns:
+        numpy.ndarray: int32 indices of the connected coplanar faces
+    """
+    face_start, neighbors = adjacency
+
+    # Compare every face to the seed face up front (to maintain planarity
+    # stability); the walk then only enters faces that pass.
+    if degenerate is not None and degenerate[seed_idx]:
+        passes = np.ones(len(normals), dtype=bool)
+    else:
+        passes = (normals @ normals[seed_idx]) > cos_thresh
+        if degenerate is not None:
+            passes |= degenerate
+
+    visited = np.zeros(len(normals), dtype=bool)
+    visited[seed_idx] = True
+    frontier = np.array([seed_idx], dtype=np.int32)
+    found = [frontier]
+
+    while frontier.size:
+        starts = face_start[frontier]
+        candidates = neighbors[concat_ranges(starts, face_start[frontier + 1] - starts)]
+        candidates = np.unique(candidates[~visited[candidates]])
+        visited[candidates] = True
+        frontier = candidates[passes[candidates]]
+        found.append(frontier)
+
+    return np.concatenate(found)
+
+
+def project_point_to_plane_intersection(hit_location, face_normal, plane_origin, plane_normal):
+    """
+    Project a point (hit_location on Face Plane) onto the line of intersection 
+    between Face Plane and Cursor Plane (plane_origin, plane_normal).
+    
+    Called on every mouse move in limit-plane mode, so it works with the
+    unnormalized line direction throughout (no sqrt/normalize). Only
+    cross/dot/length_squared and arithmetic are used, so mathutils.Vector
+    arguments come back as a Vector.
+    
+    Returns:
+        Vector: The projected point on the intersection line, or None if planes are parallel.
+    """
+    # Plane 1: Face Plane (P - hit_location) . face_normal = 0
+    # Plane 2: Cursor Plane (P - plane_origin) . plane_normal = 0
+    
+    # Direction of intersection line L
+    line_dir = face_normal.cross(plane_normal)
+    len_sq = line_dir.length_squared
+    
+    # If cross product is near zero, planes are parallel
+    if len_sq < 1e-6:
+        return None
+    
+    # Point on both planes (from http://geomalgorithms.com/a05-_intersect-1.html):
+    # N1 . P = d1, N2 . P = d2  =>  P0 = ((d1 * N2 - d2 * N1) x L) / |L|^2
+    d1 = face_normal.dot(hit_location)
+    d2 = plane_normal.dot(plane_origin)
+    p0 = (d1 * plane_normal - d2 * face_normal).cross(line_dir) / len_sq
+    
+    # Project hit_location onto the line P(t) = P0 + t * L
+    t = (hit_location - p0).dot(line_dir) / len_sq
+    return p0 + t * line_dir
+
+
+def cursor_local_bounding_sphere(coords, cursor_location, cursor_rot_mat):
+    """Bounding sphere of coords centred on their cursor-aligned box.
+
+    Points are taken to cursor space as (p - c) @ R (the rotation inverse is
+    its transpose), where the box centre and the radius are array reductions.
+
+    Returns:
+        tuple: (cursor-space centre ndarray, radius float)
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    local_verts = (coords - np.array(cursor_location, dtype=np.float64)) @ np.array(cursor_rot_mat, dtype=np.float64)
+    local_center = (local_verts.min(axis=0) + local_verts.max(axis=0)) / 2.0
+    offsets = local_verts - local_center
+    radius = float(np.sqrt(np.einsum('ij,ij->i', offsets, offsets).max()))
+    return local_center, radius
+
+
+class PointBuffer:
+    """Growable (N, 3) float64 point store.
+
+    Points are written into a preallocated array that doubles when full,
+    so appends do not allocate a Vector each and the bbox fit can take
+    the filled slice directly.
+    """
+
+    def __init__(self, capacity=64):
+        self._buf = np.empty((capacity, 3), dtype=np.float64)
+        self._count = 0
+
+    def append(self, location):
+        if self._count == len(self._buf):
+            grown = np.empty((len(self._buf) * 2, 3), dtype=np.float64)
+            grown[:self._count] = self._buf[:self._count]
+            self._buf = grown
+        self._buf[self._count] = location[:3]
+        self._count += 1
+
+    def clear(self):
+        self._count = 0
+
+    @property
+    def array(self):
+        """View of the filled rows; copy it before the buffer changes."""
+        return self._buf[:self._count]
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.array)
@@ -61,12 +61,12 @@ class _DecompJob:
     __slots__ = (
         'process', 'temp_dir', 'result_path', 'obj_name',
         'tool_name', 'prefix', '_queue', '_reader',
-        'return_code', 'all_output',
+        'return_code', 'all_output', 'retry',
         'start_time', 'line_count', '_tick', '_last_status', '_percent',
     )
 
     def __init__(self, process, temp_dir, result_path,
-                 obj_name, tool_name, prefix):
+                 obj_name, tool_name, prefix, retry=None):
         self.process = process
         self.temp_dir = temp_dir
         self.result_path = result_path
@@ -77,6 +77,7 @@ class _DecompJob:
         self._reader = None
         self.return_code = None
         self.all_output = []
+        self.retry = retry
         self.start_time = time.time()
         self.line_count = 0
         self._tick = 0
@@ -142,6 +143,14 @@ class _DecompJob:
             except queue.Empty:
                 break
 
+    def restart(self, process):
+        """Follow a relaunched *process* in place of the finished one."""
+        self.drain_remaining()
+        self.process = process
+        self.return_code = None
+        self._percent = -1.0
+        self.start_reader()
+
     def poll(self):
         if self.return_code is not None:
             return True
@@ -174,6 +183,9 @@ _jobs: list = []
 _timer_registered: bool = False
 _tick_count: int = 0
 
+# Returned by a job's retry callback to be asked again on a later tick
+RETRY_LATER = object()
+
 
 # ------------------------------------------------------------------ #
 #  Public helpers                                                     #
@@ -192,12 +204,19 @@ def get_status_lines():
     ]
 
 
-def submit(process, temp_dir, result_path, obj_name, tool_name, prefix):
-    """Register a new async decomposition job and start the monitor timer."""
+def submit(process, temp_dir, result_path, obj_name, tool_name, prefix,
+           retry=None):
+    """Register a new async decomposition job and start the monitor timer.
+
+    retry, if given, is called with the exit code when the process
+    finishes; it returns a relaunched process to keep the job running,
+    None to finish the job as usual, or RETRY_LATER to be called again on
+    the next tick instead of waiting on the UI thread.
+    """
     global _timer_registered
 
     job = _DecompJob(process, temp_dir, result_path,
-                     obj_name, tool_name, prefix)
+                     obj_name, tool_name, prefix, retry)
     job.start_reader()
     _jobs.append(job)
 
@@ -242,6 +261,15 @@ def _tick():
 
     total_hulls = 0
     for job in finished:
+        if job.retry is not None:
+            _clear_progress_line()
+            process = job.retry(job.return_code)
+            if process is RETRY_LATER:
+                continue
+            job.retry = None
+            if process is not None:
+                job.restart(process)
+                continue
         _jobs.remove(job)
         total_hulls += _finish_job(job)
 
@@ -1,10 +1,31 @@
 """Shared OBJ export/import and hull organization utilities for collision decomposition operators."""
 
 import bpy
+import errno
+import io
+import os
+import threading
+import time
+
+import numpy as np
 
 from .utils import assign_object_styles
 
 
+def build_presets(keys, rows):
+    """
+    Expand compact preset rows into the per-enum dicts used by the UI.
+
+    Args:
+        keys: Property names, in the same order as the values in each row.
+        rows: One tuple of values per detail step, least detailed first.
+
+    Returns:
+        dict: ``{'D01': {key: value, ...}, 'D02': ..., ...}``
+    """
+    return {f"D{i + 1:02d}": dict(zip(keys, row)) for i, row in enumerate(rows)}
+
+
 def export_mesh_as_obj(context, obj, export_path):
     """
     Export a single mesh object as a triangulated OBJ file.
@@ -37,6 +58,140 @@ def export_mesh_as_obj(context, obj, export_path):
     )
 
 
+def mesh_to_obj_bytes(context, obj):
+    """
+    Serialize a mesh object as triangulated OBJ data without ``bpy.ops``.
+
+    Produces the same geometry as export_mesh_as_obj (world space, modifiers
+    applied, Y-up / -Z-forward) but reads the evaluated mesh buffers with
+    ``foreach_get``, so it needs no selection changes or exporter round trip.
+
+    Args:
+        context: Blender context.
+        obj: Mesh object to serialize.
+
+    Returns:
+        bytes: ASCII OBJ data with ``v`` and ``f`` records only.
+    """
+    obj_eval = obj.evaluated_get(context.evaluated_depsgraph_get())
+    mesh = obj_eval.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+    finally:
+        obj_eval.to_mesh_clear()
+
+    mat = np.array(obj.matrix_world, dtype=np.float64)
+    co = co.reshape(-1, 3).astype(np.float64) @ mat[:3, :3].T + mat[:3, 3]
+    # Blender (Z-up) -> OBJ (Y-up): the inverse of _obj_to_blender_coord.
+    co = co[:, (0, 2, 1)] * (1.0, 1.0, -1.0)
+
+    buf = io.StringIO()
+    buf.write("# Cursor BBox collision input\n")
+    np.savetxt(buf, co, fmt="v %.6f %.6f %.6f")
+    np.savetxt(buf, tris.reshape(-1, 3) + 1, fmt="f %d %d %d")
+    return buf.getvalue().encode('ascii')
+
+
+def make_obj_fifo(path):
+    """
+    Create a named pipe at *path* for streaming OBJ data to a subprocess.
+
+    Returns:
+        bool: True if the FIFO was created; False where named pipes are not
+        available (Windows) or creation failed, in which case the caller
+        should write a regular file instead.
+    """
+    if not hasattr(os, 'mkfifo'):
+        return False
+    try:
+        os.mkfifo(path)
+    except OSError:
+        return False
+    return True
+
+
+class ObjFifoFeed:
+    """
+    Feed OBJ bytes to a subprocess through the FIFO at *path*.
+
+    start() writes *data* from a daemon thread. The writer waits, without
+    blocking Blender, until the process opens the pipe for reading, and
+    gives up if the process exits first, so a tool that fails on its
+    arguments cannot leave a thread stuck on ``open``. ``done`` is set
+    when the writer thread has returned, however it ended.
+
+    Not every tool build can read from a pipe: it may stat or reopen its
+    input, reject a non-regular file, or exit before opening it.
+    Once ``done`` is set, needs_fallback() tells whether that happened
+    (the pipe was never opened, or the reader closed it before taking all
+    the data), and write_file() swaps the FIFO for a regular file with
+    the same data so the job can be launched again.
+
+    Args:
+        path: FIFO created by make_obj_fifo.
+        data: OBJ bytes, e.g. from mesh_to_obj_bytes.
+    """
+
+    def __init__(self, path, data):
+        self.path = path
+        self.data = data
+        self.opened = threading.Event()
+        self.done = threading.Event()
+        self.complete = False
+
+    def start(self, process):
+        """Start writing to the pipe for *process* (the ``subprocess.Popen`` reading it)."""
+        threading.Thread(target=self._write, args=(process,), daemon=True).start()
+
+    def _write(self, process):
+        try:
+            fd = None
+            while fd is None:
+                try:
+                    fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+                except OSError as e:
+                    if e.errno != errno.ENXIO or process.poll() is not None:
+                        return
+                    time.sleep(0.01)
+            self.opened.set()
+            os.set_blocking(fd, True)
+            view = memoryview(self.data)
+            try:
+                while view:
+                    view = view[os.write(fd, view):]
+            except OSError:
+                # EPIPE: the reader closed the pipe before taking everything
+                return
+            finally:
+                os.close(fd)
+            self.complete = True
+        finally:
+            self.done.set()
+
+    def needs_fallback(self):
+        """True if the process never opened the pipe or stopped reading early.
+
+        Only meaningful once ``done`` is set.
+        """
+        return not self.opened.is_set() or not self.complete
+
+    def write_file(self):
+        """Replace the FIFO with a regular file holding the same OBJ data.
+
+        Call only once ``done`` is set, so the writer cannot touch the new file.
+        """
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        with open(self.path, 'wb') as f:
+            f.write(self.data)
+
+
 def _obj_to_blender_coord(x, y, z):
     """Map an OBJ vertex (Y-up, -Z-forward) to Blender space (Z-up, -Y-forward).
 
@@ -3,8 +3,10 @@ import bmesh
 from mathutils import Vector, Matrix
 import time
 from functools import lru_cache
-from ..settings.preferences import get_preferences
+import numpy as np
+from ..settings.preferences import get_bbox_display_prefs
 from .utils import ensure_cbb_collection, ensure_cbb_material, assign_object_styles
+from .array_geometry import cursor_local_bounding_sphere
 from ..ui.draw import (
     GPUDrawingManager, 
     generate_bbox_geometry_optimized,
@@ -38,6 +40,8 @@ class CursorBBoxState:
         # Performance caches
         self.bbox_geometry_cache = {}
         self.coordinate_transform_cache = {}
+        # (obj name, mesh pointer, use_depsgraph) -> world-space triangle arrays
+        self.mesh_array_cache = {}
 
         # Visual settings
         self.show_backfaces = False
@@ -57,6 +61,7 @@ class CursorBBoxState:
         self.preview_faces_visual_cache.clear()
         self.bbox_geometry_cache.clear()
         self.coordinate_transform_cache.clear()
+        self.mesh_array_cache.clear()
         self.current_edge_data = None
         self.current_bbox_data = None
     
@@ -132,10 +137,53 @@ def get_marked_points_info():
 
 # ===== FACE MARKING =====
 
+def _get_triangle_arrays(obj, use_depsgraph=False):
+    """World-space loop-triangle corners of obj and their polygon indices.
+
+    Read once with foreach_get and kept in _state.mesh_array_cache for the
+    rest of the operator session (cleared when face marking is enabled or
+    disabled), so marking or hovering more faces only indexes the arrays.
+
+    Returns:
+        tuple: ((T, 3, 3) float32 corners, (T,) int32 polygon indices, polygon count)
+    """
+    global _state
+    from .utils import get_evaluated_mesh
+    
+    mesh, obj_mat = get_evaluated_mesh(obj, use_depsgraph=use_depsgraph)
+    key = (obj.name, mesh.as_pointer(), use_depsgraph)
+    cached = _state.mesh_array_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    # Use loop_triangles which provides correct triangulation for all face types
+    # including concave faces, ngons, and faces with holes
+    mesh.calc_loop_triangles()
+    tri_count = len(mesh.loop_triangles)
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    tri_verts = np.empty(tri_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tri_verts)
+    tri_polys = np.empty(tri_count, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", tri_polys)
+    
+    mat = np.array(obj_mat, dtype=np.float64)
+    world = co.reshape(-1, 3)[tri_verts] @ mat[:3, :3].T + mat[:3, 3]
+    cached = (world.astype(np.float32).reshape(-1, 3, 3), tri_polys, len(mesh.polygons))
+    _state.mesh_array_cache[key] = cached
+    return cached
+
+def _gather_face_triangles(obj, face_indices, use_depsgraph=False):
+    """(N, 3) float32 world-space triangle vertices of the given polygons."""
+    tri_world, tri_polys, poly_count = _get_triangle_arrays(obj, use_depsgraph)
+    faces = np.fromiter(face_indices, dtype=np.int32, count=len(face_indices))
+    face_mask = np.zeros(poly_count, dtype=bool)
+    face_mask[faces[(faces >= 0) & (faces < poly_count)]] = True
+    return tri_world[face_mask[tri_polys]].reshape(-1, 3)
+
 def mark_faces_batch(obj, face_indices, use_depsgraph=False):
     """Efficiently mark multiple faces at once - uses mesh tessellation for correct triangles"""
     global _state
-    from .utils import get_evaluated_mesh
     
     if obj.type != 'MESH':
         return
@@ -152,35 +200,44 @@ def mark_faces_batch(obj, face_indices, use_depsgraph=False):
     if not face_indices:
         return
     
-    vertices = []
-    face_indices_set = set(face_indices)
+    vertices = _gather_face_triangles(obj, face_indices, use_depsgraph)
     
-    # Get evaluated mesh using shared utility
-    mesh, obj_mat = get_evaluated_mesh(obj, use_depsgraph=use_depsgraph)
+    # Update visual cache with new vertices
+    if len(vertices):
+        _state.marked_faces_visual_cache[obj.name] = vertices
+
+def append_marked_faces_visual(obj, new_faces, use_depsgraph=False):
+    """Mark additional faces by appending only their triangles to the visual cache.
+
+    Adding faces never changes the triangles already cached for the object,
+    so there is no need to re-gather the whole marked set the way
+    rebuild_marked_faces_visual_data does; removals still go through a rebuild.
+    new_faces must not already be drawn (callers pass the set difference).
+    """
+    global _state
     
-    # Ensure mesh has calculated tessellation
-    mesh.calc_loop_triangles()
+    if obj.type != 'MESH' or not new_faces:
+        return
     
-    # Use loop_triangles which provides correct triangulation for all face types
-    # including concave faces, ngons, and faces with holes
-    for tri in mesh.loop_triangles:
-        if tri.polygon_index in face_indices_set:
-            # Add the three vertices of this triangle in world space
-            for loop_idx in tri.loops:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                vertices.append(obj_mat @ mesh.vertices[vert_idx].co)
+    _state.marked_faces.setdefault(obj, set()).update(new_faces)
     
-    # Update visual cache with new vertices
-    if vertices:
-        _state.marked_faces_visual_cache[obj.name] = vertices
+    vertices = _gather_face_triangles(obj, new_faces, use_depsgraph)
+    if not len(vertices):
+        return
+    
+    existing = _state.marked_faces_visual_cache.get(obj.name)
+    if existing is not None and len(existing):
+        vertices = np.concatenate((existing, vertices))
+    _state.marked_faces_visual_cache[obj.name] = vertices
+    
+    # The object's batch is rebuilt from the grown array on the next draw
+    _state.gpu_manager.clear_cache_key('marked_faces_' + obj.name)
 
-def mark_face(obj, face_index):
+def mark_face(obj, face_index, use_depsgraph=False):
     """Mark a single face"""
     global _state
-    if obj not in _state.marked_faces:
-        _state.marked_faces[obj] = set()
-    _state.marked_faces[obj].add(face_index)
-    mark_faces_batch(obj, _state.marked_faces[obj])
+    if face_index not in _state.marked_faces.get(obj, ()):
+        append_marked_faces_visual(obj, (face_index,), use_depsgraph=use_depsgraph)
     
     # Ensure handlers are enabled when we have marked faces
     ensure_handlers_enabled(_state)
@@ -283,7 +340,6 @@ def force_refresh_marked_faces():
 def update_preview_faces(obj, face_indices, use_depsgraph=False):
     """Update faces preview (transient highlight) - uses mesh tessellation for correct triangles"""
     global _state
-    from .utils import get_evaluated_mesh
     
     # Clear previous preview
     _state.preview_faces_visual_cache.clear()
@@ -292,25 +348,9 @@ def update_preview_faces(obj, face_indices, use_depsgraph=False):
     if not obj or not face_indices or obj.type != 'MESH':
         return
         
-    vertices = []
-    face_indices_set = set(face_indices)
-    
-    # Get evaluated mesh using shared utility
-    mesh, obj_mat = get_evaluated_mesh(obj, use_depsgraph=use_depsgraph)
-    
-    # Ensure mesh has calculated tessellation
-    mesh.calc_loop_triangles()
+    vertices = _gather_face_triangles(obj, face_indices, use_depsgraph)
     
-    # Use loop_triangles which provides correct triangulation for all face types
-    # including concave faces, ngons, and faces with holes
-    for tri in mesh.loop_triangles:
-        if tri.polygon_index in face_indices_set:
-            # Add the three vertices of this triangle in world space
-            for loop_idx in tri.loops:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                vertices.append(obj_mat @ mesh.vertices[vert_idx].co)
-    
-    if vertices:
+    if len(vertices):
         _state.preview_faces_visual_cache[obj.name] = vertices
     
     # Ensure handlers enabled
@@ -322,6 +362,11 @@ def clear_preview_faces():
     global _state
     _state.preview_faces_visual_cache.clear()
 
+def has_preview_faces():
+    """Check whether a face preview is currently shown"""
+    global _state
+    return bool(_state.preview_faces_visual_cache)
+
 def update_preview_point(location):
     """Update preview point location"""
     global _state
@@ -405,32 +450,56 @@ def get_preview_culling():
 
 # ===== BBOX CALCULATIONS =====
 
-def calculate_bbox_bounds_optimized(world_coords, cursor_location, cursor_rotation):
-    """Optimized bounding box calculation with caching"""
+def _axis_bounds(coords, origin, rot=None):
+    """Min/max of (coords - origin) along each column axis of rot (world axes if None).
+
+    Rotation inverse is its transpose, so local = (p - c) @ R. Each local
+    axis is reduced on its own: a matrix-vector product per axis runs through
+    BLAS and the 1-D min/max are contiguous, where the (N, 3) @ (3, 3)
+    product and axis-0 reductions of an (N, 3) array walk it with stride 3.
+    """
+    min_co = Vector()
+    max_co = Vector()
+    for k in range(3):
+        if rot is None:
+            proj = coords[:, k]
+            offset = origin[k]
+        else:
+            proj = coords @ rot[:, k]
+            offset = origin @ rot[:, k]
+        min_co[k] = proj.min() - offset
+        max_co[k] = proj.max() - offset
+    return min_co, max_co
+
+def calculate_bbox_bounds_optimized(world_coords, cursor_location, cursor_rotation, cursor_rot_mat=None):
+    """Optimized bounding box calculation with caching
+
+    world_coords may be a sequence of Vectors or an (N, 3) array.
+    cursor_rot_mat, when given, is the 3x3 matrix of cursor_rotation and
+    skips rebuilding it from the Euler.
+    """
     global _state
     
+    coords = np.asarray(world_coords, dtype=np.float64).reshape(-1, 3)
+    
     # Create cache key
-    coords_hash = hash(tuple(tuple(coord) for coord in world_coords))
+    coords_hash = hash(coords.tobytes())
     cursor_hash = hash((tuple(cursor_location), tuple(cursor_rotation)))
     cache_key = (coords_hash, cursor_hash)
     
     if cache_key in _state.coordinate_transform_cache:
         return _state.coordinate_transform_cache[cache_key]
     
-    cursor_rot_mat = cursor_rotation.to_matrix()
-    cursor_rot_mat_inv = cursor_rot_mat.inverted()
-    
-    # Vectorized coordinate transformation
-    local_coords = [cursor_rot_mat_inv @ (p - cursor_location) for p in world_coords]
+    if cursor_rot_mat is None:
+        cursor_rot_mat = cursor_rotation.to_matrix()
     
-    # Fast min/max calculation
-    if local_coords:
-        x_coords = [lc.x for lc in local_coords]
-        y_coords = [lc.y for lc in local_coords]
-        z_coords = [lc.z for lc in local_coords]
-        
-        min_co = Vector((min(x_coords), min(y_coords), min(z_coords)))
-        max_co = Vector((max(x_coords), max(y_coords), max(z_coords)))
+    if len(coords):
+        origin = np.array(cursor_location, dtype=np.float64)
+        if max(abs(a) for a in cursor_rotation) < 1e-7:
+            # Unrotated cursor: local axes are world axes, no projection needed
+            min_co, max_co = _axis_bounds(coords, origin)
+        else:
+            min_co, max_co = _axis_bounds(coords, origin, np.array(cursor_rot_mat, dtype=np.float64))
     else:
         min_co = max_co = Vector()
     
@@ -446,20 +515,46 @@ def calculate_bbox_bounds_optimized(world_coords, cursor_location, cursor_rotati
     _state.coordinate_transform_cache[cache_key] = result
     return result
 
-def update_marked_faces_bbox(marked_faces_dict, push_value, cursor_location, cursor_rotation, marked_points=None, use_depsgraph=False):
-    """Optimized marked faces bbox update with proper cache handling"""
+def apply_push_to_dimensions(dimensions, push_value, epsilon=0.0001, clamp_negative=False):
+    """Clamp bbox dimensions to epsilon and grow each axis by 2 * push_value.
+
+    A negative push that would collapse the smallest axis is skipped, or
+    with clamp_negative shrunk to just under half of that axis.
+    """
+    x, y, z = (max(d, epsilon) for d in dimensions)
+    push = float(push_value)
+    smallest = min(x, y, z)
+    if push < 0 and abs(push) * 2 >= smallest:
+        if not clamp_negative:
+            return Vector((x, y, z))
+        print(f"Warning: Negative push value ({push:.4f} BU) too large, clamping.")
+        push = -(smallest / 2.0) * 0.999
+    grow = 2 * push
+    return Vector((max(x + grow, epsilon), max(y + grow, epsilon), max(z + grow, epsilon)))
+
+def update_marked_faces_bbox(marked_faces_dict, push_value, cursor_location, cursor_rotation, marked_points=None, use_depsgraph=False,
+                             precomputed_world=None, cursor_rot_mat=None):
+    """Optimized marked faces bbox update with proper cache handling
+
+    marked_faces_dict values may be sets or int arrays of face indices.
+    precomputed_world, when given, is the (N, 3) world-space array that
+    collect_marked_face_coords would return for these marks; callers that
+    keep it across cursor-only updates skip re-reading the meshes.
+    cursor_rot_mat, when given, is the 3x3 matrix of cursor_rotation.
+    """
     global _state
-    from .utils import collect_vertices_from_marked_faces
+    from .utils import collect_marked_face_coords
     
     try:
-        # Collect vertices from marked faces using shared utility
-        all_vertices = collect_vertices_from_marked_faces(marked_faces_dict, use_depsgraph=use_depsgraph)
-
-        # Add marked points
-        if marked_points:
-            all_vertices.extend(marked_points)
+        # Collect vertices from marked faces and marked points as one (N, 3) array
+        if precomputed_world is not None:
+            all_vertices = precomputed_world
+        else:
+            all_vertices = collect_marked_face_coords(
+                marked_faces_dict, use_depsgraph=use_depsgraph, extra_points=marked_points
+            )
 
-        if not all_vertices:
+        if not len(all_vertices):
             # No vertices means no bbox to show
             _state.current_bbox_data = None
             # Force clear bbox cache
@@ -473,26 +568,11 @@ def update_marked_faces_bbox(marked_faces_dict, push_value, cursor_location, cur
 
         # Use optimized bounds calculation
         local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
-            all_vertices, cursor_location, cursor_rotation
+            all_vertices, cursor_location, cursor_rotation, cursor_rot_mat=cursor_rot_mat
         )
 
         # Apply push value with safety checks
-        epsilon = 0.0001
-        dimensions = Vector((
-            max(dimensions.x, epsilon),
-            max(dimensions.y, epsilon), 
-            max(dimensions.z, epsilon)
-        ))
-
-        safe_push_value = float(push_value)
-        if safe_push_value > 0 or abs(safe_push_value) * 2 < min(dimensions):
-            dimensions += Vector((2 * safe_push_value,) * 3)
-
-        dimensions = Vector((
-            max(dimensions.x, epsilon),
-            max(dimensions.y, epsilon),
-            max(dimensions.z, epsilon)
-        ))
+        dimensions = apply_push_to_dimensions(dimensions, push_value)
 
         world_center = cursor_location + (cursor_rot_mat @ local_center)
 
@@ -624,20 +704,39 @@ def update_marked_faces_convex_hull(marked_faces_dict, push_value, marked_points
         print(f"Error updating convex hull preview: {e}")
         _state.current_bbox_data = None
 
-def update_marked_faces_sphere(marked_faces_dict, cursor_location, cursor_rotation, marked_points=None, use_depsgraph=False):
-    """Update preview with bounding sphere of marked faces/points (Cursor Aligned)"""
+def cursor_aligned_bounding_sphere(coords, cursor_location, cursor_rot_mat):
+    """Bounding sphere of coords centred on their cursor-aligned box.
+
+    The array work is cursor_local_bounding_sphere; this maps its
+    cursor-space centre back to world space.
+
+    Returns:
+        tuple: (world-space centre Vector, radius float)
+    """
+    local_center, radius = cursor_local_bounding_sphere(coords, cursor_location, cursor_rot_mat)
+    return cursor_location + cursor_rot_mat @ Vector(local_center), radius
+
+def update_marked_faces_sphere(marked_faces_dict, cursor_location, cursor_rotation, marked_points=None, use_depsgraph=False,
+                               precomputed_world=None):
+    """Update preview with bounding sphere of marked faces/points (Cursor Aligned)
+
+    The point cloud is gathered as one (N, 3) array and the cursor-local
+    bounds and radius are array reductions, like update_marked_faces_bbox.
+    precomputed_world is the same shortcut update_marked_faces_bbox takes.
+    """
     global _state
-    from .utils import collect_vertices_from_marked_faces
+    from .utils import collect_marked_face_coords
     
     try:
-        # Collect vertices from marked faces using shared utility
-        all_vertices = collect_vertices_from_marked_faces(marked_faces_dict, use_depsgraph=use_depsgraph)
-
-        # Add marked points
-        if marked_points:
-            all_vertices.extend(marked_points)
+        # Collect vertices from marked faces and marked points as one (N, 3) array
+        if precomputed_world is not None:
+            all_vertices = precomputed_world
+        else:
+            all_vertices = collect_marked_face_coords(
+                marked_faces_dict, use_depsgraph=use_depsgraph, extra_points=marked_points
+            )
 
-        if not all_vertices:
+        if not len(all_vertices):
             _state.current_bbox_data = None
             _state.gpu_manager.clear_cache_key('bbox_faces')
             _state.gpu_manager.clear_cache_key('bbox_edges')
@@ -647,38 +746,10 @@ def update_marked_faces_sphere(marked_faces_dict, cursor_location, cursor_rotati
         if 'bbox_preview' not in _state.handlers:
             enable_bbox_preview(_state)
 
-        # Transform to Local Space of Cursor for "Oriented" Bounding calculation
         cursor_rot_mat = cursor_rotation.to_matrix()
-        cursor_matrix = Matrix.Translation(cursor_location) @ cursor_rot_mat.to_4x4()
-        cursor_matrix_inv = cursor_matrix.inverted()
-        
-        local_verts = [cursor_matrix_inv @ v for v in all_vertices]
-
-        # Calculate Center (BBox Center in Local Space)
-        min_co = Vector(local_verts[0])
-        max_co = Vector(local_verts[0])
-        
-        for v in local_verts:
-            min_co.x = min(min_co.x, v.x)
-            min_co.y = min(min_co.y, v.y)
-            min_co.z = min(min_co.z, v.z)
-            max_co.x = max(max_co.x, v.x)
-            max_co.y = max(max_co.y, v.y)
-            max_co.z = max(max_co.z, v.z)
-            
-        local_center = (min_co + max_co) / 2.0
-        
-        # Calculate Radius (Max Distance from Center in Local Space)
-        radius = 0.0
-        for v in local_verts:
-            dist = (v - local_center).length
-            if dist > radius:
-                radius = dist
-        
+        world_center, radius = cursor_aligned_bounding_sphere(
+            all_vertices, cursor_location, cursor_rot_mat)
         radius = max(radius, 0.05)
-        
-        # Calculate World Center for the Sphere
-        world_center = cursor_matrix @ local_center
                 
         # Generate Sphere Geometry
         bm = bmesh.new()
@@ -792,22 +863,7 @@ def update_bbox_preview(target_obj, push_value, cursor_location, cursor_rotation
         )
         
         # Apply push value
-        epsilon = 0.0001
-        dimensions = Vector((
-            max(dimensions.x, epsilon),
-            max(dimensions.y, epsilon),
-            max(dimensions.z, epsilon)
-        ))
-        
-        safe_push_value = float(push_value)
-        if safe_push_value > 0 or abs(safe_push_value) * 2 < min(dimensions):
-            dimensions += Vector((2 * safe_push_value,) * 3)
-        
-        dimensions = Vector((
-            max(dimensions.x, epsilon),
-            max(dimensions.y, epsilon),
-            max(dimensions.z, epsilon)
-        ))
+        dimensions = apply_push_to_dimensions(dimensions, push_value)
         
         world_center = cursor_location + (cursor_rot_mat @ local_center)
         
@@ -827,6 +883,29 @@ def update_bbox_preview(target_obj, push_value, cursor_location, cursor_rotation
 
 # ===== BOUNDING BOX CREATION =====
 
+def _create_bbox_object(context, location, rotation, dimensions, assign_styles,
+                        show_wire, show_all_edges):
+    """Build a box object in the CBB collection without touching selection.
+
+    The cube comes straight from bpy.data (see utils.new_cube_object), with
+    the same mesh and UVMap layer primitive_cube_add creates, so all three
+    creation paths below produce identical boxes. The box is linked
+    unselected; the active object and selection are left as they were.
+    """
+    from .utils import new_cube_object, setup_new_object
+
+    bbox_obj = new_cube_object(context.scene.cursor_bbox_name_box or "Cube")
+    bbox_obj.location = location
+    bbox_obj.rotation_euler = rotation
+
+    # Set up object (collection, styles)
+    setup_new_object(context, bbox_obj, assign_styles=assign_styles, move_to_collection=True)
+
+    bbox_obj.scale = dimensions
+    bbox_obj.show_wire = show_wire
+    bbox_obj.show_all_edges = show_all_edges
+    return bbox_obj
+
 def cursor_aligned_bounding_box(push_value, target_obj=None, marked_faces=None, marked_points=None, use_depsgraph=False):
     """Main bounding box creation function - optimized version"""
     context = bpy.context
@@ -835,102 +914,47 @@ def cursor_aligned_bounding_box(push_value, target_obj=None, marked_faces=None,
     # Capture cursor state before any potential mode changes
     cursor_location = cursor.location.copy()
     
-    # Robustly capture rotation as XYZ Euler regardless of mode
-    if cursor.rotation_mode == 'QUATERNION':
-        cursor_rotation = cursor.rotation_quaternion.to_euler('XYZ')
-    elif cursor.rotation_mode == 'AXIS_ANGLE':
-        aa = cursor.rotation_axis_angle
-        # Matrix.Rotation(angle, size, axis)
-        rot_mat = Matrix.Rotation(aa[0], 4, Vector((aa[1], aa[2], aa[3])))
-        cursor_rotation = rot_mat.to_euler('XYZ')
-    else:
-        # Euler modes
-        if cursor.rotation_mode != 'XYZ':
-             cursor_rotation = cursor.rotation_euler.to_matrix().to_euler('XYZ')
-        else:
-             cursor_rotation = cursor.rotation_euler.copy()
+    # Robustly capture rotation as XYZ Euler regardless of mode, with its
+    # matrix so the bounds calculations below don't rebuild it
+    from .utils import get_cursor_rotation
+    cursor_rotation, cursor_rot_mat = get_cursor_rotation(context)
     
     cursor_rotation_mode = context.scene.cursor.rotation_mode
     context.scene.cursor.rotation_mode = 'XYZ'
     
     # Get preferences for bounding box display
-    try:
-        prefs = get_preferences()
-        if prefs:
-            show_wire = prefs.bbox_show_wire
-            show_all_edges = prefs.bbox_show_all_edges
-        else:
-            show_wire = True
-            show_all_edges = True
-    except:
-        show_wire = True
-        show_all_edges = True
+    show_wire, show_all_edges = get_bbox_display_prefs()
     
     try:
         # Handle marked faces or points
         if marked_faces or marked_points:
-            from .utils import collect_vertices_from_marked_faces
-            
-            # Collect vertices from marked faces using shared utility
-            all_world_coords = collect_vertices_from_marked_faces(marked_faces, use_depsgraph=use_depsgraph, context=context)
+            from .utils import collect_marked_face_coords
             
-            if marked_points:
-                all_world_coords.extend(marked_points)
+            # Collect vertices from marked faces and marked points as one (N, 3) array
+            all_world_coords = collect_marked_face_coords(
+                marked_faces or {}, use_depsgraph=use_depsgraph, context=context,
+                extra_points=marked_points
+            )
             
-            if not all_world_coords:
+            if not len(all_world_coords):
                 print("Error: No vertices found in marked faces or points.")
                 return
             
             # Use optimized calculation
             local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
-                all_world_coords, cursor_location, cursor_rotation
+                all_world_coords, cursor_location, cursor_rotation, cursor_rot_mat=cursor_rot_mat
             )
             
             # Apply push value
-            epsilon = 0.0001
-            dimensions = Vector((
-                max(dimensions.x, epsilon),
-                max(dimensions.y, epsilon),
-                max(dimensions.z, epsilon)
-            ))
-            
-            safe_push_value = float(push_value)
-            if safe_push_value > 0 or abs(safe_push_value) * 2 < min(dimensions):
-                dimensions += Vector((2 * safe_push_value,) * 3)
-            
-            dimensions = Vector((
-                max(dimensions.x, epsilon),
-                max(dimensions.y, epsilon),
-                max(dimensions.z, epsilon)
-            ))
+            dimensions = apply_push_to_dimensions(dimensions, push_value)
             
             world_center = cursor_location + (cursor_rot_mat @ local_center)
             
             # Create bbox object
-            from .utils import preserve_selection_state, setup_new_object
-            
-            with preserve_selection_state(context) as state:
-                state.deselect_all()
-                
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=world_center,
-                    rotation=cursor_rotation
-                )
-                
-                bbox_obj = context.active_object
-                bbox_obj.name = context.scene.cursor_bbox_name_box if context.scene.cursor_bbox_name_box else "Cube"
-                
-                # Set up object (collection, styles)
-                setup_new_object(context, bbox_obj, assign_styles=True, move_to_collection=True)
-
-                bbox_obj.scale = dimensions
-                bbox_obj.show_wire = show_wire
-                bbox_obj.show_all_edges = show_all_edges
-                
-                bbox_obj.select_set(False)
+            _create_bbox_object(
+                context, world_center, cursor_rotation, dimensions,
+                True, show_wire, show_all_edges
+            )
         
         else:
             # Handle target object or selected objects
@@ -939,7 +963,6 @@ def cursor_aligned_bounding_box(push_value, target_obj=None, marked_faces=None,
             if obj and obj.type == "MESH":
                 original_mode = context.mode
                 original_active = context.view_layer.objects.active
-                original_selected = list(context.selected_objects)
                 
                 # Switch to target object if needed
                 if obj != original_active:
@@ -974,59 +997,21 @@ def cursor_aligned_bounding_box(push_value, target_obj=None, marked_faces=None,
 
                     # Use optimized calculation
                     local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
-                        world_coords, cursor_location, cursor_rotation
+                        world_coords, cursor_location, cursor_rotation, cursor_rot_mat=cursor_rot_mat
                     )
 
                     # Apply push value
-                    epsilon = 0.0001
-                    dimensions = Vector((
-                        max(dimensions.x, epsilon),
-                        max(dimensions.y, epsilon),
-                        max(dimensions.z, epsilon)
-                    ))
-
-                    safe_push_value = float(push_value)
-                    if safe_push_value > 0 or abs(safe_push_value) * 2 < min(dimensions):
-                        dimensions += Vector((2 * safe_push_value,) * 3)
-
-                    dimensions = Vector((
-                        max(dimensions.x, epsilon),
-                        max(dimensions.y, epsilon),
-                        max(dimensions.z, epsilon)
-                    ))
+                    dimensions = apply_push_to_dimensions(dimensions, push_value)
 
                     world_center = cursor_location + (cursor_rot_mat @ local_center)
 
-                    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
-                    bpy.ops.object.mode_set(mode='OBJECT')
-
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=world_center,
-                        rotation=cursor_rotation
+                    # The box is built from bpy.data, so edit mode on the
+                    # target stays untouched (no OBJECT/EDIT round trip)
+                    _create_bbox_object(
+                        context, world_center, cursor_rotation, dimensions,
+                        False, show_wire, show_all_edges
                     )
 
-                    bbox_obj = context.active_object
-                    bbox_obj.name = context.scene.cursor_bbox_name_box if context.scene.cursor_bbox_name_box else "Cube"
-
-                    # Set up object (collection, styles)
-                    from .utils import setup_new_object
-                    setup_new_object(context, bbox_obj, assign_styles=False, move_to_collection=True)
-                    
-                    bbox_obj.scale = dimensions
-                    bbox_obj.show_wire = show_wire
-                    bbox_obj.show_all_edges = show_all_edges
-
-                    bbox_obj.select_set(False)
-                    
-                    # Restore state
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    if original_mode == 'EDIT_MESH':
-                        bpy.ops.object.mode_set(mode='EDIT')
-
                 else:
                     # Object mode
                     if target_obj:
@@ -1048,67 +1033,20 @@ def cursor_aligned_bounding_box(push_value, target_obj=None, marked_faces=None,
 
                     # Use optimized calculation
                     local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
-                        all_world_coords, cursor_location, cursor_rotation
+                        all_world_coords, cursor_location, cursor_rotation, cursor_rot_mat=cursor_rot_mat
                     )
 
                     # Apply push value with safety checks
-                    epsilon = 0.000001
-                    dimensions = Vector((
-                        max(dimensions.x, epsilon),
-                        max(dimensions.y, epsilon),
-                        max(dimensions.z, epsilon)
-                    ))
-
-                    safe_push = float(push_value)
-                    current_min_dim = min(dimensions)
-
-                    if safe_push < 0 and abs(safe_push) * 2 >= current_min_dim:
-                        print(f"Warning: Negative push value ({safe_push:.4f} BU) too large, clamping.")
-                        safe_push = -(current_min_dim / 2.0) * 0.999
-
-                    dimensions += Vector((2 * safe_push,) * 3)
-                    dimensions = Vector((
-                        max(dimensions.x, epsilon),
-                        max(dimensions.y, epsilon),
-                        max(dimensions.z, epsilon)
-                    ))
+                    dimensions = apply_push_to_dimensions(
+                        dimensions, push_value, epsilon=0.000001, clamp_negative=True
+                    )
 
                     world_center = cursor_location + (cursor_rot_mat @ local_center)
 
-                    from .utils import preserve_selection_state, setup_new_object
-                    
-                    with preserve_selection_state(context) as state:
-                        state.deselect_all()
-                        
-                        bpy.ops.mesh.primitive_cube_add(
-                            size=1,
-                            enter_editmode=False,
-                            align='WORLD',
-                            location=world_center,
-                            rotation=cursor_rotation
-                        )
-
-                        bbox_obj = context.active_object
-                        bbox_obj.name = context.scene.cursor_bbox_name_box if context.scene.cursor_bbox_name_box else "Cube"
-
-                        # Set up object (collection, styles)
-                        setup_new_object(context, bbox_obj, assign_styles=True, move_to_collection=True)
-
-                        bbox_obj.scale = dimensions
-                        bbox_obj.show_wire = show_wire
-                        bbox_obj.show_all_edges = show_all_edges
-
-                        bbox_obj.select_set(False)
-                        
-                        # Restore selection for mesh objects
-                        for sel_obj in original_selected:
-                            if sel_obj.name in [o.name for o in mesh_objects]:
-                                sel_obj.select_set(True)
-
-                        if original_active and original_active in mesh_objects:
-                            context.view_layer.objects.active = original_active
-                        elif mesh_objects:
-                            context.view_layer.objects.active = mesh_objects[0]
+                    _create_bbox_object(
+                        context, world_center, cursor_rotation, dimensions,
+                        True, show_wire, show_all_edges
+                    )
 
     finally:
         context.scene.cursor.rotation_mode = cursor_rotation_mode
@@ -1268,11 +1206,13 @@ def disable_bbox_preview_wrapper():
 def enable_face_marking_wrapper():
     """Wrapper for enable_face_marking"""
     global _state
+    _state.mesh_array_cache.clear()
     enable_face_marking(_state)
 
 def disable_face_marking_wrapper():
     """Wrapper for disable_face_marking"""
     global _state
+    _state.mesh_array_cache.clear()
     disable_face_marking(_state)
 
 def ensure_handlers_enabled_wrapper():
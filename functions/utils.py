@@ -1,9 +1,18 @@
 import bpy
-import bmesh
-from mathutils import Vector, Matrix
+from mathutils import Vector, Matrix, Quaternion
+from mathutils.bvhtree import BVHTree
+from bpy.app.handlers import persistent
 from bpy_extras import view3d_utils
 import time
 from functools import lru_cache
+import numpy as np
+
+from .array_geometry import (
+    face_adjacency_csr,
+    coplanar_from_normals,
+    project_point_to_plane_intersection,
+    PointBuffer,
+)
 
 # ===== OPTIMIZED RAYCAST MANAGER =====
 
@@ -62,6 +71,151 @@ class RaycastCache:
 # Global raycast cache
 _raycast_cache = RaycastCache()
 
+class BVHCache:
+    """Object-space BVH trees of raycast targets, built once per mesh state.
+
+    Only active while an interactive operator runs (see enable_bvh_cache);
+    a depsgraph handler drops the tree of any object whose geometry is
+    re-evaluated in the meantime. The world matrix, its inverse and its 3x3
+    part are kept alongside and dropped when the object is transformed.
+    Object-space vertex positions and loop topology read with foreach_get
+    share the trees' lifetime, so hover and marking paths do not re-read
+    (or reallocate) the mesh arrays each event. ``generation`` is bumped on
+    every geometry or transform update, for callers keying their own caches.
+    """
+
+    def __init__(self):
+        self.trees = {}
+        self.matrices = {}
+        self.coords = {}
+        self.topology = {}
+        self.bounds = {}
+        self.active = False
+        self.generation = 0
+
+    def get_tree(self, obj, obj_eval, depsgraph):
+        """Return the BVH of obj's evaluated mesh, or None when inactive."""
+        if not self.active:
+            return None
+        mesh = obj_eval.data
+        signature = (mesh.as_pointer(), len(mesh.vertices), len(mesh.polygons))
+        cached = self.trees.get(obj.name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        tree = BVHTree.FromObject(obj, depsgraph)
+        self.trees[obj.name] = (signature, tree)
+        return tree
+
+    def get_matrices(self, obj):
+        """Return (matrix_world, inverse, 3x3 part, inverse 3x3 part) of obj."""
+        cached = self.matrices.get(obj.name)
+        if cached is None:
+            matrix = obj.matrix_world.copy()
+            matrix_inv = matrix.inverted_safe()
+            cached = (matrix, matrix_inv, matrix.to_3x3(), matrix_inv.to_3x3())
+            if self.active:
+                self.matrices[obj.name] = cached
+        return cached
+
+    def get_world_bounds(self, obj):
+        """Return obj's world-space AABB as (min, max) coordinate tuples."""
+        cached = self.bounds.get(obj.name)
+        if cached is None:
+            matrix = self.get_matrices(obj)[0]
+            corners = [matrix @ Vector(corner) for corner in obj.bound_box]
+            cached = (tuple(min(c[i] for c in corners) for i in range(3)),
+                      tuple(max(c[i] for c in corners) for i in range(3)))
+            if self.active:
+                self.bounds[obj.name] = cached
+        return cached
+
+    def get_coords(self, obj, mesh):
+        """Return mesh's object-space vertex positions as a read-only (V, 3) float64 array."""
+        signature = (mesh.as_pointer(), len(mesh.vertices))
+        cached = self.coords.get(obj.name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3).astype(np.float64)
+        co.flags.writeable = False
+        if self.active:
+            self.coords[obj.name] = (signature, co)
+        return co
+
+    def get_loop_topology(self, obj, mesh):
+        """Return mesh's per-polygon loop_total and per-loop vertex_index int32 arrays (read-only)."""
+        signature = (mesh.as_pointer(), len(mesh.polygons), len(mesh.loops))
+        cached = self.topology.get(obj.name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        loop_total.flags.writeable = False
+        loop_verts.flags.writeable = False
+        if self.active:
+            self.topology[obj.name] = (signature, (loop_total, loop_verts))
+        return loop_total, loop_verts
+
+    def discard(self, name):
+        self.trees.pop(name, None)
+        self.coords.pop(name, None)
+        self.topology.pop(name, None)
+        self.bounds.pop(name, None)
+
+    def discard_matrices(self, name):
+        self.matrices.pop(name, None)
+        self.bounds.pop(name, None)
+
+    def clear(self):
+        self.trees.clear()
+        self.matrices.clear()
+        self.coords.clear()
+        self.topology.clear()
+        self.bounds.clear()
+
+# Global BVH cache
+_bvh_cache = BVHCache()
+
+@persistent
+def _bvh_cache_depsgraph_update(scene, depsgraph):
+    """Forget trees (and coplanar adjacency) of objects whose geometry changed."""
+    for update in depsgraph.updates:
+        if update.is_updated_transform and isinstance(update.id, bpy.types.Object):
+            _bvh_cache.discard_matrices(update.id.original.name)
+            _bvh_cache.generation += 1
+        if not update.is_updated_geometry:
+            continue
+        _bvh_cache.generation += 1
+        # Moved vertices keep the mesh key of the coplanar cache but change
+        # its normals, so it cannot tell on its own
+        _coplanar_cache.clear()
+        if isinstance(update.id, bpy.types.Object):
+            _bvh_cache.discard(update.id.original.name)
+        elif isinstance(update.id, bpy.types.Mesh):
+            # Mesh data may be shared; drop everything rather than track users
+            _bvh_cache.clear()
+
+def enable_bvh_cache():
+    """Start caching raycast BVH trees (call when a modal starts)."""
+    _bvh_cache.clear()
+    _bvh_cache.active = True
+    if _bvh_cache_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_bvh_cache_depsgraph_update)
+
+def disable_bvh_cache():
+    """Stop caching and release the trees (call when a modal exits)."""
+    _bvh_cache.active = False
+    _bvh_cache.clear()
+    if _bvh_cache_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_bvh_cache_depsgraph_update)
+
+def get_geometry_generation():
+    """Counter bumped whenever an object's geometry or transform is re-evaluated."""
+    return _bvh_cache.generation
+
 # ===== OPTIMIZED OBJECT FILTERING =====
 
 @lru_cache(maxsize=32)
@@ -130,25 +284,32 @@ def get_face_edges_from_raycast_optimized(context, event, use_depsgraph=False):
             continue
         
         # Transform ray to object space
-        matrix_inv = obj.matrix_world.inverted()
+        matrix_world, matrix_inv, matrix_3x3, matrix_inv_3x3 = _bvh_cache.get_matrices(obj)
         ray_origin_local = matrix_inv @ ray_origin
-        ray_direction_local = matrix_inv.to_3x3() @ view_vector
+        ray_direction_local = matrix_inv_3x3 @ view_vector
         
-        # Perform raycast
-        hit, location_local, normal_local, face_index = obj_eval.ray_cast(
-            ray_origin_local, ray_direction_local
-        )
+        # Perform raycast, through the cached BVH while a modal keeps one
+        tree = _bvh_cache.get_tree(obj, obj_eval, depsgraph)
+        if tree is not None:
+            location_local, normal_local, face_index, _ = tree.ray_cast(
+                ray_origin_local, ray_direction_local
+            )
+            hit = location_local is not None
+        else:
+            hit, location_local, normal_local, face_index = obj_eval.ray_cast(
+                ray_origin_local, ray_direction_local
+            )
         
         if hit:
             # Transform back to world space
-            location_world = obj.matrix_world @ location_local
+            location_world = matrix_world @ location_local
             distance = (location_world - ray_origin).length
             
             # Early termination for very close hits
             if distance < closest_distance:
                 closest_distance = distance
-                normal_world = (obj.matrix_world.to_3x3() @ normal_local).normalized()
-                closest_result = (True, location_world, normal_world, face_index, obj, obj.matrix_world)
+                normal_world = (matrix_3x3 @ normal_local).normalized()
+                closest_result = (True, location_world, normal_world, face_index, obj, matrix_world)
                 
                 # Early exit for very close hits
                 if distance < 0.001:
@@ -166,32 +327,33 @@ def get_face_edges_from_raycast_optimized(context, event, use_depsgraph=False):
     return result
 
 def _point_in_object_bounds(ray_origin, ray_direction, obj, margin=0.1):
-    """Quick bounds check to see if ray might hit object"""
+    """Quick bounds check to see if ray might hit object
+
+    Slab test of the ray against the object's world AABB (expanded by
+    margin), which the BVH cache keeps until the object is transformed.
+    Objects the ray misses skip their BVH raycast entirely.
+    """
     try:
-        # Get object bounding box
-        bbox = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        
-        # Simple bounds check - expand by margin
-        min_bound = Vector((min(v.x for v in bbox), min(v.y for v in bbox), min(v.z for v in bbox)))
-        max_bound = Vector((max(v.x for v in bbox), max(v.y for v in bbox), max(v.z for v in bbox)))
-        
-        min_bound -= Vector((margin, margin, margin))
-        max_bound += Vector((margin, margin, margin))
+        min_bound, max_bound = _bvh_cache.get_world_bounds(obj)
         
-        # Check if ray intersects expanded bounding box
-        # Simple ray-box intersection test
+        t_near = float('-inf')
+        t_far = float('inf')
         for i in range(3):
+            lo = min_bound[i] - margin
+            hi = max_bound[i] + margin
             if abs(ray_direction[i]) < 0.0001:
-                if ray_origin[i] < min_bound[i] or ray_origin[i] > max_bound[i]:
+                if ray_origin[i] < lo or ray_origin[i] > hi:
                     return False
             else:
-                t1 = (min_bound[i] - ray_origin[i]) / ray_direction[i]
-                t2 = (max_bound[i] - ray_origin[i]) / ray_direction[i]
+                t1 = (lo - ray_origin[i]) / ray_direction[i]
+                t2 = (hi - ray_origin[i]) / ray_direction[i]
                 
                 if t1 > t2:
                     t1, t2 = t2, t1
                 
-                if t2 < 0:
+                t_near = max(t_near, t1)
+                t_far = min(t_far, t2)
+                if t_near > t_far or t_far < 0:
                     return False
         
         return True
@@ -253,12 +415,18 @@ def _process_raycast_result(hit, location, normal, face_index, obj, matrix, use_
 
 # ===== OPTIMIZED CURSOR PLACEMENT =====
 
-def place_cursor_with_raycast_and_edge_optimized(context, event, align_to_face=True, edge_index=0, preview=True, use_depsgraph=False):
-    """Optimized cursor placement with caching"""
+def place_cursor_with_raycast_and_edge_optimized(context, event, align_to_face=True, edge_index=0, preview=True, use_depsgraph=False,
+                                                face_data=None):
+    """Optimized cursor placement with caching
+
+    Pass face_data when the caller already raycast this event to place the
+    cursor from that hit instead of casting again.
+    """
     from .core import update_edge_highlight, update_bbox_preview
     from ..settings.preferences import get_preferences
     
-    face_data = get_face_edges_from_raycast_optimized(context, event, use_depsgraph=use_depsgraph)
+    if face_data is None:
+        face_data = get_face_edges_from_raycast_optimized(context, event, use_depsgraph=use_depsgraph)
     
     if not face_data:
         return {
@@ -353,6 +521,38 @@ def _closest_point_on_edge_screen(region, region_3d, edge_start, edge_end, mouse
     world_pt = edge_start + t * (edge_end - edge_start)
     return world_pt, dist_sq
 
+# (points list, (N, 3) array) for the last intersection list projected; the
+# operators hand the same cached list in on every hover tick.
+_projected_points_source = (None, None)
+
+def _nearest_point_on_screen(region, region_3d, points, mouse_x, mouse_y):
+    """
+    Project all points through the view matrix at once and find the one closest to the mouse.
+    Matches view3d_utils.location_3d_to_region_2d (points behind the view are skipped).
+    Returns (index, screen_distance_sq) or (None, float('inf')) if nothing projects.
+    """
+    global _projected_points_source
+    src, coords = _projected_points_source
+    if src is not points:
+        coords = np.array([tuple(p) for p in points], dtype=np.float64).reshape(-1, 3)
+        _projected_points_source = (points, coords)
+
+    persp = np.array(region_3d.perspective_matrix, dtype=np.float64)
+    prj = coords @ persp[:, :3].T + persp[:, 3]
+    w = prj[:, 3]
+    visible = np.flatnonzero(w > 0.0)
+    if visible.size == 0:
+        return None, float('inf')
+
+    half_w = region.width / 2.0
+    half_h = region.height / 2.0
+    w = w[visible]
+    dx = half_w + half_w * (prj[visible, 0] / w) - mouse_x
+    dy = half_h + half_h * (prj[visible, 1] / w) - mouse_y
+    dist_sq = dx * dx + dy * dy
+    best = int(np.argmin(dist_sq))
+    return int(visible[best]), float(dist_sq[best])
+
 @lru_cache(maxsize=16)
 def get_snap_elements_cached(obj_name, face_index, use_depsgraph=False):
     """Cache snap elements for a specific face"""
@@ -428,14 +628,13 @@ def snap_cursor_to_closest_element_optimized(context, event, face_data=None, thr
     
     # Check intersection points if provided (always available as snap targets when limitation plane is on)
     if intersection_points:
-        for p in intersection_points:
-            screen_pos = view3d_utils.location_3d_to_region_2d(region, region_3d, p)
-            if screen_pos:
-                screen_distance = ((screen_pos[0] - mouse_x) ** 2 + (screen_pos[1] - mouse_y) ** 2) ** 0.5
-                if screen_distance < closest_distance:
-                    closest_distance = screen_distance
-                    closest_point = p
-                    closest_type = 'intersection'
+        index, dist_sq = _nearest_point_on_screen(
+            region, region_3d, intersection_points, mouse_x, mouse_y
+        )
+        if index is not None:
+            closest_distance = dist_sq ** 0.5
+            closest_point = intersection_points[index]
+            closest_type = 'intersection'
 
     if face_data:
         # Use cached snap elements for vertices and face; for edges use closest point along edge
@@ -572,6 +771,8 @@ def clear_all_caches():
     """Clear all performance caches"""
     global _raycast_cache
     _raycast_cache.clear()
+    _coplanar_cache.clear()
+    _bvh_cache.clear()
     
     # Clear function caches
     get_visible_mesh_objects.cache_clear()
@@ -595,9 +796,10 @@ def select_edge_by_scroll(face_data, scroll_direction, current_edge_index):
     """Legacy function name - redirects to optimized version"""
     return select_edge_by_scroll_optimized(face_data, scroll_direction, current_edge_index)
 
-def place_cursor_with_raycast_and_edge(context, event, align_to_face=True, edge_index=0, preview=True, use_depsgraph=False):
+def place_cursor_with_raycast_and_edge(context, event, align_to_face=True, edge_index=0, preview=True, use_depsgraph=False, face_data=None):
     """Legacy function name - redirects to optimized version"""
-    return place_cursor_with_raycast_and_edge_optimized(context, event, align_to_face, edge_index, preview, use_depsgraph=use_depsgraph)
+    return place_cursor_with_raycast_and_edge_optimized(context, event, align_to_face, edge_index, preview,
+                                                        use_depsgraph=use_depsgraph, face_data=face_data)
 
 def snap_cursor_to_closest_element(context, event, face_data=None, threshold=120, intersection_points=None, use_depsgraph=False, snap_mode=0):
     """Legacy function name - redirects to optimized version"""
@@ -884,59 +1086,6 @@ def get_profiling_stats():
     """Get current profiling statistics"""
     return _profiler.get_stats()
 
-# ===== GEOMETRY UTILS =====
-
-def project_point_to_plane_intersection(hit_location, face_normal, plane_origin, plane_normal):
-    """
-    Project a point (hit_location on Face Plane) onto the line of intersection 
-    between Face Plane and Cursor Plane (plane_origin, plane_normal).
-    
-    Returns:
-        Vector: The projected point on the intersection line, or None if planes are parallel.
-    """
-    # Plane 1: Face Plane (P - hit_location) . face_normal = 0
-    # Plane 2: Cursor Plane (P - plane_origin) . plane_normal = 0
-    
-    # Direction of intersection line L
-    line_dir = face_normal.cross(plane_normal)
-    
-    # If cross product is near zero, planes are parallel
-    if line_dir.length_squared < 1e-6:
-        return None
-        
-    line_dir.normalize()
-    
-    # finding a point on the line (intersection of planes)
-    # We have a system of linear equations for P(x,y,z):
-    # N1 . P = d1  => face_normal . P = face_normal . hit_location
-    # N2 . P = d2  => plane_normal . P = plane_normal . plane_origin
-    
-    # Let's find a point P0 on this line.
-    # We can solve this using cross products or general linear system solver.
-    # A robust way:
-    # L = N1 x N2
-    # P0 = (d1 * (N2 x L) + d2 * (L x N1)) / |L|^2
-    # from http://geomalgorithms.com/a05-_intersect-1.html
-    
-    d1 = face_normal.dot(hit_location)
-    d2 = plane_normal.dot(plane_origin)
-    L_sq = line_dir.length_squared # Already normalized so 1.0, but for safety
-    if L_sq < 1e-6: return None
-    
-    n2_cross_l = plane_normal.cross(line_dir)
-    l_cross_n1 = line_dir.cross(face_normal)
-    
-    p0 = (d1 * n2_cross_l + d2 * l_cross_n1) / line_dir.length_squared
-    
-    # Now we have the line: P(t) = P0 + t * line_dir
-    # We want to project hit_location onto this line.
-    # P_proj = P0 + dot(hit_location - P0, line_dir) * line_dir
-    
-    t = (hit_location - p0).dot(line_dir)
-    p_proj = p0 + t * line_dir
-    
-    return p_proj
-
 def clear_profiling_data():
     """Clear all profiling data"""
     _profiler.clear()
@@ -1218,6 +1367,64 @@ def force_enable_point_drawing():
 
 # ===== COPLANAR SELECTION UTILITIES =====
 
+class CoplanarCache:
+    """Per-mesh face adjacency and normals, plus memoized coplanar groups.
+
+    Coplanar selection runs on every hover and click. Building a BMesh for
+    each query dominated it, yet the topology only changes when the mesh is
+    edited, which cannot happen while a modal operator is running. The
+    operators clear this cache on invoke; within a session adjacency is
+    read once per mesh and repeated queries for the same face and angle are
+    a dict hit.
+    """
+
+    def __init__(self, max_meshes=16, max_groups=512):
+        self.meshes = {}
+        self.max_meshes = max_meshes
+        self.max_groups = max_groups
+
+    def get_entry(self, obj, mesh, use_depsgraph):
+        key = (obj.name, mesh.as_pointer(), use_depsgraph,
+               len(mesh.polygons), len(mesh.edges))
+        entry = self.meshes.get(key)
+        if entry is None:
+            if len(self.meshes) >= self.max_meshes:
+                self.meshes.pop(next(iter(self.meshes)))
+            entry = self._build_entry(mesh)
+            self.meshes[key] = entry
+        return entry
+
+    @staticmethod
+    def _build_entry(mesh):
+        face_count = len(mesh.polygons)
+        loop_total = np.empty(face_count, dtype=np.int32)
+        normals = np.empty(face_count * 3, dtype=np.float32)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        mesh.polygons.foreach_get("normal", normals)
+        loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+
+        normals = normals.reshape(-1, 3)
+        return {
+            'adjacency': face_adjacency_csr(face_count, loop_total, loop_edges, len(mesh.edges)),
+            'normals': normals,
+            'degenerate': np.einsum('ij,ij->i', normals, normals) < 1e-12,
+            'groups': {},
+        }
+
+    def clear(self):
+        """Drop all cached meshes and groups"""
+        self.meshes.clear()
+
+
+_coplanar_cache = CoplanarCache()
+
+
+def clear_coplanar_cache():
+    """Forget cached adjacency; call when meshes may have been edited."""
+    _coplanar_cache.clear()
+
+
 def get_connected_coplanar_faces(obj, start_face_index, angle_tolerance_radians, use_depsgraph=False):
     """Find connected faces that are coplanar within tolerance"""
     if obj.type != 'MESH':
@@ -1236,45 +1443,20 @@ def get_connected_coplanar_faces(obj, start_face_index, angle_tolerance_radians,
     if start_face_index >= len(mesh.polygons):
         return set()
 
-    # Create BVH/BMesh for connectivity
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.faces.ensure_lookup_table()
-    
-    if start_face_index >= len(bm.faces):
-        bm.free()
-        return set()
-        
-    start_face = bm.faces[start_face_index]
-    start_normal = start_face.normal.copy()
-    
-    visited = set()
-    coplanar_indices = set()
-    queue = [start_face]
-    
-    visited.add(start_face)
-    coplanar_indices.add(start_face.index)
-    
-    while queue:
-        current_face = queue.pop(0)
-        
-        for edge in current_face.edges:
-            for neighbor in edge.link_faces:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    
-                    # Check angle - compare to start face to maintain planarity stability
-                    # 100.0 is default safe return for parallel check, though angle() handles robustly
-                    try:
-                        angle = start_normal.angle(neighbor.normal)
-                    except ValueError:
-                        angle = 0.0 # Exactly parallel or zero length normal
-                    
-                    if angle < angle_tolerance_radians:
-                        coplanar_indices.add(neighbor.index)
-                        queue.append(neighbor)
-    
-    bm.free()
+    entry = _coplanar_cache.get_entry(obj, mesh, use_depsgraph)
+    groups = entry['groups']
+    group_key = (start_face_index, round(angle_tolerance_radians, 6))
+    cached = groups.get(group_key)
+    if cached is not None:
+        return cached
+
+    coplanar_indices = frozenset(coplanar_from_normals(
+        entry['normals'], entry['adjacency'], start_face_index,
+        np.cos(angle_tolerance_radians), degenerate=entry['degenerate'],
+    ).tolist())
+    if len(groups) >= _coplanar_cache.max_groups:
+        groups.clear()
+    groups[group_key] = coplanar_indices
     return coplanar_indices
 
 def ensure_cbb_collection(context):
@@ -1351,34 +1533,49 @@ def calculate_plane_edge_intersections(obj, plane_origin, plane_normal, use_deps
     else:
         mesh = obj.data
     
-    matrix = obj.matrix_world
-    
-    # Plane equation: (P - P0) . N = 0  => P . N = P0 . N = d
-    d = plane_origin.dot(plane_normal)
-    
-    intersections = []
-    
-    for edge in mesh.edges:
-        v1_local = mesh.vertices[edge.vertices[0]].co
-        v2_local = mesh.vertices[edge.vertices[1]].co
-        
-        v1_world = matrix @ v1_local
-        v2_world = matrix @ v2_local
-        
-        # Check intersection
-        # t = (d - v1.N) / ((v2 - v1).N)
-        
-        vec = v2_world - v1_world
-        denom = vec.dot(plane_normal)
-        
-        if abs(denom) > 1e-6: # Not parallel
-            val1 = v1_world.dot(plane_normal)
-            t = (d - val1) / denom
-            if 0.0 <= t <= 1.0: # segment intersection
-                p = v1_world + vec * t
-                intersections.append(p)
-                
-    return intersections
+    edge_count = len(mesh.edges)
+    if edge_count == 0:
+        return []
+
+    co = _bvh_cache.get_coords(obj, mesh)
+
+    # Plane equation: (P - P0) . N = 0  => signed distance d(P) = P . N - P0 . N.
+    # With P = M @ p + T this is p . (M^T N) + (T - P0) . N, so distances are
+    # taken on the local coordinates and only the hit points get transformed.
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    normal = np.array(plane_normal, dtype=np.float64)
+    local_normal = matrix[:3, :3].T @ normal
+    offset = np.dot(matrix[:3, 3] - np.array(plane_origin, dtype=np.float64), normal)
+
+    # Bounding box first: a mesh entirely on one side of the plane has no
+    # crossing edges, so skip reading its edges at all
+    lo = co.min(axis=0)
+    hi = co.max(axis=0)
+    positive = local_normal > 0.0
+    if (np.where(positive, lo, hi) @ local_normal + offset > 0.0
+            or np.where(positive, hi, lo) @ local_normal + offset < 0.0):
+        return []
+
+    dist = co @ local_normal + offset
+    edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+
+    # Segment v1 -> v2 crosses at t = d1 / (d1 - d2); skip near-parallel edges
+    d1 = dist[edge_verts[:, 0]]
+    d2 = dist[edge_verts[:, 1]]
+    denom = d1 - d2
+    valid = np.abs(denom) > 1e-6
+    t = np.zeros_like(d1)
+    t[valid] = d1[valid] / denom[valid]
+    hit = valid & (t >= 0.0) & (t <= 1.0)
+    if not hit.any():
+        return []
+
+    v1 = co[edge_verts[hit, 0]]
+    v2 = co[edge_verts[hit, 1]]
+    points = (v1 + (v2 - v1) * t[hit, None]) @ matrix[:3, :3].T + matrix[:3, 3]
+    return [Vector(p) for p in points]
 
 
 def best_fit_plane_from_points(points):
@@ -1439,7 +1636,10 @@ def matrix_from_plane(origin, normal):
 
 
 def calculate_plane_edge_intersections_multi(objects, plane_origin, plane_normal, use_depsgraph=False):
-    """Intersections of a plane with edges of multiple mesh objects. Returns combined list of world-space points."""
+    """Intersections of a plane with edges of multiple mesh objects. Returns combined list of world-space points.
+
+    objects may be any iterable, e.g. the keys view of a marked-faces dict.
+    """
     result = []
     for obj in objects:
         if obj and obj.type == 'MESH':
@@ -1452,6 +1652,9 @@ def calculate_plane_edge_intersections_multi(objects, plane_origin, plane_normal
 # Principal plane names for cursor alignment (cycle with R in point mode)
 CURSOR_PLANE_ALIGNMENTS = ('XY', 'YZ', 'XZ')
 
+# Display names for the point-mode snap_mode index (0 = all element types)
+SNAP_MODE_NAMES = ('All', 'Vert', 'Edge', 'Face')
+
 def get_principal_plane_rotation_matrix(plane):
     """
     Return a 3x3 rotation matrix that aligns the cursor to a principal plane.
@@ -1506,6 +1709,47 @@ def get_cursor_rotation_euler(context):
         else:
             return cursor.rotation_euler
 
+def get_cursor_rotation(context):
+    """
+    Extract cursor rotation as both Euler XYZ and a 3x3 rotation matrix.
+
+    Branches on the rotation mode once and derives the second form from the
+    first, so callers that need both avoid a to_matrix()/to_euler() round-trip.
+
+    Args:
+        context: Blender context
+
+    Returns:
+        tuple: (mathutils.Euler XYZ, mathutils.Matrix 3x3)
+    """
+    cursor = context.scene.cursor
+
+    if cursor.rotation_mode == 'XYZ':
+        euler = cursor.rotation_euler.copy()
+        return euler, euler.to_matrix()
+    if cursor.rotation_mode == 'QUATERNION':
+        rot_mat = cursor.rotation_quaternion.to_matrix()
+    elif cursor.rotation_mode == 'AXIS_ANGLE':
+        # Through a quaternion: cheaper than Matrix.Rotation's general build
+        aa = cursor.rotation_axis_angle
+        rot_mat = Quaternion((aa[1], aa[2], aa[3]), aa[0]).to_matrix()
+    else:
+        rot_mat = cursor.rotation_euler.to_matrix()
+    return rot_mat.to_euler('XYZ'), rot_mat
+
+def cursor_rotation_signature(cursor):
+    """Hashable snapshot of the cursor's active rotation channel.
+
+    Cheap to compare between modal events, so operators can keep a derived
+    rotation until the cursor actually turns.
+    """
+    mode = cursor.rotation_mode
+    if mode == 'QUATERNION':
+        return (mode, tuple(cursor.rotation_quaternion))
+    if mode == 'AXIS_ANGLE':
+        return (mode, tuple(cursor.rotation_axis_angle))
+    return (mode, tuple(cursor.rotation_euler))
+
 def get_selected_faces_from_edit_mode(context):
     """
     Get selected faces from objects in edit mode.
@@ -1680,27 +1924,37 @@ def compute_thickness_selection_to_cursor(marked_faces_dict, cursor_location, us
     if not marked_faces_dict:
         return 0.0
     
-    sum_center = Vector((0, 0, 0))
-    sum_normal = Vector((0, 0, 0))
+    sum_center = np.zeros(3)
+    sum_normal = np.zeros(3)
     n = 0
     for obj, face_indices in marked_faces_dict.items():
         if not face_indices or obj.type != 'MESH':
             continue
         mesh, obj_matrix_world = get_evaluated_mesh(obj, use_depsgraph=use_depsgraph, context=context)
-        mat_3x3 = obj_matrix_world.to_3x3()
-        for face_idx in face_indices:
-            if face_idx >= len(mesh.polygons):
-                continue
-            face = mesh.polygons[face_idx]
-            world_center = obj_matrix_world @ face.center
-            world_normal = (mat_3x3 @ face.normal).normalized()
-            sum_center += world_center
-            sum_normal += world_normal
-            n += 1
+        # Normals come from the coplanar cache entry (read with foreach_get);
+        # centers are read the same way on first use and kept beside them.
+        entry = _coplanar_cache.get_entry(obj, mesh, use_depsgraph)
+        centers = entry.get('centers')
+        if centers is None:
+            centers = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+            mesh.polygons.foreach_get("center", centers)
+            centers = entry['centers'] = centers.reshape(-1, 3)
+        faces = np.fromiter(face_indices, dtype=np.int64, count=len(face_indices))
+        faces = faces[(faces >= 0) & (faces < len(centers))]
+        if not len(faces):
+            continue
+        mat = np.array(obj_matrix_world, dtype=np.float64)
+        world_normals = entry['normals'][faces] @ mat[:3, :3].T
+        lengths = np.linalg.norm(world_normals, axis=1, keepdims=True)
+        world_normals = np.divide(world_normals, lengths, out=np.zeros_like(world_normals),
+                                  where=lengths > 0)
+        sum_center += (centers[faces] @ mat[:3, :3].T + mat[:3, 3]).sum(axis=0)
+        sum_normal += world_normals.sum(axis=0)
+        n += len(faces)
     if n == 0:
         return 0.0
-    avg_center = sum_center / n
-    avg_normal = sum_normal / n
+    avg_center = Vector(sum_center / n)
+    avg_normal = Vector(sum_normal / n)
     if avg_normal.length_squared < 1e-10:
         return 0.0
     avg_normal.normalize()
@@ -1744,11 +1998,35 @@ def collect_vertices_from_marked_faces(marked_faces_dict, use_depsgraph=False, c
     use_push = abs(push_value) > 1e-6
 
     for obj, face_indices in marked_faces_dict.items():
-        if not face_indices or obj.type != 'MESH':
+        if len(face_indices) == 0 or obj.type != 'MESH':
             continue
 
         mesh, obj_matrix_world = get_evaluated_mesh(obj, use_depsgraph=use_depsgraph, context=context)
-        mat_3x3 = obj_matrix_world.to_3x3()
+        poly_count = len(mesh.polygons)
+        faces = np.fromiter(face_indices, dtype=np.int32, count=len(face_indices))
+        faces = faces[(faces >= 0) & (faces < poly_count)]
+        if faces.size == 0:
+            continue
+
+        # Read the mesh with foreach_get and work on the loops of the marked
+        # faces: each loop is one (face, vertex) pair, in face order.
+        co = _bvh_cache.get_coords(obj, mesh)
+        loop_total, loop_verts = _bvh_cache.get_loop_topology(obj, mesh)
+
+        face_mask = np.zeros(poly_count, dtype=bool)
+        face_mask[faces] = True
+        loop_mask = np.repeat(face_mask, loop_total)
+        sel_verts = loop_verts[loop_mask]
+        sel_faces = np.repeat(np.arange(poly_count, dtype=np.int32), loop_total)[loop_mask]
+
+        mat = np.array(obj_matrix_world, dtype=np.float64)
+        rot = mat[:3, :3]
+        world_co = co[sel_verts] @ rot.T + mat[:3, 3]
+
+        if use_push or use_thickness:
+            normals = np.empty(poly_count * 3, dtype=np.float32)
+            mesh.polygons.foreach_get("normal", normals)
+            face_normals = _normalized_rows(normals.reshape(-1, 3)[sel_faces] @ rot.T)
 
         if use_push:
             # Virtual inflate/deflate. Accumulate a per-vertex normal across the
@@ -1757,48 +2035,209 @@ def collect_vertices_from_marked_faces(marked_faces_dict, use_depsgraph=False, c
             # producing a stepped hull that dissolve_limit later turns into
             # non-planar n-gons (flagged by the convexity check). A coherent
             # per-vertex offset keeps dissolve's merged faces near-planar.
-            vert_normals = {}
-            vert_world = {}
-            for face_idx in face_indices:
-                if face_idx >= len(mesh.polygons):
-                    continue
-                face = mesh.polygons[face_idx]
-                face_normal = (mat_3x3 @ face.normal).normalized()
-                for vert_idx in face.vertices:
-                    if vert_idx not in vert_world:
-                        vert_world[vert_idx] = obj_matrix_world @ mesh.vertices[vert_idx].co
-                        vert_normals[vert_idx] = Vector((0.0, 0.0, 0.0))
-                    vert_normals[vert_idx] += face_normal
-            for vert_idx, normal_sum in vert_normals.items():
-                normal = normal_sum.normalized() if normal_sum.length_squared > 0 else Vector((0.0, 0.0, 0.0))
-                all_vertices.append(vert_world[vert_idx] + normal * push_value)
+            unique_verts, first, inverse = np.unique(sel_verts, return_index=True, return_inverse=True)
+            vert_normals = np.zeros((len(unique_verts), 3))
+            np.add.at(vert_normals, inverse, face_normals)
+            base = world_co[first] + _normalized_rows(vert_normals) * push_value
         else:
             # Base verts, collected per face (duplicate shared verts are
             # identical, so they collapse harmlessly in the hull).
-            for face_idx in face_indices:
-                if face_idx >= len(mesh.polygons):
-                    continue
-                face = mesh.polygons[face_idx]
-                all_vertices.extend(
-                    obj_matrix_world @ mesh.vertices[vert_idx].co for vert_idx in face.vertices
-                )
+            base = world_co
+        all_vertices.extend(map(Vector, base.tolist()))
 
         if use_thickness:
             # Shell layer (extrusion-like), offset per face relative to the
             # (possibly pushed) base so the hull wraps both layers.
             shell_offset = push_value + face_thickness
-            for face_idx in face_indices:
-                if face_idx >= len(mesh.polygons):
-                    continue
-                face = mesh.polygons[face_idx]
-                face_normal = (mat_3x3 @ face.normal).normalized()
-                for vert_idx in face.vertices:
-                    world_co = obj_matrix_world @ mesh.vertices[vert_idx].co
-                    all_vertices.append(world_co + face_normal * shell_offset)
+            shell = world_co + face_normals * shell_offset
+            all_vertices.extend(map(Vector, shell.tolist()))
 
     return all_vertices
 
 
+def _normalized_rows(vectors):
+    """Unit-length copies of the rows of an (N, 3) array; zero rows stay zero."""
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors, dtype=np.float64),
+                     where=lengths > 0)
+
+
+def collect_marked_face_coords(marked_faces_dict, use_depsgraph=False, context=None, extra_points=None):
+    """
+    Collect world-space vertex positions of marked faces as one NumPy array.
+
+    Array counterpart of collect_vertices_from_marked_faces (without the
+    push/thickness offsets) for callers that only need the raw point cloud,
+    such as the bounding box fit. Mesh data is read with foreach_get and
+    transformed with a single matmul per object instead of per-vertex
+    Vector math.
+
+    Args:
+        marked_faces_dict: Dictionary mapping objects to face indices, either
+            sets or integer arrays (see marked_faces_to_arrays)
+        use_depsgraph: Whether to use depsgraph evaluation
+        context: Blender context (optional, uses bpy.context if not provided)
+        extra_points: Optional world-space points (e.g. marked points) joined
+            into the same concatenation as the face vertices
+
+    Returns:
+        numpy.ndarray: (N, 3) float64 array of world-space vertex positions
+    """
+    if context is None:
+        context = bpy.context
+
+    chunks = []
+    for obj, face_indices in marked_faces_dict.items():
+        if len(face_indices) == 0 or obj.type != 'MESH':
+            continue
+
+        mesh, obj_matrix_world = get_evaluated_mesh(obj, use_depsgraph=use_depsgraph, context=context)
+        poly_count = len(mesh.polygons)
+        if poly_count == 0:
+            continue
+
+        if isinstance(face_indices, np.ndarray):
+            faces = face_indices
+        else:
+            faces = np.fromiter(face_indices, dtype=np.int32, count=len(face_indices))
+        faces = faces[(faces >= 0) & (faces < poly_count)]
+        if faces.size == 0:
+            continue
+
+        co = _bvh_cache.get_coords(obj, mesh)
+        loop_total, loop_verts = _bvh_cache.get_loop_topology(obj, mesh)
+
+        # Polygons own contiguous loop ranges in order, so expanding the face
+        # mask by loop_total yields the mask of their loops.
+        face_mask = np.zeros(poly_count, dtype=bool)
+        face_mask[faces] = True
+        vert_idx = np.unique(loop_verts[np.repeat(face_mask, loop_total)])
+
+        mat = np.array(obj_matrix_world, dtype=np.float64)
+        chunks.append(co[vert_idx] @ mat[:3, :3].T + mat[:3, 3])
+
+    if extra_points is not None and len(extra_points):
+        chunks.append(np.asarray(extra_points, dtype=np.float64).reshape(-1, 3))
+
+    if not chunks:
+        return np.empty((0, 3), dtype=np.float64)
+    return np.concatenate(chunks)
+
+
+def marked_faces_to_arrays(marked_faces_dict):
+    """Convert {obj: set(face indices)} to {obj: sorted int32 array}.
+
+    The arrays feed the vectorized collectors directly; operators keep the
+    result while their marks are unchanged instead of re-converting the
+    sets on every preview update.
+    """
+    arrays = {}
+    for obj, face_indices in marked_faces_dict.items():
+        if face_indices:
+            arr = np.fromiter(face_indices, dtype=np.int32, count=len(face_indices))
+            arr.sort()
+            arrays[obj] = arr
+    return arrays
+
+
+class MarkedFacesSoA:
+    """Snapshot of an operator's marked faces as contiguous arrays.
+
+    objects[i] owns face_indices[offsets[i]:offsets[i + 1]] (sorted int32).
+    Operators build one after the marks change and drop it on the next
+    change; the world-space vertices of the faces are gathered on first
+    use and kept while the extra points and depsgraph flag stay the same.
+    """
+
+    def __init__(self, marked_faces_dict):
+        arrays = marked_faces_to_arrays(marked_faces_dict)
+        self.objects = list(arrays)
+        sizes = [len(faces) for faces in arrays.values()]
+        self.offsets = np.zeros(len(sizes) + 1, dtype=np.int32)
+        self.offsets[1:] = np.cumsum(sizes)
+        if arrays:
+            self.face_indices = np.concatenate(list(arrays.values()))
+        else:
+            self.face_indices = np.empty(0, dtype=np.int32)
+        self._world = None
+        self._world_key = None
+
+    def as_dict(self):
+        """{obj: face index array} views, as accepted by the collectors."""
+        offsets = self.offsets
+        return {obj: self.face_indices[offsets[i]:offsets[i + 1]]
+                for i, obj in enumerate(self.objects)}
+
+    def world_coords(self, extra_points=None, use_depsgraph=False, context=None,
+                     object_cache=None):
+        """(N, 3) float64 world positions of the marked face vertices plus
+        extra_points; extra points are keyed by count, as operators only
+        append them between mark changes.
+
+        object_cache, when given, is a dict the operator keeps across
+        snapshots. Each object's vertices are stored there with its face
+        indices, and the next snapshot reuses them when that object's marks
+        did not change, so a click only re-reads the mesh it touched.
+        """
+        key = (0 if extra_points is None else len(extra_points), use_depsgraph)
+        if self._world is None or self._world_key != key:
+            if object_cache is None:
+                self._world = collect_marked_face_coords(
+                    self.as_dict(), use_depsgraph=use_depsgraph,
+                    context=context, extra_points=extra_points)
+            else:
+                self._world = self._gather_cached(
+                    object_cache, extra_points, use_depsgraph, context)
+            self._world_key = key
+        return self._world
+
+    def _gather_cached(self, object_cache, extra_points, use_depsgraph, context):
+        chunks = []
+        live = {}
+        for obj, faces in self.as_dict().items():
+            ptr = obj.as_pointer()
+            entry = object_cache.get(ptr)
+            if (entry is None or entry[0] != use_depsgraph
+                    or not np.array_equal(entry[1], faces)):
+                entry = (use_depsgraph, faces, collect_marked_face_coords(
+                    {obj: faces}, use_depsgraph=use_depsgraph, context=context))
+            live[ptr] = entry
+            chunks.append(entry[2])
+        # Objects no longer marked drop out of the cache
+        object_cache.clear()
+        object_cache.update(live)
+
+        if extra_points is not None and len(extra_points):
+            chunks.append(np.asarray(extra_points, dtype=np.float64).reshape(-1, 3))
+        if not chunks:
+            return np.empty((0, 3), dtype=np.float64)
+        return np.concatenate(chunks)
+
+
+class MouseSample:
+    """Mouse position copied out of a MOUSEMOVE event.
+
+    Blender reuses event objects, so a coalesced hover keeps only the
+    fields the hover path reads instead of the event itself.
+    """
+    __slots__ = ('mouse_region_x', 'mouse_region_y')
+
+    def __init__(self, event):
+        self.mouse_region_x = event.mouse_region_x
+        self.mouse_region_y = event.mouse_region_y
+
+
+class MarkedPointBuffer(PointBuffer):
+    """PointBuffer for an operator's marked points, iterating as Vectors.
+
+    Supports the list operations operators rely on (append, clear, len,
+    truth, iteration as Vectors) while the bbox fit takes ``array``.
+    """
+
+    def __iter__(self):
+        return (Vector(row) for row in self.array)
+
+
 def build_all_faces_dict(objects, use_depsgraph=False, context=None):
     """Build a marked-faces dict containing every polygon of every mesh object.
 
@@ -1903,6 +2342,40 @@ def move_object_to_cbb_collection(context, obj):
     # Link to CBB collection
     cbb_coll.objects.link(obj)
 
+# Unit cube with the vertex/face layout of primitive_cube_add(size=1)
+_CUBE_VERTS = (
+    (0.5, 0.5, 0.5), (0.5, 0.5, -0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5),
+    (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, -0.5, -0.5),
+)
+_CUBE_FACES = (
+    (0, 4, 6, 2), (3, 2, 6, 7), (7, 6, 4, 5),
+    (5, 1, 3, 7), (1, 0, 2, 3), (5, 4, 0, 1),
+)
+# Per-loop UVs of the primitive's "UVMap" layer (cross unwrap), in
+# _CUBE_FACES loop order
+_CUBE_UVS = (
+    (0.625, 0.5), (0.875, 0.5), (0.875, 0.75), (0.625, 0.75),
+    (0.375, 0.75), (0.625, 0.75), (0.625, 1.0), (0.375, 1.0),
+    (0.375, 0.0), (0.625, 0.0), (0.625, 0.25), (0.375, 0.25),
+    (0.125, 0.5), (0.375, 0.5), (0.375, 0.75), (0.125, 0.75),
+    (0.375, 0.5), (0.625, 0.5), (0.625, 0.75), (0.375, 0.75),
+    (0.375, 0.25), (0.625, 0.25), (0.625, 0.5), (0.375, 0.5),
+)
+
+def new_cube_object(name):
+    """Create an unlinked unit cube object straight from bpy.data.
+
+    Avoids bpy.ops.mesh.primitive_cube_add, whose operator call pushes
+    context and triggers a depsgraph update for what is eight vertices.
+    The mesh matches the primitive's, including its "UVMap" layer.
+    """
+    mesh_data = bpy.data.meshes.new(name)
+    mesh_data.from_pydata(_CUBE_VERTS, [], _CUBE_FACES)
+    uv_layer = mesh_data.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", [c for uv in _CUBE_UVS for c in uv])
+    mesh_data.update()
+    return bpy.data.objects.new(name, mesh_data)
+
 def setup_new_object(context, obj, assign_styles=True, move_to_collection=True):
     """
     Set up a newly created object with collection, styles, and common properties.
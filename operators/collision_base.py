@@ -0,0 +1,199 @@
+import bpy
+import subprocess
+import tempfile
+import os
+import sys
+import shutil
+import time
+
+from ..functions.collision_io import export_mesh_as_obj
+from ..functions import async_subprocess
+
+# Seconds the fallback waits for the pipe writer after the tool exits
+_FEED_WAIT = 5.0
+
+
+class CollisionDecompositionBase:
+    """Shared poll/execute/launch plumbing for the decomposition operators.
+
+    Subclasses (also deriving from bpy.types.Operator) set the class
+    attributes below and implement _static_args and _build_cmd; they may
+    override _resolve_tool and _write_input for tools that do not run a
+    configured executable on an exported OBJ file.
+    """
+    tool_name = ""          # Label used in reports and console output
+    hull_prefix = ""        # Name prefix of the created hull objects
+    temp_prefix = ""        # Prefix of the per-job temp directory
+    settings_attr = ""      # Scene PropertyGroup holding the tool settings
+    executable_pref = ""    # Addon preference holding the executable path
+    result_name = "output.obj"
+
+    @classmethod
+    def poll(cls, context):
+        if async_subprocess.is_busy():
+            cls.poll_message_set("A decomposition job is already running")
+            return False
+        if context.mode != 'OBJECT':
+            return False
+        return any(o.type == 'MESH' for o in context.selected_objects)
+
+    def execute(self, context):
+        tool = self._resolve_tool(context)
+        if tool is None:
+            return {'CANCELLED'}
+
+        mesh_objects = [o for o in context.selected_objects if o.type == 'MESH']
+        if not mesh_objects:
+            self.report({'ERROR'}, "No mesh objects selected")
+            return {'CANCELLED'}
+
+        pg = getattr(context.scene, self.settings_attr)
+
+        # Save selection state by name (export_mesh_as_obj changes it); names
+        # are looked up again on restore instead of trusting old RNA pointers.
+        view_objects = context.view_layer.objects
+        original_selected = [o.name for o in context.selected_objects]
+        original_active = view_objects.active.name if view_objects.active else None
+
+        # Settings are the same for every object in the batch: read them once.
+        static_args = self._static_args(pg)
+
+        launched = 0
+        for obj in mesh_objects:
+            if self._launch_job(context, obj, tool, static_args):
+                launched += 1
+
+        # Restore selection
+        bpy.ops.object.select_all(action='DESELECT')
+        for name in original_selected:
+            obj = view_objects.get(name)
+            if obj is not None:
+                obj.select_set(True)
+        view_objects.active = view_objects.get(original_active) if original_active else None
+
+        if launched > 0:
+            self.report(
+                {'INFO'},
+                f"{self.tool_name}: Started {launched} job(s). "
+                f"Open Window > Toggle System Console for progress."
+            )
+        else:
+            self.report({'WARNING'}, f"{self.tool_name}: Failed to start any jobs")
+
+        return {'FINISHED'}
+
+    def _resolve_tool(self, context):
+        """Return the configured executable path, or None after reporting."""
+        prefs = context.preferences.addons["Cursor_BBox"].preferences
+        path = bpy.path.abspath(getattr(prefs, self.executable_pref))
+
+        if not path or not os.path.isfile(path):
+            self.report(
+                {'ERROR'},
+                f"{self.tool_name} executable not found. Set path in: "
+                "Edit > Preferences > Add-ons > Cursor BBox > Tools"
+            )
+            return None
+        return path
+
+    @classmethod
+    def _static_args(cls, pg):
+        """Build the tool arguments shared by every job in a batch."""
+        raise TypeError(f"{cls.__name__} must implement _static_args")
+
+    def _build_cmd(self, tool, temp_dir, input_path, result_path, static_args):
+        """Return the Popen argument list for one job."""
+        raise TypeError(f"{type(self).__name__} must implement _build_cmd")
+
+    def _write_input(self, context, obj, input_path):
+        """Write the OBJ input for *obj*.
+
+        Returns:
+            A feed for tools that stream their input after launch, or None.
+            A feed has start(process), a ``done`` Event, needs_fallback()
+            and write_file(), like collision_io.ObjFifoFeed: when the
+            process did not read the whole stream, the input is rewritten
+            as a regular file and the job is launched once more.
+        """
+        export_mesh_as_obj(context, obj, input_path)
+        return None
+
+    @staticmethod
+    def _popen(cmd, temp_dir):
+        """Start *cmd* in *temp_dir* with its output piped to the job monitor."""
+        popen_kwargs = {}
+        if sys.platform == 'win32':
+            popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+        return subprocess.Popen(
+            cmd, cwd=temp_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True, bufsize=1,
+            **popen_kwargs,
+        )
+
+    @classmethod
+    def _fallback_retry(cls, feed, cmd, temp_dir, obj_name):
+        """Return the async_subprocess retry callback for a streamed input.
+
+        Only plain values are captured: the callback runs from the job
+        timer, after this operator instance is gone. It defers to a later
+        tick until the pipe writer has returned, rather than joining it on
+        the UI thread, and gives up on the fallback if that takes longer
+        than _FEED_WAIT seconds.
+        """
+        tool_name = cls.tool_name
+        popen = cls._popen
+        deadline = None
+
+        def retry(return_code):
+            nonlocal deadline
+            if not feed.done.is_set():
+                if deadline is None:
+                    deadline = time.monotonic() + _FEED_WAIT
+                if time.monotonic() < deadline:
+                    return async_subprocess.RETRY_LATER
+                print(f"[{tool_name}] Input pipe writer for '{obj_name}' did not finish; "
+                      f"not retrying")
+                return None
+            if not feed.needs_fallback():
+                return None
+            print(f"[{tool_name}] '{obj_name}' did not run from the input pipe "
+                  f"(exit {return_code}); retrying with a regular input file")
+            try:
+                feed.write_file()
+                return popen(cmd, temp_dir)
+            except OSError as e:
+                print(f"[{tool_name}] Retry failed for '{obj_name}': {e}")
+                return None
+
+        return retry
+
+    def _launch_job(self, context, obj, tool, static_args):
+        """Export mesh, launch the tool as a non-blocking process."""
+        temp_dir = tempfile.mkdtemp(prefix=self.temp_prefix)
+        input_path = os.path.join(temp_dir, "input.obj")
+        result_path = os.path.join(temp_dir, self.result_name)
+
+        try:
+            feed = self._write_input(context, obj, input_path)
+            cmd = self._build_cmd(tool, temp_dir, input_path, result_path, static_args)
+
+            process = self._popen(cmd, temp_dir)
+            retry = None
+            if feed is not None:
+                feed.start(process)
+                retry = self._fallback_retry(feed, cmd, temp_dir, obj.name)
+
+            async_subprocess.submit(
+                process, temp_dir, result_path,
+                obj.name, self.tool_name, self.hull_prefix,
+                retry=retry,
+            )
+            return True
+
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to start {self.tool_name} for '{obj.name}': {e}")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return False
@@ -1,100 +1,42 @@
 import bpy
-import subprocess
-import tempfile
-import os
-import sys
-import shutil
 
-from ..functions.collision_io import export_mesh_as_obj
-from ..functions import async_subprocess
+from ..functions.collision_io import (
+    ObjFifoFeed, build_presets, make_obj_fifo, mesh_to_obj_bytes,
+)
+from .collision_base import CollisionDecompositionBase
+
+# Preset rows, one per detail step D01..D10.
+# 10-step gradient from least detail preserved to most detail preserved.
+# Shared with CoACD-U, which exposes the same parameters under other names.
+COACD_PRESET_ROWS = (
+    # threshold, prep_res, mcts_iter, mcts_depth, mcts_nodes, hausdorff_res
+    (0.80, 20, 60, 2, 10, 1000),
+    (0.50, 25, 60, 2, 10, 1000),
+    (0.30, 30, 70, 2, 12, 1200),
+    (0.15, 40, 80, 2, 15, 1500),
+    (0.05, 50, 150, 3, 20, 2000),
+    (0.035, 55, 200, 3, 22, 2500),
+    (0.025, 60, 250, 4, 25, 3500),
+    (0.018, 70, 300, 4, 28, 5000),
+    (0.013, 85, 400, 5, 30, 7000),
+    (0.01, 100, 500, 5, 35, 10000),
+)
+
+COACD_PRESET_KEYS = (
+    'threshold',
+    'prep_resolution',
+    'mcts_iteration',
+    'mcts_depth',
+    'mcts_nodes',
+    'hausdorff_resolution',
+)
+
 
 # Preset values keyed by enum identifier
-# 10-step gradient from least detail preserved to most detail preserved
-COACD_PRESETS = {
-    'D01': {
-        'threshold': 0.80,
-        'prep_resolution': 20,
-        'mcts_iteration': 60,
-        'mcts_depth': 2,
-        'mcts_nodes': 10,
-        'hausdorff_resolution': 1000,
-    },
-    'D02': {
-        'threshold': 0.50,
-        'prep_resolution': 25,
-        'mcts_iteration': 60,
-        'mcts_depth': 2,
-        'mcts_nodes': 10,
-        'hausdorff_resolution': 1000,
-    },
-    'D03': {
-        'threshold': 0.30,
-        'prep_resolution': 30,
-        'mcts_iteration': 70,
-        'mcts_depth': 2,
-        'mcts_nodes': 12,
-        'hausdorff_resolution': 1200,
-    },
-    'D04': {
-        'threshold': 0.15,
-        'prep_resolution': 40,
-        'mcts_iteration': 80,
-        'mcts_depth': 2,
-        'mcts_nodes': 15,
-        'hausdorff_resolution': 1500,
-    },
-    'D05': {
-        'threshold': 0.05,
-        'prep_resolution': 50,
-        'mcts_iteration': 150,
-        'mcts_depth': 3,
-        'mcts_nodes': 20,
-        'hausdorff_resolution': 2000,
-    },
-    'D06': {
-        'threshold': 0.035,
-        'prep_resolution': 55,
-        'mcts_iteration': 200,
-        'mcts_depth': 3,
-        'mcts_nodes': 22,
-        'hausdorff_resolution': 2500,
-    },
-    'D07': {
-        'threshold': 0.025,
-        'prep_resolution': 60,
-        'mcts_iteration': 250,
-        'mcts_depth': 4,
-        'mcts_nodes': 25,
-        'hausdorff_resolution': 3500,
-    },
-    'D08': {
-        'threshold': 0.018,
-        'prep_resolution': 70,
-        'mcts_iteration': 300,
-        'mcts_depth': 4,
-        'mcts_nodes': 28,
-        'hausdorff_resolution': 5000,
-    },
-    'D09': {
-        'threshold': 0.013,
-        'prep_resolution': 85,
-        'mcts_iteration': 400,
-        'mcts_depth': 5,
-        'mcts_nodes': 30,
-        'hausdorff_resolution': 7000,
-    },
-    'D10': {
-        'threshold': 0.01,
-        'prep_resolution': 100,
-        'mcts_iteration': 500,
-        'mcts_depth': 5,
-        'mcts_nodes': 35,
-        'hausdorff_resolution': 10000,
-    },
-}
+COACD_PRESETS = build_presets(COACD_PRESET_KEYS, COACD_PRESET_ROWS)
 
 
-class CursorBBox_OT_collision_coacd(bpy.types.Operator):
+class CursorBBox_OT_collision_coacd(CollisionDecompositionBase, bpy.types.Operator):
     """Decompose selected mesh(es) into convex hulls using CoACD"""
     bl_idname = "cursor_bbox.collision_coacd"
     bl_label = "CoACD Decomposition"
@@ -103,75 +45,16 @@ class CursorBBox_OT_collision_coacd(bpy.types.Operator):
     # pushes its own clean undo step. See async_subprocess._finish_job.
     bl_options = {'REGISTER'}
 
-    @classmethod
-    def poll(cls, context):
-        if async_subprocess.is_busy():
-            cls.poll_message_set("A decomposition job is already running")
-            return False
-        if context.mode != 'OBJECT':
-            return False
-        return any(o.type == 'MESH' for o in context.selected_objects)
-
-    def execute(self, context):
-        prefs = context.preferences.addons["Cursor_BBox"].preferences
-        coacd_path = bpy.path.abspath(prefs.coacd_executable)
-
-        if not coacd_path or not os.path.isfile(coacd_path):
-            self.report(
-                {'ERROR'},
-                "CoACD executable not found. Set path in: "
-                "Edit > Preferences > Add-ons > Cursor BBox > Tools"
-            )
-            return {'CANCELLED'}
-
-        mesh_objects = [o for o in context.selected_objects if o.type == 'MESH']
-        if not mesh_objects:
-            self.report({'ERROR'}, "No mesh objects selected")
-            return {'CANCELLED'}
-
-        pg = context.scene.cursor_bbox_coacd
-
-        # Save selection state (export_mesh_as_obj changes it)
-        original_selected = list(context.selected_objects)
-        original_active = context.view_layer.objects.active
-
-        launched = 0
-        for obj in mesh_objects:
-            if self._launch_job(context, obj, coacd_path, pg):
-                launched += 1
-
-        # Restore selection
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selected:
-            try:
-                obj.select_set(True)
-            except Exception:
-                pass
-        context.view_layer.objects.active = original_active
+    tool_name = "CoACD"
+    hull_prefix = "CoACD"
+    temp_prefix = "coacd_"
+    settings_attr = "cursor_bbox_coacd"
+    executable_pref = "coacd_executable"
 
-        if launched > 0:
-            self.report(
-                {'INFO'},
-                f"CoACD: Started {launched} job(s). "
-                f"Open Window > Toggle System Console for progress."
-            )
-        else:
-            self.report({'WARNING'}, "CoACD: Failed to start any jobs")
-
-        return {'FINISHED'}
-
-    def _launch_job(self, context, obj, coacd_path, pg):
-        """Export mesh, launch CoACD as a non-blocking process."""
-        temp_dir = tempfile.mkdtemp(prefix="coacd_")
-        export_path = os.path.join(temp_dir, "input.obj")
-        output_path = os.path.join(temp_dir, "output.obj")
-
-        export_mesh_as_obj(context, obj, export_path)
-
-        cmd = [
-            coacd_path,
-            '-i', export_path,
-            '-o', output_path,
+    @staticmethod
+    def _static_args(pg):
+        """Build the CoACD arguments shared by every job in a batch."""
+        args = [
             '-t', str(pg.threshold),
             '-pm', pg.preprocess_mode,
             '-pr', str(pg.prep_resolution),
@@ -184,40 +67,32 @@ class CursorBBox_OT_collision_coacd(bpy.types.Operator):
         ]
 
         if pg.max_convex_hull != -1:
-            cmd.extend(['-c', str(pg.max_convex_hull)])
+            args.extend(['-c', str(pg.max_convex_hull)])
         if pg.no_merge:
-            cmd.append('-nm')
+            args.append('-nm')
         if pg.pca:
-            cmd.append('--pca')
+            args.append('--pca')
         if pg.decimate:
-            cmd.append('-d')
-            cmd.extend(['-dt', str(pg.max_ch_vertex)])
+            args.append('-d')
+            args.extend(['-dt', str(pg.max_ch_vertex)])
         if pg.extrude:
-            cmd.append('-ex')
-            cmd.extend(['-em', str(pg.extrude_margin)])
+            args.append('-ex')
+            args.extend(['-em', str(pg.extrude_margin)])
         if pg.seed > 0:
-            cmd.extend(['--seed', str(pg.seed)])
-
-        try:
-            popen_kwargs = {}
-            if sys.platform == 'win32':
-                popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-
-            process = subprocess.Popen(
-                cmd, cwd=temp_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True, bufsize=1,
-                **popen_kwargs,
-            )
-
-            async_subprocess.submit(
-                process, temp_dir, output_path,
-                obj.name, "CoACD", "CoACD",
-            )
-            return True
-
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to start CoACD for '{obj.name}': {e}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            return False
+            args.extend(['--seed', str(pg.seed)])
+        return args
+
+    def _build_cmd(self, tool, temp_dir, input_path, result_path, static_args):
+        return [tool, '-i', input_path, '-o', result_path, *static_args]
+
+    def _write_input(self, context, obj, input_path):
+        # Stream the input through a named pipe where available so the mesh
+        # never hits the disk; otherwise write it out as a regular file.
+        # A build that cannot read the pipe is relaunched on a regular file
+        # (see CollisionDecompositionBase._fallback_retry).
+        obj_data = mesh_to_obj_bytes(context, obj)
+        if make_obj_fifo(input_path):
+            return ObjFifoFeed(input_path, obj_data)
+        with open(input_path, 'wb') as f:
+            f.write(obj_data)
+        return None
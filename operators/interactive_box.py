@@ -1,11 +1,11 @@
 import bpy
 import mathutils
-from mathutils import Vector, Matrix
 from math import radians, degrees
 from ..functions.utils import (
     restore_selection_state,
     set_cursor_rotation_to_principal_plane,
     CURSOR_PLANE_ALIGNMENTS,
+    SNAP_MODE_NAMES,
     get_face_edges_from_raycast,
     select_edge_by_scroll,
     place_cursor_with_raycast_and_edge,
@@ -17,35 +17,45 @@ from ..functions.utils import (
     ensure_cbb_collection,
     ensure_cbb_material,
     assign_object_styles,
-    get_cursor_rotation_euler,
+    get_cursor_rotation,
+    cursor_rotation_signature,
     get_selected_faces_from_edit_mode,
     calculate_point_location,
     get_faces_to_process,
+    clear_coplanar_cache,
+    enable_bvh_cache,
+    disable_bvh_cache,
+    get_geometry_generation,
     is_collection_instance,
     make_collection_instance_real,
     cleanup_collection_instance_temp,
-    build_all_faces_dict
+    build_all_faces_dict,
+    collect_marked_face_coords,
+    MarkedFacesSoA,
+    MarkedPointBuffer,
+    MouseSample,
+    new_cube_object
 )
 from ..functions.core import (
     cursor_aligned_bounding_box,
     calculate_bbox_bounds_optimized,
+    apply_push_to_dimensions,
     enable_edge_highlight_wrapper as enable_edge_highlight,
     disable_edge_highlight_wrapper as disable_edge_highlight,
     enable_bbox_preview_wrapper as enable_bbox_preview,
     disable_bbox_preview_wrapper as disable_bbox_preview,
     enable_face_marking_wrapper as enable_face_marking,
     disable_face_marking_wrapper as disable_face_marking,
-    mark_face,
     mark_faces_batch,
-    unmark_face,
-    clear_marked_faces,
     update_marked_faces_bbox,
     rebuild_marked_faces_visual_data,
+    append_marked_faces_visual,
     add_marked_point,
     clear_marked_points,
     clear_all_markings,
     update_preview_faces,
     clear_preview_faces,
+    has_preview_faces,
     toggle_backface_rendering,
     get_backface_rendering,
     toggle_preview_culling,
@@ -59,120 +69,71 @@ from ..functions.core import (
     enable_limitation_plane_wrapper as enable_limitation_plane,
     disable_limitation_plane_wrapper as disable_limitation_plane
 )
-from ..settings.preferences import get_preferences
+from ..settings.preferences import get_preferences, get_bbox_display_prefs
 from ..ui.hud.controller import HUDController
 from ..ui.hud.items import HUDItem, HUDSection, HUDParam, ItemState
 from ..functions.undo_stack import OperatorUndoStack
 
-def create_bounding_box_from_marked(marked_faces_dict, marked_points=None, push_value=0.01, select_new_object=True, use_depsgraph=False):
-    """Create a bounding box from marked faces and points"""
-    from ..functions.utils import collect_vertices_from_marked_faces, setup_new_object, restore_selection_state
+def create_bounding_box_from_marked(marked_faces_dict, marked_points=None, push_value=0.01, select_new_object=True, use_depsgraph=False,
+                                    show_wire=True, show_all_edges=True, cursor_rotation=None):
+    """Create a bounding box from marked faces and points
+
+    show_wire / show_all_edges are the bbox display preferences; the
+    operator reads them once in invoke and passes them through.
+    cursor_rotation, when given, is the (Euler, Matrix) pair that
+    get_cursor_rotation would return; the operator keeps it cached.
+    """
+    from ..functions.utils import setup_new_object
     
     context = bpy.context
     cursor = context.scene.cursor
     
-    # Store explicit reference to the original active object and selected objects
-    original_active = context.view_layer.objects.active
-    original_selected = list(context.selected_objects)
-    
     # Capture cursor state
     cursor_location = cursor.location.copy()
     
-    # Robustly capture rotation as XYZ Euler regardless of mode
-    if cursor.rotation_mode == 'QUATERNION':
-        cursor_rotation = cursor.rotation_quaternion.to_euler('XYZ')
-    elif cursor.rotation_mode == 'AXIS_ANGLE':
-        aa = cursor.rotation_axis_angle
-        rot_mat = Matrix.Rotation(aa[0], 4, Vector((aa[1], aa[2], aa[3])))
-        cursor_rotation = rot_mat.to_euler('XYZ')
-    else:
-        if cursor.rotation_mode != 'XYZ':
-            cursor_rotation = cursor.rotation_euler.to_matrix().to_euler('XYZ')
-        else:
-            cursor_rotation = cursor.rotation_euler.copy()
+    # Capture rotation as XYZ Euler (object rotation) and matrix (fit) in one go
+    if cursor_rotation is None:
+        cursor_rotation = get_cursor_rotation(context)
+    cursor_rotation, cursor_rot_mat = cursor_rotation
     
-    # Collect vertices from marked faces using shared utility
-    all_world_coords = collect_vertices_from_marked_faces(marked_faces_dict, use_depsgraph=use_depsgraph, context=context)
-    
-    # Add marked points
-    if marked_points:
-        all_world_coords.extend(marked_points)
+    # Collect vertices from marked faces and marked points as one (N, 3) array
+    all_world_coords = collect_marked_face_coords(
+        marked_faces_dict, use_depsgraph=use_depsgraph, context=context, extra_points=marked_points
+    )
     
-    if not all_world_coords:
+    if not len(all_world_coords):
         print("Error: No vertices found in marked faces or points.")
         return False
     
     # Use optimized calculation
     local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
-        all_world_coords, cursor_location, cursor_rotation
+        all_world_coords, cursor_location, cursor_rotation, cursor_rot_mat=cursor_rot_mat
     )
     
     # Apply push value
-    epsilon = 0.0001
-    dimensions = Vector((
-        max(dimensions.x, epsilon),
-        max(dimensions.y, epsilon),
-        max(dimensions.z, epsilon)
-    ))
-    
-    safe_push_value = float(push_value)
-    if safe_push_value > 0 or abs(safe_push_value) * 2 < min(dimensions):
-        dimensions += Vector((2 * safe_push_value,) * 3)
-    
-    dimensions = Vector((
-        max(dimensions.x, epsilon),
-        max(dimensions.y, epsilon),
-        max(dimensions.z, epsilon)
-    ))
+    dimensions = apply_push_to_dimensions(dimensions, push_value)
     
     world_center = cursor_location + (cursor_rot_mat @ local_center)
     
-    # Get preferences for bounding box display
-    try:
-        prefs = get_preferences()
-        if prefs:
-            show_wire = prefs.bbox_show_wire
-            show_all_edges = prefs.bbox_show_all_edges
-        else:
-            show_wire = True
-            show_all_edges = True
-    except:
-        show_wire = True
-        show_all_edges = True
+    # Create bbox object; it starts unselected, so the existing selection
+    # is left untouched unless the new box should take it over
+    bbox_obj = new_cube_object(context.scene.cursor_bbox_name_box or "Cube")
+    bbox_obj.location = world_center
+    bbox_obj.rotation_euler = cursor_rotation
+    bbox_obj.scale = dimensions
     
-    # Create bbox object
-    from ..functions.utils import preserve_selection_state
+    # Set up object (collection, styles)
+    setup_new_object(context, bbox_obj, assign_styles=True, move_to_collection=True)
     
-    with preserve_selection_state(context) as state:
-        state.deselect_all()
-        
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            enter_editmode=False,
-            align='WORLD',
-            location=world_center,
-            rotation=cursor_rotation
-        )
-        
-        bbox_obj = context.active_object
-        bbox_obj.name = context.scene.cursor_bbox_name_box if context.scene.cursor_bbox_name_box else "Cube"
-        
-        # Set up object (collection, styles)
-        setup_new_object(context, bbox_obj, assign_styles=True, move_to_collection=True)
-        
-        bbox_obj.scale = dimensions
-        bbox_obj.show_wire = show_wire
-        bbox_obj.show_all_edges = show_all_edges
-        
-        bbox_obj.select_set(False)
-        
-        # Handle selection
-        if select_new_object:
-            bbox_obj.select_set(True)
-            context.view_layer.objects.active = bbox_obj
-        else:
-            # Restore original selection state
-            restore_selection_state(context, original_selected, original_active)
+    bbox_obj.show_wire = show_wire
+    bbox_obj.show_all_edges = show_all_edges
+    
+    # Handle selection
+    if select_new_object:
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        bbox_obj.select_set(True)
+        context.view_layer.objects.active = bbox_obj
     
     return True
 
@@ -211,8 +172,9 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
     current_edge_index: bpy.props.IntProperty(default=0)
     current_face_data = None
     marked_faces = {}  # Dictionary to store marked faces per object
-    marked_points = []  # List to store additional point markers
+    marked_points = None  # MarkedPointBuffer of additional point markers
     original_selected_objects = set()
+    _original_ptrs = frozenset()  # as_pointer() of original_selected_objects
     use_depsgraph = False
     
     # Collection instance handling
@@ -221,7 +183,10 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
     # Limitation Plane State
     limit_plane_mode = False
     limitation_plane_matrix = None
+    _plane_origin = None
+    _plane_normal = None
     cached_limit_intersections = []
+    _limit_cache = None
     
     def handle_collection_instance(self, context, obj, keep_previous_selection=False):
         """
@@ -259,7 +224,7 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
         return {
             'marked_faces': {obj: set(faces)
                              for obj, faces in self.marked_faces.items()},
-            'marked_points': [Vector(p) for p in self.marked_points],
+            'marked_points': self.marked_points.array.copy(),
         }
 
     def _restore_snapshot(self, snap, context):
@@ -267,7 +232,10 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
         that drives marking visuals and the bbox preview."""
         self.marked_faces = {obj: set(faces)
                              for obj, faces in snap['marked_faces'].items()}
-        self.marked_points = [Vector(p) for p in snap['marked_points']]
+        self._marks_soa = None
+        self.marked_points = MarkedPointBuffer()
+        for p in snap['marked_points']:
+            self.marked_points.append(p)
         # Rebuild global marking state from operator-local copy.
         clear_all_markings()
         for obj, faces in self.marked_faces.items():
@@ -277,21 +245,195 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             add_marked_point(p)
         # Refresh bbox preview / clear if nothing left.
         if self.marked_faces or self.marked_points:
-            cursor_rotation = get_cursor_rotation_euler(context)
-            update_marked_faces_bbox(self.marked_faces, self.push_value,
-                                    context.scene.cursor.location,
-                                    cursor_rotation,
-                                    marked_points=self.marked_points,
-                                    use_depsgraph=self.use_depsgraph)
+            self._bbox_dirty = True
         else:
             clear_preview_faces()
-        if context.area is not None:
-            context.area.tag_redraw()
+        self._redraw_pending = True
 
     def _push_undo(self):
         """Snapshot current state before a mutating action."""
         self.undo_stack.push(self._snapshot())
 
+    def _is_target(self, obj):
+        """Whether a raycast hit belongs to the objects the tool was started on.
+
+        Compares datablock pointers: raycasts hand back fresh Python wrappers,
+        so id() would not match and set membership hashes through RNA.
+        """
+        return obj.as_pointer() in self._original_ptrs
+
+    def _set_limitation_plane(self, matrix):
+        """Store the limitation plane with its origin and normal.
+
+        Limit-plane mouse moves read the origin and normal every event; they
+        only change when the plane is redefined, so derive them here once.
+        matrix may be the live cursor matrix: it is copied only when it
+        differs from the stored plane, as R/E/C usually re-set the same one.
+        """
+        if matrix is None:
+            self.limitation_plane_matrix = None
+            self._plane_origin = self._plane_normal = None
+            return
+        if self.limitation_plane_matrix is not None and matrix == self.limitation_plane_matrix:
+            return
+        self.limitation_plane_matrix = matrix.copy()
+        self._plane_origin = matrix.to_translation()
+        self._plane_normal = matrix.col[2].to_3d()
+
+    def _refresh_limit_intersections(self, context):
+        """Recompute cached_limit_intersections for the current limitation plane.
+
+        R and E re-define the plane on every press, usually to where it
+        already was; the BVH-scale edge walk is only redone when the plane
+        (to 1e-6) or the objects it cuts have actually changed.
+        """
+        if self.marked_faces:
+            objects = self.marked_faces.keys()
+        elif context.active_object and context.active_object.type == 'MESH':
+            objects = [context.active_object]
+        else:
+            objects = []
+        origin = self._plane_origin
+        normal = self._plane_normal
+        key = (
+            origin.to_tuple(6), normal.to_tuple(6),
+            tuple(o.as_pointer() for o in objects), bool(self.marked_faces),
+            self.use_depsgraph,
+        )
+        if self._limit_cache is not None and self._limit_cache[0] == key:
+            self.cached_limit_intersections = self._limit_cache[1]
+            return
+
+        if not objects:
+            result = []
+        elif self.marked_faces:
+            result = calculate_plane_edge_intersections_multi(
+                objects, origin, normal, use_depsgraph=self.use_depsgraph
+            )
+        else:
+            result = calculate_plane_edge_intersections(
+                objects[0], origin, normal, use_depsgraph=self.use_depsgraph
+            )
+        self._limit_cache = (key, result)
+        self.cached_limit_intersections = result
+
+    def _raycast_key(self, event):
+        return (event.mouse_region_x, event.mouse_region_y, self.use_depsgraph)
+
+    def _raycast(self, context, event):
+        """Face under the mouse, reusing the hover raycast if the mouse has
+        not moved since (clicks land on the last hovered position)."""
+        key = self._raycast_key(event)
+        if self._last_rc is not None and self._last_rc[0] == key:
+            return self._last_rc[1]
+        face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        self._last_rc = (key, face_data)
+        return face_data
+
+    def _cursor_rotation(self, context):
+        """Cursor rotation as (XYZ Euler, 3x3 Matrix), re-derived only when it changed."""
+        sig = cursor_rotation_signature(context.scene.cursor)
+        if sig != self._last_cursor_sig:
+            self._last_cursor_sig = sig
+            self._last_cursor_rot = get_cursor_rotation(context)
+        return self._last_cursor_rot
+
+    def _flush_bbox_update(self, context):
+        """Recompute the marked bbox preview if an event flagged it dirty.
+
+        Handlers only set self._bbox_dirty; the recompute runs from the modal
+        timer so bursts of clicks, scrolls and mouse moves cost one update
+        per tick instead of one per event.
+        """
+        if not self._bbox_dirty:
+            return
+        self._bbox_dirty = False
+        # Face index arrays are rebuilt only after the marks change (every
+        # mutation resets _marks_soa); cursor-only updates reuse them.
+        if self._marks_soa is None:
+            self._marks_soa = MarkedFacesSoA(self.marked_faces)
+            self._last_bbox_sig = None
+        cursor = context.scene.cursor
+        cursor_rotation, cursor_rot_mat = self._cursor_rotation(context)
+        # Cursor moves that land on the same spot (raycast miss, snap
+        # fall-through) leave every input unchanged; points are only ever
+        # appended between mark resets, so their count tracks them.
+        bbox_sig = (tuple(cursor.location), self._last_cursor_sig, self.push_value,
+                    len(self.marked_points), self.use_depsgraph)
+        if bbox_sig == self._last_bbox_sig:
+            return
+        self._last_bbox_sig = bbox_sig
+        # World-space mark vertices only depend on the marks, so cursor-only
+        # updates reuse them and just redo the cursor-space fit.
+        soa = self._marks_soa
+        world = soa.world_coords(self.marked_points.array, self.use_depsgraph, context,
+                                 object_cache=self._mark_world_cache)
+        update_marked_faces_bbox(soa.as_dict(), self.push_value,
+                                 cursor.location,
+                                 cursor_rotation,
+                                 marked_points=self.marked_points.array,
+                                 cursor_rot_mat=cursor_rot_mat,
+                                 use_depsgraph=self.use_depsgraph,
+                                 precomputed_world=world)
+        self._redraw_pending = True
+
+    def _rebuild_next_marked(self):
+        """Rebuild the marked-face visuals of one queued object."""
+        obj = self._rebuild_queue.pop()
+        try:
+            faces = self.marked_faces.get(obj) if obj.type == 'MESH' else None
+        except ReferenceError:
+            # Object was removed since the rebuild was queued
+            faces = None
+        if faces:
+            rebuild_marked_faces_visual_data(obj, faces, use_depsgraph=self.use_depsgraph)
+            self._redraw_pending = True
+        if not self._rebuild_queue and (self.marked_faces or self.marked_points):
+            self._bbox_dirty = True
+
+    def _remove_bbox_timer(self, context):
+        if self._bbox_timer is not None:
+            context.window_manager.event_timer_remove(self._bbox_timer)
+            self._bbox_timer = None
+
+    def _teardown(self, context):
+        """Release every preview, timer and HUD when the modal exits."""
+        disable_edge_highlight()
+        disable_bbox_preview()
+        disable_face_marking()
+        clear_all_markings()
+        clear_preview_faces()
+        clear_preview_point()
+        clear_snap_targets_preview()
+        clear_limitation_plane()
+        disable_limitation_plane(context)  # Ensure visual is off
+        self.cleanup_all_instances(context)  # Clean up collection instances
+        self._remove_bbox_timer(context)
+        disable_bvh_cache()
+        restore_selection_state(context, self._restore_selected, self._restore_active)
+        if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
+            self.hud_ctl.detach(context)
+
+    def _snap(self, context, event, face_data, intersection_pts):
+        """Snap the cursor near the mouse, reusing the last search while the
+        mouse, the hovered face and the snap settings are unchanged."""
+        key = (self._raycast_key(event), self.snap_threshold, self.snap_mode)
+        last = self._last_snap
+        # Face data and intersection points are compared by identity: a new
+        # raycast or limit plane result is always a new object
+        if (last is not None and last[0] == key
+                and last[1] is face_data and last[2] is intersection_pts):
+            snap_result = last[3]
+            if snap_result['success']:
+                context.scene.cursor.location = snap_result['location']
+            return snap_result
+        snap_result = snap_cursor_to_closest_element(
+            context, event, face_data, threshold=self.snap_threshold,
+            intersection_points=intersection_pts, use_depsgraph=self.use_depsgraph,
+            snap_mode=self.snap_mode)
+        self._last_snap = (key, face_data, intersection_pts, snap_result)
+        return snap_result
+
     def _setup_hud(self, context):
         """Build the HUDOverlay + HelpOverlay shown while this modal runs."""
         self.hud_ctl = HUDController("interactive_box", "Interactive Box")
@@ -322,8 +464,6 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             HUDItem("Exit point mode", "A"),
         ]))
         # Live parameter dashboard (HUDOverlay).
-        from ..functions.utils import CURSOR_PLANE_ALIGNMENTS as _PLANES
-        _mode_names = ("All", "Vert", "Edge", "Face")
         self.hud_ctl.hud.add_param(HUDParam(
             "Mode", lambda: "POINT" if self.point_mode else "MARK"))
         self.hud_ctl.hud.add_param(HUDParam(
@@ -352,7 +492,7 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Snap mode",
-            lambda: _mode_names[self.snap_mode],
+            lambda: SNAP_MODE_NAMES[self.snap_mode],
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Snap threshold px",
@@ -361,7 +501,7 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Cursor plane",
-            lambda: _PLANES[self.cursor_plane_align],
+            lambda: CURSOR_PLANE_ALIGNMENTS[self.cursor_plane_align],
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Limit plane",
@@ -370,17 +510,422 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.attach(context)
 
+    def _handle_mousemove(self, context, event):
+        """Hover preview: cursor placement, preview faces/point, snap targets."""
+        scene = context.scene
+        cursor = scene.cursor
+
+        if self.point_mode:
+            face_data = self._raycast(context, event)
+            current_loc = None
+
+            if self.snap_enabled:
+                # Snap Logic - use intersection points if limit plane mode is enabled
+                intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
+                snap_result = self._snap(context, event, face_data, intersection_pts)
+                if snap_result['success']:
+                    current_loc = cursor.location.copy()
+                elif face_data:
+                    # Fallback to normal alignment on the hit we already have
+                    result = place_cursor_with_raycast_and_edge(
+                       context, event, self.align_to_face, self.current_edge_index, preview=False,
+                       use_depsgraph=self.use_depsgraph, face_data=face_data
+                    )
+                    current_loc = result['location']
+            elif self.limit_plane_mode and self.limitation_plane_matrix and face_data:
+                 # Limit Plane Mode (no snap)
+                 plane_origin = self._plane_origin
+                 plane_normal = self._plane_normal # Z axis
+
+                 proj_pt = project_point_to_plane_intersection(
+                     face_data['hit_location'], 
+                     face_data['face_normal'],
+                     plane_origin, 
+                     plane_normal
+                 )
+
+                 if proj_pt:
+                     current_loc = proj_pt
+                 else:
+                     current_loc = None
+            elif face_data:
+                # Standard alignment (updates cursor location and rotation)
+                result = place_cursor_with_raycast_and_edge(
+                    context, event, self.align_to_face, self.current_edge_index, preview=False,
+                    use_depsgraph=self.use_depsgraph, face_data=face_data
+                )
+                current_loc = result['location']
+
+            if current_loc:
+                update_preview_point(current_loc)
+            else:
+                clear_preview_point()
+            if self.snap_enabled and (face_data or (self.limit_plane_mode and self.cached_limit_intersections)):
+                intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
+                update_snap_targets_preview(face_data, self.snap_mode, intersection_points=intersection_pts)
+            else:
+                clear_snap_targets_preview()
+
+            self._redraw_pending = True
+            return {'RUNNING_MODAL'}
+
+        # Normal MOUSEMOVE
+        face_data = self._raycast(context, event)
+        if face_data:
+            place_cursor_with_raycast_and_edge(
+                context, event, self.align_to_face, self.current_edge_index, preview=False,
+                use_depsgraph=self.use_depsgraph, face_data=face_data
+            )
+        if face_data and self._is_target(face_data['object']):
+            self.current_face_data = face_data
+
+            # Update Preview Faces
+            obj = face_data['object']
+            face_idx = face_data['face_index']
+
+            # Re-hovering the same face with the same settings (and unchanged
+            # geometry) would rebuild an identical preview; skip it while that
+            # preview is still shown
+            # Scene properties are RNA reads; take each once per hover
+            use_coplanar = scene.cursor_bbox_select_coplanar
+            coplanar_angle = scene.cursor_bbox_coplanar_angle
+            hover_key = (obj.as_pointer(), face_idx, use_coplanar,
+                         round(coplanar_angle, 4), self.use_depsgraph,
+                         get_geometry_generation())
+            if hover_key != self._last_hover_key or not has_preview_faces():
+                self._last_hover_key = hover_key
+                faces_to_preview = get_faces_to_process(
+                    obj, face_idx, use_coplanar,
+                    coplanar_angle, use_depsgraph=self.use_depsgraph
+                )
+                # Moving between faces of one coplanar region yields the same
+                # face set; only rebuild the preview triangles when it differs
+                preview_key = (obj.as_pointer(), self.use_depsgraph, faces_to_preview, hover_key[-1])
+                if preview_key != self._last_preview_key or not has_preview_faces():
+                    self._last_preview_key = preview_key
+                    update_preview_faces(obj, faces_to_preview, use_depsgraph=self.use_depsgraph)
+
+            # Update bbox preview - show marked faces and points bbox if any, otherwise object bbox
+            if self.marked_faces or self.marked_points:
+                # Update preview with marked faces and points
+                self._bbox_dirty = True
+            self._redraw_pending = True
+        else:
+            clear_preview_faces()
+            self.current_face_data = None
+
+        return {'RUNNING_MODAL'}
+
+    def _on_toggle_depsgraph(self, context, event):
+        """Toggle Depsgraph (D)"""
+        self.use_depsgraph = not self.use_depsgraph
+
+        # Rebuild visuals with new setting, one object per timer tick (see
+        # _rebuild_next_marked) so large selections don't stall one frame;
+        # the bbox preview follows once the queue drains.
+        self._rebuild_queue = list(self.marked_faces)
+        if not self._rebuild_queue and self.marked_points:
+            self._bbox_dirty = True
+
+        self.report({'INFO'}, f"Depsgraph: {'ON' if self.use_depsgraph else 'OFF'}")
+        self._redraw_pending = True
+        return {'RUNNING_MODAL'}
+
+    def _on_toggle_backface(self, context, event):
+        """Toggle Backface Rendering (P)"""
+        new_state = toggle_backface_rendering()
+        state_str = "ON" if new_state else "OFF"
+        self.report({'INFO'}, f"Backface Rendering: {state_str}")
+        self._redraw_pending = True
+        return {'RUNNING_MODAL'}
+
+    def _on_toggle_culling(self, context, event):
+        """Toggle Preview Culling (O)"""
+        new_state = toggle_preview_culling()
+        state_str = "ON" if new_state else "OFF"
+        self.report({'INFO'}, f"Preview Culling: {state_str}")
+        self._redraw_pending = True
+        return {'RUNNING_MODAL'}
+
+    def _on_toggle_coplanar(self, context, event):
+        """Toggle Coplanar (C) or Limit Plane (C in point mode)"""
+        scene = context.scene
+        cursor = scene.cursor
+        if self.point_mode:
+            self.limit_plane_mode = not self.limit_plane_mode
+            if self.limit_plane_mode:
+                # Always align limitation plane to cursor when pressing C
+                self._set_limitation_plane(cursor.matrix)
+                update_limitation_plane(self.limitation_plane_matrix)
+                enable_limitation_plane(context, self.limitation_plane_matrix)
+                self._refresh_limit_intersections(context)
+                self.report({'INFO'}, f"Limitation Plane ON | Found {len(self.cached_limit_intersections)} intersection points")
+            else:
+                clear_limitation_plane()
+                disable_limitation_plane(context)
+                self.cached_limit_intersections = []
+                self.report({'INFO'}, "Limitation Plane OFF")
+        else:
+            scene.cursor_bbox_select_coplanar = not scene.cursor_bbox_select_coplanar
+            state = "ON" if scene.cursor_bbox_select_coplanar else "OFF"
+            self.report({'INFO'}, f"Coplanar Selection: {state}")
+        self._redraw_pending = True
+        return {'RUNNING_MODAL'}
+
+    def _on_create_bbox(self, context, event):
+        """Create BBox (Space/Enter)"""
+        # The new box may now be what lies under the mouse
+        self._last_rc = None
+        # Create bounding box based on marked faces and/or points
+        if self.marked_faces or self.marked_points:
+            self._push_undo()
+            # Create bbox from marked faces and points
+            if create_bounding_box_from_marked(self.marked_faces, self.marked_points.array, self.push_value, select_new_object=False, use_depsgraph=self.use_depsgraph,
+                                               show_wire=self._show_wire, show_all_edges=self._show_all_edges,
+                                               cursor_rotation=self._cursor_rotation(context)):
+                self.report({'INFO'}, "Created Bounding Box. Ready for new selection.")
+                # Cleanup (partial) - Keep tool active
+                clear_all_markings()
+                clear_preview_faces()
+                self.marked_faces.clear()
+                self._marks_soa = None
+                self.marked_points.clear()
+                self._redraw_pending = True
+            else:
+                self.report({'WARNING'}, "Failed to create Bounding Box")
+
+            return {'RUNNING_MODAL'}
+        else:
+            # If nothing marked, maybe create on object under cursor? Or do nothing?
+            if self.current_face_data:
+                 # Create bbox from object under cursor (using current face data from hover)
+                 cursor_aligned_bounding_box(self.push_value, self.current_face_data['object'])
+                 self.report({'INFO'}, "Created Bounding Box on active object")
+                 clear_preview_faces()
+                 return {'RUNNING_MODAL'}
+            else:
+                 self.report({'WARNING'}, "Nothing marked or selected")
+
+        return {'RUNNING_MODAL'}
+
+    def _on_mark_click(self, context, event):
+        """Mark Face (LMB) — snapshot before any state-mutating click."""
+        scene = context.scene
+        self._push_undo()
+        if self.point_mode:
+            # Add Point Logic
+            face_data = self._raycast(context, event)
+
+            loc, message = calculate_point_location(
+                context, event, face_data, self.snap_enabled, 
+                self.limit_plane_mode, self.limitation_plane_matrix,
+                self.cached_limit_intersections, self.snap_threshold,
+                use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode
+            )
+
+            if loc is None:
+                if message:
+                    self.report({'WARNING'}, message)
+                return {'RUNNING_MODAL'}
+
+            if message:
+                self.report({'INFO'}, message)
+
+            self.marked_points.append(loc)
+            add_marked_point(loc)
+
+            # Update bbox preview based on marked faces and points
+            self._bbox_dirty = True
+            self._redraw_pending = True
+            return {'RUNNING_MODAL'}
+
+        # Normal Mark/Place Logic
+        # Mark/unmark face under cursor
+        face_data = self._raycast(context, event)
+        if face_data and self._is_target(face_data['object']):
+            obj = face_data['object']
+            face_idx = face_data['face_index']
+
+            # Also place cursor for feedback (optional, but good for "Place Cursor" tool)
+            place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index,
+                                               use_depsgraph=self.use_depsgraph, face_data=face_data)
+
+            # Determine faces to process (Coplanar logic)
+            faces_to_process = get_faces_to_process(
+                obj, face_idx, scene.cursor_bbox_select_coplanar,
+                scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
+            )
+            self._toggle_marked(obj, face_idx, faces_to_process)
+
+        return {'RUNNING_MODAL'}
+
+    def _toggle_marked(self, obj, face_idx, faces_to_process):
+        """Unmark faces_to_process if face_idx is marked, else mark them.
+
+        Shared by the LMB (coplanar group) and F (single face) handlers.
+        Returns True when the faces were marked.
+        """
+        marked = self.marked_faces.setdefault(obj, set())
+        self._marks_soa = None
+        if face_idx in marked:
+            marked.difference_update(faces_to_process)
+            # Rebuild visual (an empty set clears just this object's visual)
+            if not marked:
+                del self.marked_faces[obj]
+            rebuild_marked_faces_visual_data(obj, self.marked_faces.get(obj, set()), use_depsgraph=self.use_depsgraph)
+            newly_marked = False
+        else:
+            # Marking only appends the newly covered faces' triangles
+            added = faces_to_process - marked
+            marked.update(added)
+            append_marked_faces_visual(obj, added, use_depsgraph=self.use_depsgraph)
+            newly_marked = True
+
+        # Update bbox preview based on marked faces and points
+        self._bbox_dirty = True
+        self._redraw_pending = True
+        return newly_marked
+
+    def _on_toggle_face(self, context, event):
+        """Mark/unmark the face under the mouse (F)"""
+        # Mark/unmark face under cursor
+        face_data = self._raycast(context, event)
+        if face_data and self._is_target(face_data['object']):
+            obj = face_data['object']
+            face_idx = face_data['face_index']
+
+            if self._toggle_marked(obj, face_idx, {face_idx}):
+                self.report({'INFO'}, f"Marked face {face_idx} on {obj.name}")
+            else:
+                self.report({'INFO'}, f"Unmarked face {face_idx} on {obj.name}")
+
+        return {'RUNNING_MODAL'}
+
+    def _on_toggle_point_mode(self, context, event):
+        """Toggle Add Point Mode (A)"""
+        if event.ctrl:
+            return {'RUNNING_MODAL'}
+        self.point_mode = not self.point_mode
+        if self.point_mode:
+            self.report({'INFO'}, "Entered Add Point Mode")
+            self.current_face_data = None
+            clear_preview_faces()
+        else:
+            self.report({'INFO'}, "Exited Add Point Mode")
+            clear_preview_point()
+            clear_snap_targets_preview()
+            self.limit_plane_mode = False
+            clear_limitation_plane()
+            disable_limitation_plane(context) # Ensure visual is off
+            self.cached_limit_intersections = []
+
+        self._redraw_pending = True
+        return {'RUNNING_MODAL'}
+
+    def _on_clear_marks(self, context, event):
+        """Clear all marked faces and points (Z)"""
+        # Clear all marked faces and points
+        if self.marked_faces or self.marked_points:
+            self._push_undo()
+            clear_all_markings()  # Clear global state
+            clear_preview_faces()
+            self.marked_faces.clear()  # Clear local state
+            self._marks_soa = None
+            self.marked_points.clear()  # Clear local state
+            self.report({'INFO'}, "Cleared all marked faces and points")
+            # The hover already keeps the cursor on the face under the mouse;
+            # the next mouse move refreshes the preview
+            self._redraw_pending = True
+
+        return {'RUNNING_MODAL'}
+
+    def _on_snap(self, context, event):
+        """Toggle point snap, or snap the cursor to the nearest element (S)"""
+        if self.point_mode:
+            self.snap_enabled = not self.snap_enabled
+            if not self.snap_enabled:
+                clear_snap_targets_preview()
+            state_str = "ON" if self.snap_enabled else "OFF"
+            self.report({'INFO'}, f"Point Snap: {state_str} (Threshold: {self.snap_threshold}px)")
+        else:
+            # Snap cursor to closest vertex, edge midpoint, or face center from current face
+            face_data = self._raycast(context, event)
+            result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
+            if result['success'] and (not face_data or self._is_target(face_data['object'])):
+                if face_data:
+                    self.report({'INFO'}, f"Cursor snapped to {result['type']} on {face_data['object'].name} ({result['distance']:.1f}px away)")
+                else:
+                    self.report({'INFO'}, f"Cursor snapped to {result['type']} ({result['distance']:.1f}px away)")
+                # Update bbox preview after cursor snap
+                if self.marked_faces or self.marked_points:
+                    self._bbox_dirty = True
+                self._redraw_pending = True
+            else:
+                self.report({'WARNING'}, "No suitable snap target found")
+        return {'RUNNING_MODAL'}
+
+    # Plain key presses handled by a single method each; looked up by
+    # event.type in modal instead of walking a string-compare chain.
+    _PRESS_HANDLERS = {
+        'D': _on_toggle_depsgraph,
+        'P': _on_toggle_backface,
+        'O': _on_toggle_culling,
+        'C': _on_toggle_coplanar,
+        'RET': _on_create_bbox,
+        'NUMPAD_ENTER': _on_create_bbox,
+        'SPACE': _on_create_bbox,
+        'LEFTMOUSE': _on_mark_click,
+        'F': _on_toggle_face,
+        'A': _on_toggle_point_mode,
+        'Z': _on_clear_marks,
+        'S': _on_snap,
+    }
+
     def modal(self, context, event):
+        scene = context.scene
+        cursor = scene.cursor
+
+        # Debounce tick: handled before the HUD so timer events do not force
+        # a redraw of their own. Runs the latest coalesced hover first so
+        # the bbox update below sees its cursor placement.
+        if event.type == 'TIMER':
+            if self._pending_mouse is not None:
+                sample, self._pending_mouse = self._pending_mouse, None
+                self._handle_mousemove(context, sample)
+            if self._rebuild_queue:
+                self._rebuild_next_marked()
+            self._flush_bbox_update(context)
+            # Handlers only flag a redraw; issue at most one per tick
+            if self._redraw_pending and context.area is not None:
+                context.area.tag_redraw()
+                self._redraw_pending = False
+            return {'PASS_THROUGH'}
+
         # HUD: capture event for cursor-follow + forward toggle/drag events.
+        # Its redraw joins the coalesced one issued on the timer tick.
         if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
-            self.hud_ctl.update_event(event, context)
+            self.hud_ctl.update_event(event, context, redraw=False)
+            self._redraw_pending = True
             if self.hud_ctl.handle_events(context, event):
                 return {'RUNNING_MODAL'}
 
+        # Mouse motion is by far the most frequent event and can arrive many
+        # times per frame; only remember the latest position here and let
+        # the timer tick do the raycast/preview work once.
+        if event.type == 'MOUSEMOVE':
+            self._pending_mouse = MouseSample(event)
+            return {'RUNNING_MODAL'}
+
+        # Each event attribute read is an RNA lookup; the checks below
+        # test them many times over, so read them once
+        etype = event.type
+        evalue = event.value
+        shift, ctrl, alt = event.shift, event.ctrl, event.alt
+
         # Undo / Redo (Ctrl+Z / Ctrl+Shift+Z)
-        if (event.type == 'Z' and event.value == 'PRESS'
-                and event.ctrl and not event.alt):
-            if event.shift:
+        if (etype == 'Z' and evalue == 'PRESS'
+                and ctrl and not alt):
+            if shift:
                 snap = self.undo_stack.pop_redo(self._snapshot())
                 if snap is not None:
                     self._restore_snapshot(snap, context)
@@ -397,107 +942,67 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             return {'RUNNING_MODAL'}
 
         # Mark all polygons of all selected objects (Ctrl+A)
-        if (event.type == 'A' and event.value == 'PRESS'
-                and event.ctrl and not self.point_mode):
+        if (etype == 'A' and evalue == 'PRESS'
+                and ctrl and not self.point_mode):
             self._push_undo()
             self.marked_faces = build_all_faces_dict(
                 self.original_selected_objects, use_depsgraph=self.use_depsgraph)
+            self._marks_soa = None
             clear_all_markings()
             for obj, faces in self.marked_faces.items():
                 if faces:
                     mark_faces_batch(obj, faces, use_depsgraph=self.use_depsgraph)
-            cursor_rotation = get_cursor_rotation_euler(context)
-            update_marked_faces_bbox(self.marked_faces, self.push_value,
-                                     context.scene.cursor.location,
-                                     cursor_rotation,
-                                     marked_points=self.marked_points,
-                                     use_depsgraph=self.use_depsgraph)
+            self._bbox_dirty = True
             total = sum(len(v) for v in self.marked_faces.values())
             self.report({'INFO'}, f"Marked all polygons ({total}) of selected objects")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Cancel (Esc)
-        if event.type == 'ESC':
-            disable_edge_highlight()
-            disable_bbox_preview()
-            disable_face_marking()
-            clear_all_markings()
-            clear_preview_faces()
-            clear_preview_point()
-            clear_snap_targets_preview()
-            clear_limitation_plane()
-            disable_limitation_plane(context)  # Ensure visual is off
-            self.cleanup_all_instances(context)  # Clean up collection instances
-            restore_selection_state(context, self._restore_selected, self._restore_active)
-            if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
-                self.hud_ctl.detach(context)
+        if etype == 'ESC':
+            self._teardown(context)
             return {'CANCELLED'}
 
         # Finished (RMB)
-        if event.type == 'RIGHTMOUSE':
-            disable_edge_highlight()
-            disable_bbox_preview()
-            disable_face_marking()
-            clear_all_markings()
-            clear_preview_faces()
-            clear_preview_point()
-            clear_snap_targets_preview()
-            clear_limitation_plane()
-            disable_limitation_plane(context)  # Ensure visual is off
-            self.cleanup_all_instances(context)  # Clean up collection instances
-            restore_selection_state(context, self._restore_selected, self._restore_active)
-            if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
-                self.hud_ctl.detach(context)
+        if etype == 'RIGHTMOUSE':
+            self._teardown(context)
             return {'FINISHED'}
 
         # Snap mode 1=Vertex, 2=Edge, 3=Face (point mode only)
-        if self.point_mode and event.value == 'PRESS':
-            if event.type in ('ONE', 'NUMPAD_1'):
+        if self.point_mode and evalue == 'PRESS':
+            if etype in ('ONE', 'NUMPAD_1'):
                 self.snap_mode = 1
                 self.report({'INFO'}, "Snap: Vertex only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type in ('TWO', 'NUMPAD_2'):
+            if etype in ('TWO', 'NUMPAD_2'):
                 self.snap_mode = 2
                 self.report({'INFO'}, "Snap: Edge only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type in ('THREE', 'NUMPAD_3'):
+            if etype in ('THREE', 'NUMPAD_3'):
                 self.snap_mode = 3
                 self.report({'INFO'}, "Snap: Face only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
 
         # Reset cursor rotation to principal plane (R) - point mode only
-        if self.point_mode and event.type == 'R' and event.value == 'PRESS':
+        if self.point_mode and etype == 'R' and evalue == 'PRESS':
             self.cursor_plane_align = (self.cursor_plane_align + 1) % 3
             plane = CURSOR_PLANE_ALIGNMENTS[self.cursor_plane_align]
             set_cursor_rotation_to_principal_plane(context, plane)
             if self.limit_plane_mode:
-                self.limitation_plane_matrix = context.scene.cursor.matrix.copy()
+                self._set_limitation_plane(cursor.matrix)
                 update_limitation_plane(self.limitation_plane_matrix)
-                origin = self.limitation_plane_matrix.to_translation()
-                normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                self.cached_limit_intersections = []
-                if self.marked_faces:
-                    objects = list(self.marked_faces.keys())
-                    self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                        objects, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
-                elif context.active_object and context.active_object.type == 'MESH':
-                    self.cached_limit_intersections = calculate_plane_edge_intersections(
-                        context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
+                self._refresh_limit_intersections(context)
             self.report({'INFO'}, f"Cursor: {plane}")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # E: Set cursor location only (to current hover/snap position) and update limitation plane
-        if self.point_mode and event.type == 'E' and event.value == 'PRESS':
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        if self.point_mode and etype == 'E' and evalue == 'PRESS':
+            face_data = self._raycast(context, event)
             if face_data:
-                cursor = context.scene.cursor
                 if self.snap_enabled:
                     intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
                     snap_result = snap_cursor_to_closest_element(
@@ -507,8 +1012,8 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
                     if not snap_result['success']:
                         cursor.location = face_data['hit_location'].copy()
                 elif self.limit_plane_mode and self.limitation_plane_matrix:
-                    plane_origin = self.limitation_plane_matrix.to_translation()
-                    plane_normal = self.limitation_plane_matrix.col[2].to_3d()
+                    plane_origin = self._plane_origin
+                    plane_normal = self._plane_normal
                     proj_pt = project_point_to_plane_intersection(
                         face_data['hit_location'], face_data['face_normal'], plane_origin, plane_normal
                     )
@@ -519,93 +1024,52 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
                 else:
                     cursor.location = face_data['hit_location'].copy()
                 if self.limit_plane_mode:
-                    self.limitation_plane_matrix = cursor.matrix.copy()
+                    self._set_limitation_plane(cursor.matrix)
                     update_limitation_plane(self.limitation_plane_matrix)
-                    origin = self.limitation_plane_matrix.to_translation()
-                    normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                    self.cached_limit_intersections = []
-                    if self.marked_faces:
-                        objects = list(self.marked_faces.keys())
-                        self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                            objects, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
-                    elif context.active_object and context.active_object.type == 'MESH':
-                        self.cached_limit_intersections = calculate_plane_edge_intersections(
-                            context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
+                    self._refresh_limit_intersections(context)
                 self.report({'INFO'}, "Cursor location updated")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Coplanar Angle Adjustment (Shift + Scroll, with optional Alt for fine tuning if needed, but original was just Shift)
         # Avoiding Ctrl here since it's now for Snap
-        if event.shift and not event.ctrl and event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
-            current_deg = degrees(context.scene.cursor_bbox_coplanar_angle)
-            step = 1 if event.alt else 5
+        if shift and not ctrl and etype in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            current_deg = degrees(scene.cursor_bbox_coplanar_angle)
+            step = 1 if alt else 5
             
-            if event.type == 'WHEELUPMOUSE':
+            if etype == 'WHEELUPMOUSE':
                 new_angle_deg = current_deg + step
             else:
                 new_angle_deg = current_deg - step
                 
             new_angle_deg = max(0.0, min(180.0, new_angle_deg))
-            context.scene.cursor_bbox_coplanar_angle = radians(new_angle_deg)
+            scene.cursor_bbox_coplanar_angle = radians(new_angle_deg)
             
             self.report({'INFO'}, f"Coplanar Angle: {int(round(new_angle_deg))}°")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Snap Threshold Adjustment (Ctrl + Scroll)
-        if event.ctrl and not event.shift and not event.alt:
-            if event.type == 'WHEELUPMOUSE':
+        if ctrl and not shift and not alt:
+            if etype == 'WHEELUPMOUSE':
                 self.snap_threshold += 10
                 self.report({'INFO'}, f"Snap Threshold: {self.snap_threshold}px")
-                context.area.tag_redraw()
-            elif event.type == 'WHEELDOWNMOUSE':
+                self._redraw_pending = True
+            elif etype == 'WHEELDOWNMOUSE':
                 self.snap_threshold = max(10, self.snap_threshold - 10)
                 self.report({'INFO'}, f"Snap Threshold: {self.snap_threshold}px")
-                context.area.tag_redraw()
+                self._redraw_pending = True
             
             return {'RUNNING_MODAL'}
         
-        # Toggle Depsgraph (D)
-        if event.type == 'D' and event.value == 'PRESS':
-            self.use_depsgraph = not self.use_depsgraph
-            
-            # Rebuild visuals with new setting
-            for obj, faces in self.marked_faces.items():
-                rebuild_marked_faces_visual_data(obj, faces, use_depsgraph=self.use_depsgraph)
-            
-            # Update bbox preview if we have markings
-            if self.marked_faces or self.marked_points:
-                 cursor_rotation = get_cursor_rotation_euler(context)
-                 update_marked_faces_bbox(self.marked_faces, self.push_value, 
-                                        context.scene.cursor.location, 
-                                        cursor_rotation,
-                                        marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-            
-            self.report({'INFO'}, f"Depsgraph: {'ON' if self.use_depsgraph else 'OFF'}")
-            context.area.tag_redraw()
-            return {'RUNNING_MODAL'}
-
-        # Toggle Backface Rendering (P)
-        elif event.type == 'P' and event.value == 'PRESS':
-             new_state = toggle_backface_rendering()
-             state_str = "ON" if new_state else "OFF"
-             self.report({'INFO'}, f"Backface Rendering: {state_str}")
-             context.area.tag_redraw()
-             return {'RUNNING_MODAL'}
-             
-        # Toggle Preview Culling (O)
-        elif event.type == 'O' and event.value == 'PRESS':
-             new_state = toggle_preview_culling()
-             state_str = "ON" if new_state else "OFF"
-             self.report({'INFO'}, f"Preview Culling: {state_str}")
-             context.area.tag_redraw()
-             return {'RUNNING_MODAL'}
+        # Plain key presses (see _PRESS_HANDLERS)
+        if evalue == 'PRESS':
+            handler = self._PRESS_HANDLERS.get(etype)
+            if handler is not None:
+                return handler(self, context, event)
 
         # Coplanar Angle Presets (1-7)
-        elif event.type in {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN'} and event.value == 'PRESS':
+        if etype in {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN'} and evalue == 'PRESS':
              angle_map = {
                  'ONE': 5,
                  'TWO': 15,
@@ -615,418 +1079,57 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
                  'SIX': 120,
                  'SEVEN': 180
              }
-             new_angle = angle_map[event.type]
-             context.scene.cursor_bbox_coplanar_angle = radians(new_angle)
+             new_angle = angle_map[etype]
+             scene.cursor_bbox_coplanar_angle = radians(new_angle)
              self.report({'INFO'}, f"Coplanar Angle Set: {new_angle}°")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
 
-        # Toggle Coplanar (C) or Limit Plane (C in point mode)
-        if event.type == 'C' and event.value == 'PRESS':
-            if self.point_mode:
-                self.limit_plane_mode = not self.limit_plane_mode
-                if self.limit_plane_mode:
-                    # Always align limitation plane to cursor when pressing C
-                    self.limitation_plane_matrix = context.scene.cursor.matrix.copy()
-                    update_limitation_plane(self.limitation_plane_matrix)
-                    enable_limitation_plane(context, self.limitation_plane_matrix)
-                    self.cached_limit_intersections = []
-                    origin = self.limitation_plane_matrix.to_translation()
-                    normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                    if self.marked_faces:
-                        objects = list(self.marked_faces.keys())
-                        self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                            objects, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
-                    elif context.active_object and context.active_object.type == 'MESH':
-                        self.cached_limit_intersections = calculate_plane_edge_intersections(
-                            context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
-                    self.report({'INFO'}, f"Limitation Plane ON | Found {len(self.cached_limit_intersections)} intersection points")
-                else:
-                    clear_limitation_plane()
-                    disable_limitation_plane(context)
-                    self.cached_limit_intersections = []
-                    self.report({'INFO'}, "Limitation Plane OFF")
-            else:
-                context.scene.cursor_bbox_select_coplanar = not context.scene.cursor_bbox_select_coplanar
-                state = "ON" if context.scene.cursor_bbox_select_coplanar else "OFF"
-                self.report({'INFO'}, f"Coplanar Selection: {state}")
-            context.area.tag_redraw()
-            return {'RUNNING_MODAL'}
-        
-        # Allow navigation events to pass through
-        if event.type in {'MIDDLEMOUSE'}:
+        # Allow navigation events to pass through; the view changes under
+        # the mouse, so the cached raycast no longer applies
+        if etype in {'MIDDLEMOUSE'}:
+            self._last_rc = None
             return {'PASS_THROUGH'}
-        if event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and not event.shift and not event.alt and not event.ctrl:
+        if etype in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and not shift and not alt and not ctrl:
+            self._last_rc = None
             return {'PASS_THROUGH'}
-        
-        # Create BBox (Space/Enter)
-        if event.type in {'RET', 'NUMPAD_ENTER', 'SPACE'} and event.value == 'PRESS':
-            # Create bounding box based on marked faces and/or points
-            if self.marked_faces or self.marked_points:
-                self._push_undo()
-                # Create bbox from marked faces and points
-                if create_bounding_box_from_marked(self.marked_faces, self.marked_points, self.push_value, select_new_object=False, use_depsgraph=self.use_depsgraph):
-                    self.report({'INFO'}, "Created Bounding Box. Ready for new selection.")
-                    # Cleanup (partial) - Keep tool active
-                    clear_all_markings()
-                    clear_preview_faces()
-                    self.marked_faces.clear()
-                    self.marked_points.clear()
-                    context.area.tag_redraw()
-                else:
-                    self.report({'WARNING'}, "Failed to create Bounding Box")
-                
-                return {'RUNNING_MODAL'}
-            else:
-                # If nothing marked, maybe create on object under cursor? Or do nothing?
-                if self.current_face_data:
-                     # Create bbox from object under cursor (using current face data from hover)
-                     cursor_aligned_bounding_box(self.push_value, self.current_face_data['object'])
-                     self.report({'INFO'}, "Created Bounding Box on active object")
-                     clear_preview_faces()
-                     return {'RUNNING_MODAL'}
-                else:
-                     self.report({'WARNING'}, "Nothing marked or selected")
-            
-            return {'RUNNING_MODAL'}
-        
-        # Mark Face (LMB) — snapshot before any state-mutating click.
-        elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
-            self._push_undo()
-            if self.point_mode:
-                # Add Point Logic
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                
-                loc, message = calculate_point_location(
-                    context, event, face_data, self.snap_enabled, 
-                    self.limit_plane_mode, self.limitation_plane_matrix,
-                    self.cached_limit_intersections, self.snap_threshold,
-                    use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode
-                )
-                
-                if loc is None:
-                    if message:
-                        self.report({'WARNING'}, message)
-                    return {'RUNNING_MODAL'}
-                
-                if message:
-                    self.report({'INFO'}, message)
-                
-                self.marked_points.append(loc)
-                add_marked_point(loc)
-                
-                # Update bbox preview based on marked faces and points
-                cursor_rotation = get_cursor_rotation_euler(context)
-                update_marked_faces_bbox(self.marked_faces, self.push_value, 
-                                       context.scene.cursor.location, 
-                                       cursor_rotation,
-                                       marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
-                return {'RUNNING_MODAL'}
-            
-            # Normal Mark/Place Logic
-            # Mark/unmark face under cursor
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
-                obj = face_data['object']
-                face_idx = face_data['face_index']
-                
-                # Also place cursor for feedback (optional, but good for "Place Cursor" tool)
-                place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph)
-                
-                # Initialize object's marked faces if needed
-                if obj not in self.marked_faces:
-                    self.marked_faces[obj] = set()
-                
-                # Determine faces to process (Coplanar logic)
-                faces_to_process = get_faces_to_process(
-                    obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                    context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
-                )
 
-                # Check if we are marking or unmarking based on the clicked face
-                # If clicked face is marked, we unmark group. Else mark group.
-                is_unmarking = face_idx in self.marked_faces[obj]
-                
-                for idx in faces_to_process:
-                    if is_unmarking:
-                        if idx in self.marked_faces[obj]:
-                            self.marked_faces[obj].remove(idx)
-                    else:
-                        self.marked_faces[obj].add(idx)
-
-                # Rebuild visual
-                if not self.marked_faces[obj]:
-                    del self.marked_faces[obj]
-                    unmark_face(obj, face_idx) # This might not clear enough if we did batch unmark? 
-                    # use clear and rebuild to be safe
-                    clear_marked_faces() # Global clear is too strong if multiple objects
-                    rebuild_marked_faces_visual_data(obj, set(), use_depsgraph=self.use_depsgraph) # Clear this obj
-                    # But we might have other objects?
-                    # rebuild_marked_faces_visual_data handles single obj.
-                    
-                    # Hack: The utils function mark_face/unmark_face are for single.
-                    # We need batch update.
-                    # rebuild_marked_faces_visual_data(obj, self.marked_faces.get(obj, set()))
-                
-                rebuild_marked_faces_visual_data(obj, self.marked_faces.get(obj, set()), use_depsgraph=self.use_depsgraph)
-                
-                # Update bbox preview based on marked faces and points
-                cursor_rotation = get_cursor_rotation_euler(context)
-                update_marked_faces_bbox(self.marked_faces, self.push_value, 
-                                       context.scene.cursor.location, 
-                                       cursor_rotation,
-                                       marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
-            
-            return {'RUNNING_MODAL'}
-        
-        elif event.type == 'F' and event.value == 'PRESS':
-            # Mark/unmark face under cursor
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
-                obj = face_data['object']
-                face_idx = face_data['face_index']
-                
-                # Initialize object's marked faces if needed
-                if obj not in self.marked_faces:
-                    self.marked_faces[obj] = set()
-                
-                # Toggle face marking
-                if face_idx in self.marked_faces[obj]:
-                    self.marked_faces[obj].remove(face_idx)
-                    if not self.marked_faces[obj]:
-                        del self.marked_faces[obj]
-                        # Clear visual data for this object
-                        unmark_face(obj, face_idx)
-                    else:
-                        # Rebuild visual data for remaining marked faces
-                        rebuild_marked_faces_visual_data(obj, self.marked_faces[obj], use_depsgraph=self.use_depsgraph)
-                    self.report({'INFO'}, f"Unmarked face {face_idx} on {obj.name}")
-                else:
-                    self.marked_faces[obj].add(face_idx)
-                    mark_face(obj, face_idx)
-                    # Note: mark_face helper might use default rebuilding without depsgraph?
-                    # mark_face calls mark_faces_batch. core.py: mark_face(obj, face_index)
-                    # I didn't update mark_face signature in core.py.
-                    # But I updated mark_faces_batch.
-                    # mark_face calls mark_faces_batch(obj, [face_index]).
-                    # If I use 'F' key, it calls mark_face.
-                    # So mark_face inside core.py needs update OR I should call rebuild here directly like "delete" block does.
-                    # Since I can't easily update mark_face in core.py now (too many edits), I should explicitly call rebuild here:
-                    rebuild_marked_faces_visual_data(obj, self.marked_faces[obj], use_depsgraph=self.use_depsgraph)
-
-                    self.report({'INFO'}, f"Marked face {face_idx} on {obj.name}")
-                
-                # Update bbox preview based on marked faces and points
-                cursor_rotation = get_cursor_rotation_euler(context)
-                update_marked_faces_bbox(self.marked_faces, self.push_value, 
-                                       context.scene.cursor.location, 
-                                       cursor_rotation,
-                                       marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
-            
-            return {'RUNNING_MODAL'}
-        
-        elif event.type == 'A' and event.value == 'PRESS' and not event.ctrl:
-            self.point_mode = not self.point_mode
-            if self.point_mode:
-                self.report({'INFO'}, "Entered Add Point Mode")
-                self.current_face_data = None
-                clear_preview_faces()
-            else:
-                self.report({'INFO'}, "Exited Add Point Mode")
-                clear_preview_point()
-                clear_snap_targets_preview()
-                self.limit_plane_mode = False
-                clear_limitation_plane()
-                disable_limitation_plane(context) # Ensure visual is off
-                self.cached_limit_intersections = []
-            
-            context.area.tag_redraw()
-            return {'RUNNING_MODAL'}
-        
-        elif event.type == 'Z' and event.value == 'PRESS':
-            # Clear all marked faces and points
-            if self.marked_faces or self.marked_points:
-                self._push_undo()
-                clear_all_markings()  # Clear global state
-                clear_preview_faces()
-                self.marked_faces.clear()  # Clear local state
-                self.marked_points.clear()  # Clear local state
-                self.report({'INFO'}, "Cleared all marked faces and points")
-                # Reset to regular object bbox preview
-                result = place_cursor_with_raycast_and_edge(
-                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph
-                )
-                context.area.tag_redraw()
-            
-            return {'RUNNING_MODAL'}
-        
-        elif event.type == 'WHEELUPMOUSE' and event.alt:
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
+        # Edge selection on the hovered face (Alt + Scroll)
+        if etype == 'WHEELUPMOUSE' and alt:
+            face_data = self._raycast(context, event)
+            if face_data and self._is_target(face_data['object']):
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, 1, self.current_edge_index
                 )
                 result = place_cursor_with_raycast_and_edge(
-                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph
+                    context, event, self.align_to_face, self.current_edge_index,
+                    use_depsgraph=self.use_depsgraph, face_data=face_data
                 )
                 if result['success']:
                     # Update preview with marked faces and points if any
                     if self.marked_faces or self.marked_points:
-                        cursor_rotation = get_cursor_rotation_euler(context)
-                        update_marked_faces_bbox(self.marked_faces, self.push_value,
-                                               context.scene.cursor.location,
-                                               cursor_rotation,
-                                               marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                    context.area.tag_redraw()
+                        self._bbox_dirty = True
+                    self._redraw_pending = True
             return {'RUNNING_MODAL'}
         
-        elif event.type == 'WHEELDOWNMOUSE' and event.alt:
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
+        if etype == 'WHEELDOWNMOUSE' and alt:
+            face_data = self._raycast(context, event)
+            if face_data and self._is_target(face_data['object']):
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, -1, self.current_edge_index
                 )
                 result = place_cursor_with_raycast_and_edge(
-                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph
+                    context, event, self.align_to_face, self.current_edge_index,
+                    use_depsgraph=self.use_depsgraph, face_data=face_data
                 )
                 if result['success']:
                     # Update preview with marked faces and points if any
                     if self.marked_faces or self.marked_points:
-                        cursor_rotation = get_cursor_rotation_euler(context)
-                        update_marked_faces_bbox(self.marked_faces, self.push_value,
-                                               context.scene.cursor.location,
-                                               cursor_rotation,
-                                               marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                    context.area.tag_redraw()
-            return {'RUNNING_MODAL'}
-        
-        elif event.type == 'MOUSEMOVE':
-            if self.point_mode:
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                current_loc = None
-                
-                if self.snap_enabled:
-                    # Snap Logic - use intersection points if limit plane mode is enabled
-                    intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
-                    snap_result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, intersection_points=intersection_pts, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
-                    if snap_result['success']:
-                        current_loc = context.scene.cursor.location.copy()
-                    else:
-                        # Fallback to normal raycast alignment
-                        result = place_cursor_with_raycast_and_edge(
-                           context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-                        )
-                        if result['success']:
-                            current_loc = result['location']
-                        else:
-                            current_loc = None
-                elif self.limit_plane_mode and self.limitation_plane_matrix and face_data:
-                     # Limit Plane Mode (no snap)
-                     plane_origin = self.limitation_plane_matrix.to_translation()
-                     plane_normal = self.limitation_plane_matrix.col[2].to_3d() # Z axis
-                     
-                     proj_pt = project_point_to_plane_intersection(
-                         face_data['hit_location'], 
-                         face_data['face_normal'],
-                         plane_origin, 
-                         plane_normal
-                     )
-                     
-                     if proj_pt:
-                         current_loc = proj_pt
-                     else:
-                         current_loc = None
-                else:
-                    # Standard raycast alignment (updates cursor location and rotation)
-                    result = place_cursor_with_raycast_and_edge(
-                        context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-                    )
-                    if result['success']:
-                        current_loc = result['location']
-                    else:
-                        current_loc = None
-                
-                if current_loc:
-                    update_preview_point(current_loc)
-                else:
-                    clear_preview_point()
-                if self.snap_enabled and (face_data or (self.limit_plane_mode and self.cached_limit_intersections)):
-                    intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
-                    update_snap_targets_preview(face_data, self.snap_mode, intersection_points=intersection_pts)
-                else:
-                    clear_snap_targets_preview()
-                
-                context.area.tag_redraw()
-                return {'RUNNING_MODAL'}
-            
-            # Normal MOUSEMOVE
-            result = place_cursor_with_raycast_and_edge(
-                context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-            )
-            if result['success'] and result['face_data']['object'] in self.original_selected_objects:
-                self.current_face_data = result['face_data']
-                
-                # Update Preview Faces
-                obj = result['face_data']['object']
-                face_idx = result['face_data']['face_index']
-                
-                faces_to_preview = get_faces_to_process(
-                    obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                    context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
-                )
-                
-                update_preview_faces(obj, faces_to_preview, use_depsgraph=self.use_depsgraph)
-
-                # Update bbox preview - show marked faces and points bbox if any, otherwise object bbox
-                if self.marked_faces or self.marked_points:
-                    # Update preview with marked faces and points
-                    cursor_rotation = get_cursor_rotation_euler(context)
-                    update_marked_faces_bbox(self.marked_faces, self.push_value,
-                                           context.scene.cursor.location,
-                                           cursor_rotation,
-                                           marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
-            else:
-                clear_preview_faces()
-                self.current_face_data = None
-                
-            return {'RUNNING_MODAL'}
-        
-        elif event.type == 'S' and event.value == 'PRESS':
-            if self.point_mode:
-                self.snap_enabled = not self.snap_enabled
-                if not self.snap_enabled:
-                    clear_snap_targets_preview()
-                state_str = "ON" if self.snap_enabled else "OFF"
-                self.report({'INFO'}, f"Point Snap: {state_str} (Threshold: {self.snap_threshold}px)")
-            else:
-                # Snap cursor to closest vertex, edge midpoint, or face center from current face
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
-                if result['success'] and (not face_data or face_data['object'] in self.original_selected_objects):
-                    if face_data:
-                        self.report({'INFO'}, f"Cursor snapped to {result['type']} on {face_data['object'].name} ({result['distance']:.1f}px away)")
-                    else:
-                        self.report({'INFO'}, f"Cursor snapped to {result['type']} ({result['distance']:.1f}px away)")
-                    # Update bbox preview after cursor snap
-                    if self.marked_faces or self.marked_points:
-                        cursor_rotation = get_cursor_rotation_euler(context)
-                        update_marked_faces_bbox(self.marked_faces, self.push_value,
-                                               context.scene.cursor.location,
-                                               cursor_rotation,
-                                               marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                    context.area.tag_redraw()
-                else:
-                    self.report({'WARNING'}, "No suitable snap target found")
+                        self._bbox_dirty = True
+                    self._redraw_pending = True
             return {'RUNNING_MODAL'}
-        
 
         return {'RUNNING_MODAL'}
     
@@ -1035,14 +1138,30 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
         self.push_value = context.scene.cursor_bbox_push
         self.align_to_face = context.scene.cursor_bbox_align_face
         self.marked_faces = {}
-        self.marked_points = []
+        self.marked_points = MarkedPointBuffer()
         self.point_mode = False
         self.snap_enabled = True
         self.snap_mode = 1
         self.limit_plane_mode = False
-        self.limitation_plane_matrix = None
+        self._set_limitation_plane(None)
         self.instance_data = {}
         self.undo_stack = OperatorUndoStack()
+        self._bbox_dirty = False
+        self._bbox_timer = None
+        self._pending_mouse = None
+        self._redraw_pending = False
+        self._last_hover_key = None
+        self._last_preview_key = None
+        self._rebuild_queue = []
+        self._marks_soa = None
+        self._mark_world_cache = {}
+        self._last_cursor_sig = None
+        self._last_cursor_rot = None
+        self._last_bbox_sig = None
+        self._last_rc = None
+        self._last_snap = None
+        # Meshes may have been edited since the last session
+        clear_coplanar_cache()
 
         # Get use_depsgraph from preferences
         prefs = get_preferences()
@@ -1050,6 +1169,8 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
             self.use_depsgraph = prefs.use_depsgraph
         else:
             self.use_depsgraph = True # Default fallback
+        # Bbox display settings do not change while the modal runs
+        self._show_wire, self._show_all_edges = get_bbox_display_prefs(prefs)
 
         # Check for immediate execution in Edit Mode
         if context.mode == 'EDIT_MESH':
@@ -1059,7 +1180,9 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
                 active_obj = context.active_object
                 # Switch to Object Mode to allow object creation and selection operations
                 bpy.ops.object.mode_set(mode='OBJECT')
-                if create_bounding_box_from_marked(self.marked_faces, self.marked_points, self.push_value, select_new_object=False):
+                if create_bounding_box_from_marked(self.marked_faces, self.marked_points.array, self.push_value, select_new_object=False,
+                                                   show_wire=self._show_wire, show_all_edges=self._show_all_edges,
+                                                   cursor_rotation=self._cursor_rotation(context)):
                     # Restore Edit Mode
                     if active_obj:
                         context.view_layer.objects.active = active_obj
@@ -1106,12 +1229,18 @@ class CursorBBox_OT_interactive_box(bpy.types.Operator):
                     # Add real objects
                     for real_obj in real_objs:
                         self.original_selected_objects.add(real_obj)
+            self._original_ptrs = frozenset(
+                o.as_pointer() for o in self.original_selected_objects)
                 
             clear_preview_faces()
             enable_edge_highlight()
             enable_bbox_preview()
             enable_face_marking()
             self._setup_hud(context)
+            # ~60 Hz tick for the coalesced hover and the debounced bbox
+            # preview (see _flush_bbox_update)
+            self._bbox_timer = context.window_manager.event_timer_add(1 / 60, window=context.window)
+            enable_bvh_cache()
             context.window_manager.modal_handler_add(self)
             return {'RUNNING_MODAL'}
         else:
@@ -7,6 +7,8 @@ from ..functions.utils import (
     restore_selection_state,
     set_cursor_rotation_to_principal_plane,
     CURSOR_PLANE_ALIGNMENTS,
+    SNAP_MODE_NAMES,
+    MouseSample,
     get_face_edges_from_raycast,
     select_edge_by_scroll,
     place_cursor_with_raycast_and_edge,
@@ -22,6 +24,10 @@ from ..functions.utils import (
     get_selected_faces_from_edit_mode,
     calculate_point_location,
     get_faces_to_process,
+    clear_coplanar_cache,
+    enable_bvh_cache,
+    disable_bvh_cache,
+    get_geometry_generation,
     is_collection_instance,
     make_collection_instance_real,
     cleanup_collection_instance_temp,
@@ -39,9 +45,9 @@ from ..functions.core import (
     mark_face,
     mark_faces_batch,
     unmark_face,
-    clear_marked_faces,
     update_marked_faces_bbox,
     rebuild_marked_faces_visual_data,
+    append_marked_faces_visual,
     add_marked_point,
     clear_marked_points,
     clear_all_markings,
@@ -49,6 +55,7 @@ from ..functions.core import (
     update_marked_faces_convex_hull,
     update_preview_faces,
     clear_preview_faces,
+    has_preview_faces,
     toggle_backface_rendering,
     toggle_backface_rendering,
     get_backface_rendering,
@@ -441,11 +448,15 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
     # Limitation Plane State
     limit_plane_mode = False
     limitation_plane_matrix = None
+    _plane_origin = None
+    _plane_normal = None
     cached_limit_intersections = []
+    _limit_cache = None
     
     marked_faces = {}
     marked_points = []
     original_selected_objects = set()
+    _original_ptrs = frozenset()  # as_pointer() of original_selected_objects
     use_depsgraph = False
     
     # Collection instance handling
@@ -517,12 +528,107 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 use_depsgraph=self.use_depsgraph)
         else:
             clear_preview_faces()
-        if context.area is not None:
-            context.area.tag_redraw()
+        self._redraw_pending = True
 
     def _push_undo(self):
         self.undo_stack.push(self._snapshot())
 
+    def _is_target(self, obj):
+        """Whether a raycast hit belongs to the objects the tool was started on.
+
+        Compares datablock pointers: raycasts hand back fresh Python wrappers,
+        so set membership would hash through RNA.
+        """
+        return obj.as_pointer() in self._original_ptrs
+
+    def _set_limitation_plane(self, matrix):
+        """Store the limitation plane with its origin and normal.
+
+        Limit-plane mouse moves read the origin and normal every event; they
+        only change when the plane is redefined, so derive them here once.
+        matrix may be the live cursor matrix: it is copied only when it
+        differs from the stored plane, as R/E/C usually re-set the same one.
+        """
+        if matrix is None:
+            self.limitation_plane_matrix = None
+            self._plane_origin = self._plane_normal = None
+            return
+        if self.limitation_plane_matrix is not None and matrix == self.limitation_plane_matrix:
+            return
+        self.limitation_plane_matrix = matrix.copy()
+        self._plane_origin = matrix.to_translation()
+        self._plane_normal = matrix.col[2].to_3d()
+
+    def _refresh_limit_intersections(self, context):
+        """Recompute cached_limit_intersections for the current limitation plane.
+
+        R and E re-define the plane on every press, usually to where it
+        already was; the BVH-scale edge walk is only redone when the plane
+        (to 1e-6) or the objects it cuts have actually changed.
+        """
+        if self.marked_faces:
+            objects = self.marked_faces.keys()
+        elif context.active_object and context.active_object.type == 'MESH':
+            objects = [context.active_object]
+        else:
+            objects = []
+        origin = self._plane_origin
+        normal = self._plane_normal
+        key = (
+            origin.to_tuple(6), normal.to_tuple(6),
+            tuple(o.as_pointer() for o in objects), bool(self.marked_faces),
+            self.use_depsgraph,
+        )
+        if self._limit_cache is not None and self._limit_cache[0] == key:
+            self.cached_limit_intersections = self._limit_cache[1]
+            return
+
+        if not objects:
+            result = []
+        elif self.marked_faces:
+            result = calculate_plane_edge_intersections_multi(
+                objects, origin, normal, use_depsgraph=self.use_depsgraph
+            )
+        else:
+            result = calculate_plane_edge_intersections(
+                objects[0], origin, normal, use_depsgraph=self.use_depsgraph
+            )
+        self._limit_cache = (key, result)
+        self.cached_limit_intersections = result
+
+    def _raycast_key(self, event):
+        return (event.mouse_region_x, event.mouse_region_y, self.use_depsgraph)
+
+    def _raycast(self, context, event):
+        """Face under the mouse, reusing the hover raycast if the mouse has
+        not moved since (clicks land on the last hovered position)."""
+        key = self._raycast_key(event)
+        if self._last_rc is not None and self._last_rc[0] == key:
+            return self._last_rc[1]
+        face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        self._last_rc = (key, face_data)
+        return face_data
+
+    def _snap(self, context, event, face_data, intersection_pts):
+        """Snap the cursor near the mouse, reusing the last search while the
+        mouse, the hovered face and the snap settings are unchanged."""
+        key = (self._raycast_key(event), self.snap_threshold, self.snap_mode)
+        last = self._last_snap
+        # Face data and intersection points are compared by identity: a new
+        # raycast or limit plane result is always a new object
+        if (last is not None and last[0] == key
+                and last[1] is face_data and last[2] is intersection_pts):
+            snap_result = last[3]
+            if snap_result['success']:
+                context.scene.cursor.location = snap_result['location']
+            return snap_result
+        snap_result = snap_cursor_to_closest_element(
+            context, event, face_data, threshold=self.snap_threshold,
+            intersection_points=intersection_pts, use_depsgraph=self.use_depsgraph,
+            snap_mode=self.snap_mode)
+        self._last_snap = (key, face_data, intersection_pts, snap_result)
+        return snap_result
+
     def _setup_hud(self, context):
         """Build the HUDOverlay + HelpOverlay shown while this modal runs."""
         self.hud_ctl = HUDController("interactive_hull", "Interactive Hull")
@@ -561,8 +667,6 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             HUDItem("Reset to 0", "R"),
             HUDItem("Exit thickness mode", "T"),
         ]))
-        from ..functions.utils import CURSOR_PLANE_ALIGNMENTS as _PLANES
-        _mode_names = ("All", "Vert", "Edge", "Face")
 
         def _mode_str():
             if self.point_mode:
@@ -602,7 +706,7 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Snap mode",
-            lambda: _mode_names[self.snap_mode],
+            lambda: SNAP_MODE_NAMES[self.snap_mode],
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Snap threshold px",
@@ -611,7 +715,7 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Cursor plane",
-            lambda: _PLANES[self.cursor_plane_align],
+            lambda: CURSOR_PLANE_ALIGNMENTS[self.cursor_plane_align],
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Limit plane",
@@ -626,17 +730,160 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             visible_getter=lambda: self.thickness_mode))
         self.hud_ctl.attach(context)
 
+    def _on_mousemove(self, context, event):
+        """Update the hover preview for the face or point under the mouse."""
+        # Thickness mode: when From Cursor ON, preview follows cursor; else use manual value
+        if self.thickness_mode and not self.point_mode:
+            cursor_loc = context.scene.cursor.location.copy()
+            self._thickness_cursor_value = compute_thickness_selection_to_cursor(
+                self.marked_faces, cursor_loc, use_depsgraph=self.use_depsgraph
+            )
+            if self.thickness_from_cursor:
+                self.face_thickness = self._thickness_cursor_value
+            update_marked_faces_convex_hull(
+                self.marked_faces, self.push_value,
+                marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
+                face_thickness=self._get_preview_thickness()
+            )
+            self._redraw_pending = True
+            return {'RUNNING_MODAL'}
+        if self.point_mode:
+            face_data = self._raycast(context, event)
+            current_loc = None
+
+            if self.snap_enabled:
+                # Snap Logic - use intersection points if limit plane mode is enabled
+                intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
+                snap_result = self._snap(context, event, face_data, intersection_pts)
+                if snap_result['success']:
+                    current_loc = context.scene.cursor.location.copy()
+                else:
+                    # Fallback to raycast placement if no snap
+                    result = place_cursor_with_raycast_and_edge(
+                       context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph, face_data=face_data
+                    )
+                    if result['success']:
+                        current_loc = result['location']
+                    else:
+                        current_loc = None
+            elif self.limit_plane_mode and self.limitation_plane_matrix and face_data:
+                 # Limit Plane Mode (no snap)
+                 plane_origin = self._plane_origin
+                 plane_normal = self._plane_normal # Z axis
+
+                 proj_pt = project_point_to_plane_intersection(
+                     face_data['hit_location'], 
+                     face_data['face_normal'],
+                     plane_origin, 
+                     plane_normal
+                 )
+
+                 if proj_pt:
+                     current_loc = proj_pt
+                 else:
+                     current_loc = None
+            else:
+                # Standard raycast placement (location + rotation)
+                result = place_cursor_with_raycast_and_edge(
+                    context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph, face_data=face_data
+                )
+                if result['success']:
+                     current_loc = result['location']
+                else:
+                     current_loc = None
+
+            if current_loc:
+                update_preview_point(current_loc)
+            else:
+                clear_preview_point()
+            if self.snap_enabled and (face_data or (self.limit_plane_mode and self.cached_limit_intersections)):
+                intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
+                update_snap_targets_preview(face_data, self.snap_mode, intersection_points=intersection_pts)
+            else:
+                clear_snap_targets_preview()
+
+            self._redraw_pending = True
+            return {'RUNNING_MODAL'}
+
+        # Normal Hover Logic (preview uses current thickness for hull preview)
+        face_data = self._raycast(context, event)
+        if face_data and self._is_target(face_data['object']):
+            obj = face_data['object']
+            face_idx = face_data['face_index']
+
+            # Re-hovering the same face with the same settings (and unchanged
+            # geometry) would rebuild an identical preview; skip it while that
+            # preview is still shown
+            scene = context.scene
+            # Scene properties are RNA reads; take each once per hover
+            use_coplanar = scene.cursor_bbox_select_coplanar
+            coplanar_angle = scene.cursor_bbox_coplanar_angle
+            hover_key = (obj.as_pointer(), face_idx, use_coplanar,
+                         round(coplanar_angle, 4), self.use_depsgraph,
+                         get_geometry_generation())
+            if hover_key != self._last_hover_key or not has_preview_faces():
+                self._last_hover_key = hover_key
+                faces_to_preview = get_faces_to_process(
+                    obj, face_idx, use_coplanar,
+                    coplanar_angle, use_depsgraph=self.use_depsgraph
+                )
+                # Moving between faces of one coplanar region yields the same
+                # face set; only rebuild the preview triangles when it differs
+                preview_key = (obj.as_pointer(), self.use_depsgraph, faces_to_preview, hover_key[-1])
+                if preview_key != self._last_preview_key or not has_preview_faces():
+                    self._last_preview_key = preview_key
+                    update_preview_faces(obj, faces_to_preview, use_depsgraph=self.use_depsgraph)
+            self._redraw_pending = True
+        else:
+            clear_preview_faces()
+            self._redraw_pending = True
+
+        return {'RUNNING_MODAL'}
+
+    def _remove_hover_timer(self, context):
+        if self._hover_timer is not None:
+            context.window_manager.event_timer_remove(self._hover_timer)
+            self._hover_timer = None
+
     def modal(self, context, event):
+        # Debounce tick: run the latest coalesced mouse move, so hover work
+        # happens at most once per timer interval however fast events come.
+        if event.type == 'TIMER':
+            if self._pending_mouse is not None:
+                sample, self._pending_mouse = self._pending_mouse, None
+                self._on_mousemove(context, sample)
+            # Handlers only flag a redraw; issue at most one per tick
+            if self._redraw_pending and context.area is not None:
+                context.area.tag_redraw()
+                self._redraw_pending = False
+            return {'PASS_THROUGH'}
+
         # HUD: capture event for cursor-follow + forward toggle/drag events.
+        # Its redraw joins the coalesced one issued on the timer tick.
         if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
-            self.hud_ctl.update_event(event, context)
+            self.hud_ctl.update_event(event, context, redraw=False)
+            self._redraw_pending = True
             if self.hud_ctl.handle_events(context, event):
                 return {'RUNNING_MODAL'}
 
+        # Mouse motion is by far the most frequent event and can arrive many
+        # times per frame; only remember the latest position here and let
+        # the timer tick do the raycast/preview work once.
+        if event.type == 'MOUSEMOVE':
+            self._pending_mouse = MouseSample(event)
+            return {'RUNNING_MODAL'}
+
+        # Each event attribute read is an RNA lookup; the checks below
+        # test them many times over, so read them once
+        etype = event.type
+        evalue = event.value
+        shift, ctrl, alt = event.shift, event.ctrl, event.alt
+        scene = context.scene
+
         # Undo / Redo (Ctrl+Z / Ctrl+Shift+Z)
-        if (event.type == 'Z' and event.value == 'PRESS'
-                and event.ctrl and not event.alt):
-            if event.shift:
+        if (etype == 'Z' and evalue == 'PRESS'
+                and ctrl and not alt):
+            if shift:
                 snap = self.undo_stack.pop_redo(self._snapshot())
                 if snap is not None:
                     self._restore_snapshot(snap, context)
@@ -653,8 +900,8 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             return {'RUNNING_MODAL'}
 
         # Mark all polygons of all selected objects (Ctrl+A)
-        if (event.type == 'A' and event.value == 'PRESS'
-                and event.ctrl and not self.point_mode):
+        if (etype == 'A' and evalue == 'PRESS'
+                and ctrl and not self.point_mode):
             self._push_undo()
             self.marked_faces = build_all_faces_dict(
                 self.original_selected_objects, use_depsgraph=self.use_depsgraph)
@@ -668,30 +915,30 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 face_thickness=self._get_preview_thickness())
             total = sum(len(v) for v in self.marked_faces.values())
             self.report({'INFO'}, f"Marked all polygons ({total}) of selected objects")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Snap mode 1=Vertex, 2=Edge, 3=Face (point mode only)
-        if self.point_mode and event.value == 'PRESS':
-            if event.type in ('ONE', 'NUMPAD_1'):
+        if self.point_mode and evalue == 'PRESS':
+            if etype in ('ONE', 'NUMPAD_1'):
                 self.snap_mode = 1
                 self.report({'INFO'}, "Snap: Vertex only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type in ('TWO', 'NUMPAD_2'):
+            if etype in ('TWO', 'NUMPAD_2'):
                 self.snap_mode = 2
                 self.report({'INFO'}, "Snap: Edge only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type in ('THREE', 'NUMPAD_3'):
+            if etype in ('THREE', 'NUMPAD_3'):
                 self.snap_mode = 3
                 self.report({'INFO'}, "Snap: Face only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
 
         # Thickness mode: C = toggle From Cursor (use cursor for preview or manual), R = reset to 0
-        if self.thickness_mode and not self.point_mode and event.value == 'PRESS':
-            if event.type == 'C':
+        if self.thickness_mode and not self.point_mode and evalue == 'PRESS':
+            if etype == 'C':
                 self.thickness_from_cursor = not getattr(self, 'thickness_from_cursor', False)
                 state = "ON" if self.thickness_from_cursor else "OFF"
                 self.report({'INFO'}, f"From Cursor: {state}")
@@ -700,9 +947,9 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
                     face_thickness=self._get_preview_thickness()
                 )
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type == 'R':
+            if etype == 'R':
                 # Reset thickness to 0
                 self.face_thickness = 0.0
                 self._thickness_cursor_value = 0.0
@@ -712,38 +959,27 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
                     face_thickness=0.0
                 )
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
 
         # Reset cursor rotation to principal plane (R) - point mode only
-        if self.point_mode and event.type == 'R' and event.value == 'PRESS':
+        if self.point_mode and etype == 'R' and evalue == 'PRESS':
             self.cursor_plane_align = (self.cursor_plane_align + 1) % 3
             plane = CURSOR_PLANE_ALIGNMENTS[self.cursor_plane_align]
             set_cursor_rotation_to_principal_plane(context, plane)
             if self.limit_plane_mode:
-                self.limitation_plane_matrix = context.scene.cursor.matrix.copy()
+                self._set_limitation_plane(scene.cursor.matrix)
                 update_limitation_plane(self.limitation_plane_matrix)
-                origin = self.limitation_plane_matrix.to_translation()
-                normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                self.cached_limit_intersections = []
-                if self.marked_faces:
-                    objects = list(self.marked_faces.keys())
-                    self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                        objects, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
-                elif context.active_object and context.active_object.type == 'MESH':
-                    self.cached_limit_intersections = calculate_plane_edge_intersections(
-                        context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
+                self._refresh_limit_intersections(context)
             self.report({'INFO'}, f"Cursor: {plane}")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # E: Set cursor location only (to current hover/snap position) and update limitation plane
-        if self.point_mode and event.type == 'E' and event.value == 'PRESS':
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        if self.point_mode and etype == 'E' and evalue == 'PRESS':
+            face_data = self._raycast(context, event)
             if face_data:
-                cursor = context.scene.cursor
+                cursor = scene.cursor
                 if self.snap_enabled:
                     intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
                     snap_result = snap_cursor_to_closest_element(
@@ -753,8 +989,8 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     if not snap_result['success']:
                         cursor.location = face_data['hit_location'].copy()
                 elif self.limit_plane_mode and self.limitation_plane_matrix:
-                    plane_origin = self.limitation_plane_matrix.to_translation()
-                    plane_normal = self.limitation_plane_matrix.col[2].to_3d()
+                    plane_origin = self._plane_origin
+                    plane_normal = self._plane_normal
                     proj_pt = project_point_to_plane_intersection(
                         face_data['hit_location'], face_data['face_normal'], plane_origin, plane_normal
                     )
@@ -765,60 +1001,38 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 else:
                     cursor.location = face_data['hit_location'].copy()
                 if self.limit_plane_mode:
-                    self.limitation_plane_matrix = cursor.matrix.copy()
+                    self._set_limitation_plane(cursor.matrix)
                     update_limitation_plane(self.limitation_plane_matrix)
-                    origin = self.limitation_plane_matrix.to_translation()
-                    normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                    self.cached_limit_intersections = []
-                    if self.marked_faces:
-                        objects = list(self.marked_faces.keys())
-                        self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                            objects, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
-                    elif context.active_object and context.active_object.type == 'MESH':
-                        self.cached_limit_intersections = calculate_plane_edge_intersections(
-                            context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
+                    self._refresh_limit_intersections(context)
                 self.report({'INFO'}, "Cursor location updated")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Limit Plane Toggle (C) - Point Mode Only
-        if self.point_mode and event.type == 'C' and event.value == 'PRESS':
+        if self.point_mode and etype == 'C' and evalue == 'PRESS':
              self.limit_plane_mode = not self.limit_plane_mode
              if self.limit_plane_mode:
                  # Always align limitation plane to cursor when pressing C
-                 self.limitation_plane_matrix = context.scene.cursor.matrix.copy()
+                 self._set_limitation_plane(scene.cursor.matrix)
                  update_limitation_plane(self.limitation_plane_matrix)
                  enable_limitation_plane(context, self.limitation_plane_matrix)
-                 self.cached_limit_intersections = []
-                 origin = self.limitation_plane_matrix.to_translation()
-                 normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                 if self.marked_faces:
-                     objects = list(self.marked_faces.keys())
-                     self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                         objects, origin, normal, use_depsgraph=self.use_depsgraph
-                     )
-                 elif context.active_object and context.active_object.type == 'MESH':
-                     self.cached_limit_intersections = calculate_plane_edge_intersections(
-                         context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                     )
+                 self._refresh_limit_intersections(context)
                  self.report({'INFO'}, f"Limitation Plane ON | {len(self.cached_limit_intersections)} pts")
              else:
-                 self.limitation_plane_matrix = None
+                 self._set_limitation_plane(None)
                  clear_limitation_plane()
                  disable_limitation_plane(context)
                  self.cached_limit_intersections = []
                  self.report({'INFO'}, "Limitation Plane OFF")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
         
         # Toggle Thickness Mode (T) - like point mode: dedicated mode, preview from cursor
-        if not self.point_mode and event.type == 'T' and event.value == 'PRESS':
+        if not self.point_mode and etype == 'T' and evalue == 'PRESS':
             self.thickness_mode = not self.thickness_mode
             if self.thickness_mode:
                 # Enter: update cursor-based value (preview uses it only if From Cursor is ON)
-                cursor_loc = context.scene.cursor.location.copy()
+                cursor_loc = scene.cursor.location.copy()
                 self._thickness_cursor_value = compute_thickness_selection_to_cursor(
                     self.marked_faces, cursor_loc, use_depsgraph=self.use_depsgraph
                 )
@@ -835,11 +1049,11 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
                 face_thickness=eff
             )
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Toggle Depsgraph (D)
-        if event.type == 'D' and event.value == 'PRESS':
+        if etype == 'D' and evalue == 'PRESS':
             self.use_depsgraph = not self.use_depsgraph
             # Rebuild visuals with new setting
             for obj, faces in self.marked_faces.items():
@@ -862,37 +1076,37 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             # For now let's pass it if possible, but python will error if sig mismatch.
             # So I will edit `core.py` next for `update_marked_faces_convex_hull`.
             self.report({'INFO'}, f"Depsgraph: {'ON' if self.use_depsgraph else 'OFF'}")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Toggle Backface Rendering (P)
-        elif event.type == 'P' and event.value == 'PRESS':
+        elif etype == 'P' and evalue == 'PRESS':
              new_state = toggle_backface_rendering()
              state_str = "ON" if new_state else "OFF"
              self.report({'INFO'}, f"Backface Rendering: {state_str}")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
              
         # Toggle Preview Culling (O)
-        elif event.type == 'O' and event.value == 'PRESS':
+        elif etype == 'O' and evalue == 'PRESS':
              new_state = toggle_preview_culling()
              state_str = "ON" if new_state else "OFF"
              self.report({'INFO'}, f"Preview Culling: {state_str}")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
              
-        elif event.type == 'S' and event.value == 'PRESS':
+        elif etype == 'S' and evalue == 'PRESS':
             if self.point_mode:
                 self.snap_enabled = not self.snap_enabled
                 if not self.snap_enabled:
                     clear_snap_targets_preview()
                 state_str = "ON" if self.snap_enabled else "OFF"
                 self.report({'INFO'}, f"Point Snap: {state_str}")
-                context.area.tag_redraw()
+                self._redraw_pending = True
             return {'RUNNING_MODAL'}
              
         # Coplanar Angle Presets (1-7)
-        elif event.type in {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN'} and event.value == 'PRESS':
+        elif etype in {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN'} and evalue == 'PRESS':
              angle_map = {
                  'ONE': 5,
                  'TWO': 15,
@@ -902,70 +1116,74 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                  'SIX': 120,
                  'SEVEN': 180
              }
-             new_angle = angle_map[event.type]
-             context.scene.cursor_bbox_coplanar_angle = radians(new_angle)
+             new_angle = angle_map[etype]
+             scene.cursor_bbox_coplanar_angle = radians(new_angle)
              self.report({'INFO'}, f"Coplanar Angle Set: {new_angle}°")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
 
         # Coplanar Angle Adjustment (Shift + Scroll)
-        if event.shift and event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
-            current_deg = degrees(context.scene.cursor_bbox_coplanar_angle)
+        if shift and etype in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            current_deg = degrees(scene.cursor_bbox_coplanar_angle)
             
             # Determine step size: 1 degree if Ctrl is held, otherwise 5 degrees
-            step = 1 if event.ctrl else 5
+            step = 1 if ctrl else 5
             
-            if event.type == 'WHEELUPMOUSE':
+            if etype == 'WHEELUPMOUSE':
                 new_angle_deg = current_deg + step
             else:
                 new_angle_deg = current_deg - step
                 
             # Clamp and set
             new_angle_deg = max(0.0, min(180.0, new_angle_deg))
-            context.scene.cursor_bbox_coplanar_angle = radians(new_angle_deg)
+            scene.cursor_bbox_coplanar_angle = radians(new_angle_deg)
             
             self.report({'INFO'}, f"Coplanar Angle: {int(round(new_angle_deg))}°")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Thickness Adjustment (Alt + Scroll) - when thickness mode is on
-        if self.thickness_mode and not self.point_mode and event.alt and not event.ctrl and not event.shift:
-            if event.type == 'WHEELUPMOUSE':
+        if self.thickness_mode and not self.point_mode and alt and not ctrl and not shift:
+            if etype == 'WHEELUPMOUSE':
                 self.face_thickness += 0.02
                 self._thickness_cursor_value = self.face_thickness
                 self.report({'INFO'}, f"Thickness: {self.face_thickness:.3f}")
-            elif event.type == 'WHEELDOWNMOUSE':
+            elif etype == 'WHEELDOWNMOUSE':
                 self.face_thickness -= 0.02
                 self._thickness_cursor_value = self.face_thickness
                 self.report({'INFO'}, f"Thickness: {self.face_thickness:.3f}")
-            if event.type in ('WHEELUPMOUSE', 'WHEELDOWNMOUSE'):
+            if etype in ('WHEELUPMOUSE', 'WHEELDOWNMOUSE'):
                 update_marked_faces_convex_hull(
                     self.marked_faces, self.push_value,
                     marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
                     face_thickness=self.face_thickness
                 )
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
 
         # Snap Threshold Adjustment (Ctrl + Scroll) - Must be before navigation pass-through
-        if event.ctrl and not event.shift and not event.alt:
-            if event.type == 'WHEELUPMOUSE':
+        if ctrl and not shift and not alt:
+            if etype == 'WHEELUPMOUSE':
                 self.snap_threshold += 10
                 self.report({'INFO'}, f"Snap Threshold: {self.snap_threshold}px")
-                context.area.tag_redraw()
-            elif event.type == 'WHEELDOWNMOUSE':
+                self._redraw_pending = True
+            elif etype == 'WHEELDOWNMOUSE':
                 self.snap_threshold = max(10, self.snap_threshold - 10)
                 self.report({'INFO'}, f"Snap Threshold: {self.snap_threshold}px")
-                context.area.tag_redraw()
+                self._redraw_pending = True
             
             return {'RUNNING_MODAL'}
 
         # Navigation (Pass through unless Shift is held for angle adjustment or Ctrl for snap threshold)
-        if event.type == 'MIDDLEMOUSE' or (event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and not event.shift and not event.ctrl):
+        # (the view changes under the mouse, so the cached raycast no longer applies)
+        if etype == 'MIDDLEMOUSE' or (etype in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and not shift and not ctrl):
+            self._last_rc = None
             return {'PASS_THROUGH'}
             
         # G: Create convex hull for each object in selection
-        if event.type == 'G' and event.value == 'PRESS':
+        if etype == 'G' and evalue == 'PRESS':
+            # The new hulls may now be what lies under the mouse
+            self._last_rc = None
             mesh_objects = [o for o in context.selected_objects if o.type == 'MESH']
             if not mesh_objects:
                 self.report({'WARNING'}, "No mesh objects in selection")
@@ -984,11 +1202,12 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 self.report({'INFO'}, f"Created {len(created)} convex hull(s)")
             else:
                 self.report({'WARNING'}, "Failed to create convex hulls")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # L: Create convex hull per island (loose part) for each selected object
-        if event.type == 'L' and event.value == 'PRESS':
+        if etype == 'L' and evalue == 'PRESS':
+            self._last_rc = None
             mesh_objects = [o for o in context.selected_objects if o.type == 'MESH']
             if not mesh_objects:
                 self.report({'WARNING'}, "No mesh objects in selection")
@@ -1007,11 +1226,12 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 self.report({'INFO'}, f"Created {len(created)} island hull(s)")
             else:
                 self.report({'WARNING'}, "Failed to create convex hulls")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Create Hull (Enter/Space)
-        if event.type in {'RET', 'NUMPAD_ENTER', 'SPACE'} and event.value == 'PRESS':
+        if etype in {'RET', 'NUMPAD_ENTER', 'SPACE'} and evalue == 'PRESS':
+            self._last_rc = None
 
             if self.marked_faces or self.marked_points:
                 self._push_undo()
@@ -1026,7 +1246,7 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     self.marked_faces.clear()
                     self.marked_points.clear()
                     # Ensure preview is cleared visually
-                    context.area.tag_redraw()
+                    self._redraw_pending = True
                     return {'RUNNING_MODAL'}
                 else:
                     self.report({'WARNING'}, "Failed to create Convex Hull")
@@ -1039,11 +1259,11 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             return {'RUNNING_MODAL'}
             
         # Mark Face (LMB)
-        elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+        elif etype == 'LEFTMOUSE' and evalue == 'PRESS':
             self._push_undo()
             if self.point_mode:
                 # Add Point Logic
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+                face_data = self._raycast(context, event)
                 
                 loc, message = calculate_point_location(
                     context, event, face_data, self.snap_enabled, 
@@ -1069,16 +1289,16 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
                     face_thickness=self._get_preview_thickness()
                 )
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
 
             # In thickness mode: LMB places cursor at raycast hit; preview updates only when From Cursor is ON
             if self.thickness_mode:
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+                face_data = self._raycast(context, event)
                 if face_data:
-                    context.scene.cursor.location = face_data['hit_location'].copy()
+                    scene.cursor.location = face_data['hit_location'].copy()
                     self._thickness_cursor_value = compute_thickness_selection_to_cursor(
-                        self.marked_faces, context.scene.cursor.location, use_depsgraph=self.use_depsgraph
+                        self.marked_faces, scene.cursor.location, use_depsgraph=self.use_depsgraph
                     )
                     if self.thickness_from_cursor:
                         self.face_thickness = self._thickness_cursor_value
@@ -1088,12 +1308,12 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                         face_thickness=self._get_preview_thickness()
                     )
                     self.report({'INFO'}, f"Cursor placed | Thickness: {self._thickness_cursor_value:.3f}")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
 
             # Normal Mark Face Logic
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
+            face_data = self._raycast(context, event)
+            if face_data and self._is_target(face_data['object']):
                 obj = face_data['object']
                 face_idx = face_data['face_index']
                 
@@ -1103,39 +1323,28 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 if face_idx in self.marked_faces[obj]:
                     # Unmark logic
                     faces_to_process = get_faces_to_process(
-                        obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                        context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
+                        obj, face_idx, scene.cursor_bbox_select_coplanar,
+                        scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
                     )
 
-                    for idx in faces_to_process:
-                        if idx in self.marked_faces[obj]:
-                            self.marked_faces[obj].remove(idx)
+                    self.marked_faces[obj].difference_update(faces_to_process)
                     
                     if not self.marked_faces[obj]:
                         del self.marked_faces[obj]
-                        # Visual cleanup handled by rebuild or unmark (but unmark is single)
-                        # Rebuild is safer for batch changes
-                        # But unmark_face clears specific cache or triggers rebuild if empty.
-                        # Ideally we need batch unmark.
-                        # Let's just rebuild whole object visual
-                        clear_marked_faces() # Too aggressive? No.
-                        # We deleted the key above. So we just need to clear visuals for this obj.
-                        # rebuild_marked_faces_visual_data handles empty/deleted key too?
-                        rebuild_marked_faces_visual_data(obj, set(), use_depsgraph=self.use_depsgraph)
-                    else:
-                        rebuild_marked_faces_visual_data(obj, self.marked_faces[obj], use_depsgraph=self.use_depsgraph)
+                    # An empty set clears just this object's visual; other
+                    # objects' marks keep theirs
+                    rebuild_marked_faces_visual_data(obj, self.marked_faces.get(obj, set()), use_depsgraph=self.use_depsgraph)
                 else:
                     # Mark logic
                     faces_to_process = get_faces_to_process(
-                        obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                        context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
+                        obj, face_idx, scene.cursor_bbox_select_coplanar,
+                        scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
                     )
                          
-                    for idx in faces_to_process:
-                        self.marked_faces[obj].add(idx)
-                    
-                    # Batch update visual
-                    rebuild_marked_faces_visual_data(obj, self.marked_faces[obj], use_depsgraph=self.use_depsgraph)
+                    # Only the newly covered faces' triangles are appended
+                    added = faces_to_process - self.marked_faces[obj]
+                    self.marked_faces[obj].update(added)
+                    append_marked_faces_visual(obj, added, use_depsgraph=self.use_depsgraph)
                 
                 # Update Preview
                 update_marked_faces_convex_hull(
@@ -1144,19 +1353,19 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     face_thickness=self._get_preview_thickness()
                 )
                 
-                context.area.tag_redraw()
+                self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Toggle Coplanar Selection (C) - not in thickness mode (C handled above in thickness mode)
-        elif event.type == 'C' and event.value == 'PRESS' and not self.thickness_mode:
-            context.scene.cursor_bbox_select_coplanar = not context.scene.cursor_bbox_select_coplanar
-            state = "ON" if context.scene.cursor_bbox_select_coplanar else "OFF"
+        elif etype == 'C' and evalue == 'PRESS' and not self.thickness_mode:
+            scene.cursor_bbox_select_coplanar = not scene.cursor_bbox_select_coplanar
+            state = "ON" if scene.cursor_bbox_select_coplanar else "OFF"
             self.report({'INFO'}, f"Coplanar Selection: {state}")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Add Point Mode Toggle (A)
-        elif event.type == 'A' and event.value == 'PRESS' and not event.ctrl:
+        elif etype == 'A' and evalue == 'PRESS' and not ctrl:
             self.point_mode = not self.point_mode
             if self.point_mode:
                 self.report({'INFO'}, "Entered Add Point Mode")
@@ -1168,116 +1377,21 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                 clear_snap_targets_preview()
                 self.limit_plane_mode = False
                 clear_limitation_plane()
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
-        # Mouse Move - Update Preview (Hover)
-        elif event.type == 'MOUSEMOVE':
-            # Thickness mode: when From Cursor ON, preview follows cursor; else use manual value
-            if self.thickness_mode and not self.point_mode:
-                cursor_loc = context.scene.cursor.location.copy()
-                self._thickness_cursor_value = compute_thickness_selection_to_cursor(
-                    self.marked_faces, cursor_loc, use_depsgraph=self.use_depsgraph
-                )
-                if self.thickness_from_cursor:
-                    self.face_thickness = self._thickness_cursor_value
-                update_marked_faces_convex_hull(
-                    self.marked_faces, self.push_value,
-                    marked_points=self.marked_points, use_depsgraph=self.use_depsgraph,
-                    face_thickness=self._get_preview_thickness()
-                )
-                context.area.tag_redraw()
-                return {'RUNNING_MODAL'}
-            if self.point_mode:
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                current_loc = None
-                
-                if self.snap_enabled:
-                    # Snap Logic - use intersection points if limit plane mode is enabled
-                    intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
-                    snap_result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, intersection_points=intersection_pts, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
-                    if snap_result['success']:
-                        current_loc = context.scene.cursor.location.copy()
-                    else:
-                        # Fallback to raycast placement if no snap
-                        result = place_cursor_with_raycast_and_edge(
-                           context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-                        )
-                        if result['success']:
-                            current_loc = result['location']
-                        else:
-                            current_loc = None
-                elif self.limit_plane_mode and self.limitation_plane_matrix and face_data:
-                     # Limit Plane Mode (no snap)
-                     plane_origin = self.limitation_plane_matrix.to_translation()
-                     plane_normal = self.limitation_plane_matrix.col[2].to_3d() # Z axis
-                     
-                     proj_pt = project_point_to_plane_intersection(
-                         face_data['hit_location'], 
-                         face_data['face_normal'],
-                         plane_origin, 
-                         plane_normal
-                     )
-                     
-                     if proj_pt:
-                         current_loc = proj_pt
-                     else:
-                         current_loc = None
-                else:
-                    # Standard raycast placement (location + rotation)
-                    result = place_cursor_with_raycast_and_edge(
-                        context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-                    )
-                    if result['success']:
-                         current_loc = result['location']
-                    else:
-                         current_loc = None
-                
-                if current_loc:
-                    update_preview_point(current_loc)
-                else:
-                    clear_preview_point()
-                if self.snap_enabled and (face_data or (self.limit_plane_mode and self.cached_limit_intersections)):
-                    intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
-                    update_snap_targets_preview(face_data, self.snap_mode, intersection_points=intersection_pts)
-                else:
-                    clear_snap_targets_preview()
-                
-                context.area.tag_redraw()
-                return {'RUNNING_MODAL'}
-
-            # Normal Hover Logic (preview uses current thickness for hull preview)
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
-                obj = face_data['object']
-                face_idx = face_data['face_index']
-                
-                # Determine what would be selected
-                faces_to_preview = get_faces_to_process(
-                    obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                    context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
-                )
-                
-                update_preview_faces(obj, faces_to_preview, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
-            else:
-                clear_preview_faces()
-                context.area.tag_redraw()
-                
-            return {'RUNNING_MODAL'}
-            
         # Clear (Z)
-        elif event.type == 'Z' and event.value == 'PRESS':
+        elif etype == 'Z' and evalue == 'PRESS':
             if self.marked_faces or self.marked_points:
                 self._push_undo()
             clear_all_markings()
             self.marked_faces.clear()
             self.marked_points.clear()
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Cancel
-        elif event.type == 'ESC':
+        elif etype == 'ESC':
             disable_edge_highlight()
             disable_bbox_preview()
             disable_face_marking()
@@ -1287,6 +1401,8 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             clear_snap_targets_preview()
             clear_limitation_plane()
             self.cleanup_all_instances(context)  # Clean up collection instances
+            self._remove_hover_timer(context)
+            disable_bvh_cache()
             restore_selection_state(context, self._restore_selected, self._restore_active)
             if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
                 self.hud_ctl.detach(context)
@@ -1294,7 +1410,7 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Finished
-        elif event.type == 'RIGHTMOUSE':
+        elif etype == 'RIGHTMOUSE':
             disable_edge_highlight()
             disable_bbox_preview()
             disable_face_marking()
@@ -1304,6 +1420,8 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
             clear_snap_targets_preview()
             clear_limitation_plane()
             self.cleanup_all_instances(context)  # Clean up collection instances
+            self._remove_hover_timer(context)
+            disable_bvh_cache()
             restore_selection_state(context, self._restore_selected, self._restore_active)
             if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
                 self.hud_ctl.detach(context)
@@ -1325,9 +1443,11 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
         self.snap_enabled = True
         self.snap_mode = 1
         self.limit_plane_mode = False
-        self.limitation_plane_matrix = None
+        self._set_limitation_plane(None)
         self.instance_data = {}
         self.undo_stack = OperatorUndoStack()
+        # Meshes may have been edited since the last session
+        clear_coplanar_cache()
 
         # Get use_depsgraph from preferences
         prefs = get_preferences()
@@ -1390,12 +1510,22 @@ class CursorBBox_OT_interactive_hull(bpy.types.Operator):
                     # Add real objects
                     for real_obj in real_objs:
                         self.original_selected_objects.add(real_obj)
+            self._original_ptrs = frozenset(
+                o.as_pointer() for o in self.original_selected_objects)
+            self._last_rc = None
+            self._last_snap = None
                 
             clear_preview_faces()
             enable_face_marking()
             enable_edge_highlight()
             enable_bbox_preview()
             self._setup_hud(context)
+            self._pending_mouse = None
+            self._redraw_pending = False
+            self._last_hover_key = None
+            self._last_preview_key = None
+            self._hover_timer = context.window_manager.event_timer_add(1 / 60, window=context.window)
+            enable_bvh_cache()
             context.window_manager.modal_handler_add(self)
             return {'RUNNING_MODAL'}
         else:
@@ -1,11 +1,12 @@
 import bpy
 import bmesh
-from mathutils import Vector, Matrix
 from math import radians, degrees
 from ..functions.utils import (
     restore_selection_state,
     set_cursor_rotation_to_principal_plane,
     CURSOR_PLANE_ALIGNMENTS,
+    SNAP_MODE_NAMES,
+    MouseSample,
     get_face_edges_from_raycast,
     select_edge_by_scroll,
     place_cursor_with_raycast_and_edge,
@@ -18,15 +19,23 @@ from ..functions.utils import (
     ensure_cbb_material,
     assign_object_styles,
     get_cursor_rotation_euler,
+    cursor_rotation_signature,
     get_selected_faces_from_edit_mode,
     calculate_point_location,
     get_faces_to_process,
+    clear_coplanar_cache,
+    enable_bvh_cache,
+    disable_bvh_cache,
+    get_geometry_generation,
     is_collection_instance,
     make_collection_instance_real,
     cleanup_collection_instance_temp,
-    build_all_faces_dict
+    build_all_faces_dict,
+    MarkedPointBuffer,
+    MarkedFacesSoA,
 )
 from ..functions.core import (
+    cursor_aligned_bounding_sphere,
     enable_edge_highlight_wrapper as enable_edge_highlight,
     disable_edge_highlight_wrapper as disable_edge_highlight,
     enable_bbox_preview_wrapper as enable_bbox_preview,
@@ -39,6 +48,7 @@ from ..functions.core import (
     clear_marked_faces,
     update_marked_faces_bbox,
     rebuild_marked_faces_visual_data,
+    append_marked_faces_visual,
     add_marked_point,
     clear_marked_points,
     clear_all_markings,
@@ -46,6 +56,7 @@ from ..functions.core import (
     update_preview_faces,
 
     clear_preview_faces,
+    has_preview_faces,
     toggle_backface_rendering,
     get_backface_rendering,
     toggle_preview_culling,
@@ -66,54 +77,29 @@ from ..functions.undo_stack import OperatorUndoStack
 
 def create_bounding_sphere_from_marked(marked_faces_dict, marked_points=None, select_new_object=True, use_depsgraph=False):
     """Create a bounding sphere from marked faces and points"""
-    from ..functions.utils import collect_vertices_from_marked_faces
+    from ..functions.utils import collect_marked_face_coords
     
     context = bpy.context
     cursor = context.scene.cursor
     cursor_matrix = cursor.matrix.copy()
-    cursor_matrix_inv = cursor_matrix.inverted()
     
     # Store explicit reference to the original active object and selected objects
     original_active = context.view_layer.objects.active
     original_selected = list(context.selected_objects)
     
-    # Collect vertices from marked faces using shared utility
-    all_vertices = collect_vertices_from_marked_faces(marked_faces_dict, use_depsgraph=use_depsgraph, context=context)
-    
-    # Add marked points
-    if marked_points:
-        all_vertices.extend(marked_points)
+    # Collect vertices from marked faces and marked points as one (N, 3) array
+    all_vertices = collect_marked_face_coords(
+        marked_faces_dict, use_depsgraph=use_depsgraph, context=context, extra_points=marked_points
+    )
         
-    if not all_vertices:
+    if not len(all_vertices):
         print("Error: No vertices found in marked faces or points.")
         return False
 
-    # Transform to Local Space of Cursor for "Oriented" Bounding calculation
-    local_verts = [cursor_matrix_inv @ v for v in all_vertices]
-
-    # Calculate Center (BBox Center in Local Space)
-    min_co = Vector(local_verts[0])
-    max_co = Vector(local_verts[0])
-    
-    for v in local_verts:
-        min_co.x = min(min_co.x, v.x)
-        min_co.y = min(min_co.y, v.y)
-        min_co.z = min(min_co.z, v.z)
-        max_co.x = max(max_co.x, v.x)
-        max_co.y = max(max_co.y, v.y)
-        max_co.z = max(max_co.z, v.z)
-        
-    local_center = (min_co + max_co) / 2.0
-    
-    # Calculate Radius (Max Distance from Center in Local Space)
-    radius = 0.0
-    for v in local_verts:
-        dist = (v - local_center).length
-        if dist > radius:
-            radius = dist
-    
-    # Calculate World Center for the Object
-    world_center = cursor_matrix @ local_center
+    # Centre of the cursor-aligned box and the radius around it
+    world_center, radius = cursor_aligned_bounding_sphere(
+        all_vertices, cursor_matrix.translation, cursor_matrix.to_3x3().normalized()
+    )
 
     # Create Sphere using BMesh (Ensures new object)
     bm = bmesh.new()
@@ -165,8 +151,9 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     marked_faces = {}
-    marked_points = []
+    marked_points = None  # MarkedPointBuffer of additional point markers
     original_selected_objects = set()
+    _original_ptrs = frozenset()  # as_pointer() of original_selected_objects
     use_depsgraph = False
     
     # Collection instance handling
@@ -196,7 +183,10 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
     # Limitation Plane State
     limit_plane_mode = False
     limitation_plane_matrix = None
+    _plane_origin = None
+    _plane_normal = None
     cached_limit_intersections = []
+    _limit_cache = None
     
     def handle_collection_instance(self, context, obj, keep_previous_selection=False):
         """
@@ -233,13 +223,15 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
         return {
             'marked_faces': {obj: set(faces)
                              for obj, faces in self.marked_faces.items()},
-            'marked_points': [Vector(p) for p in self.marked_points],
+            'marked_points': self.marked_points.array.copy(),
         }
 
     def _restore_snapshot(self, snap, context):
         self.marked_faces = {obj: set(faces)
                              for obj, faces in snap['marked_faces'].items()}
-        self.marked_points = [Vector(p) for p in snap['marked_points']]
+        self.marked_points = MarkedPointBuffer()
+        for p in snap['marked_points']:
+            self.marked_points.append(p)
         clear_all_markings()
         for obj, faces in self.marked_faces.items():
             if faces:
@@ -247,20 +239,154 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
         for p in self.marked_points:
             add_marked_point(p)
         if self.marked_faces or self.marked_points:
-            cursor_rotation = get_cursor_rotation_euler(context)
-            update_marked_faces_sphere(
-                self.marked_faces,
-                context.scene.cursor.location, cursor_rotation,
-                marked_points=self.marked_points,
-                use_depsgraph=self.use_depsgraph)
+            self._last_sphere_sig = None
+            self._sphere_dirty = True
         else:
             clear_preview_faces()
-        if context.area is not None:
-            context.area.tag_redraw()
+        self._redraw_pending = True
+
+    def _cursor_rotation(self, context):
+        """Cursor rotation as an XYZ Euler, re-derived only when it changed."""
+        sig = cursor_rotation_signature(context.scene.cursor)
+        if sig != self._last_cursor_sig:
+            self._last_cursor_sig = sig
+            self._last_cursor_rot = get_cursor_rotation_euler(context)
+        return self._last_cursor_rot
+
+    def _flush_sphere_update(self, context):
+        """Recompute the marked sphere preview if an event flagged it dirty.
+
+        Handlers only set self._sphere_dirty; the fit runs from the hover
+        timer so clicks, scrolls and mouse moves within one tick share a
+        single update. Handlers that change the marks also reset
+        self._last_sphere_sig, as the marked sets are edited in place; the
+        face index arrays and their world-space vertices are rebuilt then
+        and reused by cursor-only updates.
+        """
+        if not self._sphere_dirty:
+            return
+        self._sphere_dirty = False
+        if not (self.marked_faces or self.marked_points):
+            return
+        cursor = context.scene.cursor
+        cursor_rotation = self._cursor_rotation(context)
+        # Cursor moves that land on the same spot leave every input unchanged
+        sphere_sig = (tuple(cursor.location), self._last_cursor_sig,
+                      len(self.marked_points), self.use_depsgraph)
+        if sphere_sig == self._last_sphere_sig:
+            return
+        if self._last_sphere_sig is None or self._marks_soa is None:
+            self._marks_soa = MarkedFacesSoA(self.marked_faces)
+        self._last_sphere_sig = sphere_sig
+        world = self._marks_soa.world_coords(self.marked_points.array, self.use_depsgraph, context,
+                                             object_cache=self._mark_world_cache)
+        update_marked_faces_sphere(self.marked_faces,
+                                   cursor.location,
+                                   cursor_rotation,
+                                   marked_points=self.marked_points.array,
+                                   use_depsgraph=self.use_depsgraph,
+                                   precomputed_world=world)
+        self._redraw_pending = True
 
     def _push_undo(self):
         self.undo_stack.push(self._snapshot())
 
+    def _is_target(self, obj):
+        """Whether a raycast hit belongs to the objects the tool was started on.
+
+        Compares datablock pointers: raycasts hand back fresh Python wrappers,
+        so set membership would hash through RNA.
+        """
+        return obj.as_pointer() in self._original_ptrs
+
+    def _set_limitation_plane(self, matrix):
+        """Store the limitation plane with its origin and normal.
+
+        Limit-plane mouse moves read the origin and normal every event; they
+        only change when the plane is redefined, so derive them here once.
+        matrix may be the live cursor matrix: it is copied only when it
+        differs from the stored plane, as R/E/C usually re-set the same one.
+        """
+        if matrix is None:
+            self.limitation_plane_matrix = None
+            self._plane_origin = self._plane_normal = None
+            return
+        if self.limitation_plane_matrix is not None and matrix == self.limitation_plane_matrix:
+            return
+        self.limitation_plane_matrix = matrix.copy()
+        self._plane_origin = matrix.to_translation()
+        self._plane_normal = matrix.col[2].to_3d()
+
+    def _refresh_limit_intersections(self, context):
+        """Recompute cached_limit_intersections for the current limitation plane.
+
+        R and E re-define the plane on every press, usually to where it
+        already was; the BVH-scale edge walk is only redone when the plane
+        (to 1e-6) or the objects it cuts have actually changed.
+        """
+        if self.marked_faces:
+            objects = self.marked_faces.keys()
+        elif context.active_object and context.active_object.type == 'MESH':
+            objects = [context.active_object]
+        else:
+            objects = []
+        origin = self._plane_origin
+        normal = self._plane_normal
+        key = (
+            origin.to_tuple(6), normal.to_tuple(6),
+            tuple(o.as_pointer() for o in objects), bool(self.marked_faces),
+            self.use_depsgraph,
+        )
+        if self._limit_cache is not None and self._limit_cache[0] == key:
+            self.cached_limit_intersections = self._limit_cache[1]
+            return
+
+        if not objects:
+            result = []
+        elif self.marked_faces:
+            result = calculate_plane_edge_intersections_multi(
+                objects, origin, normal, use_depsgraph=self.use_depsgraph
+            )
+        else:
+            result = calculate_plane_edge_intersections(
+                objects[0], origin, normal, use_depsgraph=self.use_depsgraph
+            )
+        self._limit_cache = (key, result)
+        self.cached_limit_intersections = result
+
+    def _raycast_key(self, event):
+        return (event.mouse_region_x, event.mouse_region_y, self.use_depsgraph)
+
+    def _raycast(self, context, event):
+        """Face under the mouse, reusing the hover raycast if the mouse has
+        not moved since (clicks land on the last hovered position)."""
+        key = self._raycast_key(event)
+        if self._last_rc is not None and self._last_rc[0] == key:
+            return self._last_rc[1]
+        face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        self._last_rc = (key, face_data)
+        return face_data
+
+    def _snap(self, context, event, face_data, intersection_pts):
+        """Snap the cursor near the mouse, reusing the last search while the
+        mouse, the hovered face and the snap settings are unchanged."""
+        key = (self._raycast_key(event), self.snap_threshold, self.snap_mode)
+        last = self._last_snap
+        # Face data and intersection points are compared by identity: a new
+        # raycast or limit plane result is always a new object
+        if (last is not None and last[0] == key
+                and last[1] is face_data and last[2] is intersection_pts):
+            snap_result = last[3]
+            if snap_result['success']:
+                context.scene.cursor.location = snap_result['location']
+            return snap_result
+        snap_result = snap_cursor_to_closest_element(
+            context, event, face_data, threshold=self.snap_threshold,
+            intersection_points=intersection_pts, use_depsgraph=self.use_depsgraph,
+            snap_mode=self.snap_mode)
+        self._last_snap = (key, face_data, intersection_pts, snap_result)
+        return snap_result
+
     def _setup_hud(self, context):
         """Build the HUDOverlay + HelpOverlay shown while this modal runs."""
         self.hud_ctl = HUDController("interactive_sphere", "Interactive Sphere")
@@ -289,8 +415,6 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             HUDItem("Toggle limit plane", "C"),
             HUDItem("Exit point mode", "A"),
         ]))
-        from ..functions.utils import CURSOR_PLANE_ALIGNMENTS as _PLANES
-        _mode_names = ("All", "Vert", "Edge", "Face")
         self.hud_ctl.hud.add_param(HUDParam(
             "Mode", lambda: "POINT" if self.point_mode else "MARK"))
         self.hud_ctl.hud.add_param(HUDParam(
@@ -316,7 +440,7 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Snap mode",
-            lambda: _mode_names[getattr(self, 'snap_mode', 1)],
+            lambda: SNAP_MODE_NAMES[getattr(self, 'snap_mode', 1)],
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Snap threshold px",
@@ -325,7 +449,7 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Cursor plane",
-            lambda: _PLANES[getattr(self, 'cursor_plane_align', 0)],
+            lambda: CURSOR_PLANE_ALIGNMENTS[getattr(self, 'cursor_plane_align', 0)],
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.hud.add_param(HUDParam(
             "Limit plane",
@@ -334,17 +458,157 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             visible_getter=lambda: self.point_mode))
         self.hud_ctl.attach(context)
 
+    def _on_mousemove(self, context, event):
+        """Update the hover preview for the face or point under the mouse."""
+        if self.point_mode:
+            # Point Mode Preview Logic
+            face_data = self._raycast(context, event)
+            current_loc = None
+
+            if self.snap_enabled:
+                # Snap Logic - use intersection points if limit plane mode is enabled
+                intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
+                snap_result = self._snap(context, event, face_data, intersection_pts)
+                if snap_result['success']:
+                    current_loc = context.scene.cursor.location.copy() 
+                else:
+                    # Fallback to raycast placement if no snap
+                    result = place_cursor_with_raycast_and_edge(
+                       context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph, face_data=face_data
+                    )
+                    if result['success']:
+                        current_loc = result['location']
+                    else:
+                        current_loc = None
+            elif self.limit_plane_mode and self.limitation_plane_matrix and face_data:
+                 # Limit Plane Mode (no snap)
+                 plane_origin = self._plane_origin
+                 plane_normal = self._plane_normal # Z axis
+
+                 proj_pt = project_point_to_plane_intersection(
+                     face_data['hit_location'], 
+                     face_data['face_normal'],
+                     plane_origin, 
+                     plane_normal
+                 )
+
+                 if proj_pt:
+                     current_loc = proj_pt
+                 else:
+                     current_loc = None
+            else:
+                # Standard raycast placement (location + rotation)
+                result = place_cursor_with_raycast_and_edge(
+                    context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph, face_data=face_data
+                )
+                if result['success']:
+                     current_loc = result['location']
+                else:
+                     current_loc = None
+
+            if current_loc:
+                update_preview_point(current_loc)
+            if self.snap_enabled and (face_data or (self.limit_plane_mode and self.cached_limit_intersections)):
+                intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
+                update_snap_targets_preview(face_data, self.snap_mode, intersection_points=intersection_pts)
+            else:
+                clear_snap_targets_preview()
+
+            self._redraw_pending = True
+            return {'RUNNING_MODAL'}
+
+        # Normal Hover Logic (a miss skips placement, which would cast again)
+        face_data = self._raycast(context, event)
+        if face_data:
+            place_cursor_with_raycast_and_edge(
+                context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph, face_data=face_data
+            )
+
+        if face_data and self._is_target(face_data['object']):
+            self.current_face_data = face_data
+
+            obj = face_data['object']
+            face_idx = face_data['face_index']
+
+            # Re-hovering the same face with the same settings (and unchanged
+            # geometry) would rebuild an identical preview; skip it while that
+            # preview is still shown
+            scene = context.scene
+            # Scene properties are RNA reads; take each once per hover
+            use_coplanar = scene.cursor_bbox_select_coplanar
+            coplanar_angle = scene.cursor_bbox_coplanar_angle
+            hover_key = (obj.as_pointer(), face_idx, use_coplanar,
+                         round(coplanar_angle, 4), self.use_depsgraph,
+                         get_geometry_generation())
+            if hover_key != self._last_hover_key or not has_preview_faces():
+                self._last_hover_key = hover_key
+                faces_to_preview = get_faces_to_process(
+                    obj, face_idx, use_coplanar,
+                    coplanar_angle, use_depsgraph=self.use_depsgraph
+                )
+                # Moving between faces of one coplanar region yields the same
+                # face set; only rebuild the preview triangles when it differs
+                preview_key = (obj.as_pointer(), self.use_depsgraph, faces_to_preview, hover_key[-1])
+                if preview_key != self._last_preview_key or not has_preview_faces():
+                    self._last_preview_key = preview_key
+                    update_preview_faces(obj, faces_to_preview, use_depsgraph=self.use_depsgraph)
+
+            # Also update sphere preview if we have marked stuff
+            if self.marked_faces or self.marked_points:
+                self._sphere_dirty = True
+
+            self._redraw_pending = True
+        else:
+            clear_preview_faces()
+            self.current_face_data = None
+            self._redraw_pending = True
+        return {'RUNNING_MODAL'}
+
+    def _remove_hover_timer(self, context):
+        if self._hover_timer is not None:
+            context.window_manager.event_timer_remove(self._hover_timer)
+            self._hover_timer = None
+
     def modal(self, context, event):
+        # Debounce tick: run the latest coalesced mouse move, so hover work
+        # happens at most once per timer interval however fast events come.
+        if event.type == 'TIMER':
+            if self._pending_mouse is not None:
+                sample, self._pending_mouse = self._pending_mouse, None
+                self._on_mousemove(context, sample)
+            self._flush_sphere_update(context)
+            # Handlers only flag a redraw; issue at most one per tick
+            if self._redraw_pending and context.area is not None:
+                context.area.tag_redraw()
+                self._redraw_pending = False
+            return {'PASS_THROUGH'}
+
         # HUD: capture event for cursor-follow + forward toggle/drag events.
+        # Its redraw joins the coalesced one issued on the timer tick.
         if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
-            self.hud_ctl.update_event(event, context)
+            self.hud_ctl.update_event(event, context, redraw=False)
+            self._redraw_pending = True
             if self.hud_ctl.handle_events(context, event):
                 return {'RUNNING_MODAL'}
 
+        # Mouse motion is by far the most frequent event and can arrive many
+        # times per frame; only remember the latest position here and let
+        # the timer tick do the raycast/preview work once.
+        if event.type == 'MOUSEMOVE':
+            self._pending_mouse = MouseSample(event)
+            return {'RUNNING_MODAL'}
+
+        # Each event attribute read is an RNA lookup; the checks below
+        # test them many times over, so read them once
+        etype = event.type
+        evalue = event.value
+        shift, ctrl, alt = event.shift, event.ctrl, event.alt
+        scene = context.scene
+
         # Undo / Redo (Ctrl+Z / Ctrl+Shift+Z)
-        if (event.type == 'Z' and event.value == 'PRESS'
-                and event.ctrl and not event.alt):
-            if event.shift:
+        if (etype == 'Z' and evalue == 'PRESS'
+                and ctrl and not alt):
+            if shift:
                 snap = self.undo_stack.pop_redo(self._snapshot())
                 if snap is not None:
                     self._restore_snapshot(snap, context)
@@ -361,8 +625,8 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             return {'RUNNING_MODAL'}
 
         # Mark all polygons of all selected objects (Ctrl+A)
-        if (event.type == 'A' and event.value == 'PRESS'
-                and event.ctrl and not self.point_mode):
+        if (etype == 'A' and evalue == 'PRESS'
+                and ctrl and not self.point_mode):
             self._push_undo()
             self.marked_faces = build_all_faces_dict(
                 self.original_selected_objects, use_depsgraph=self.use_depsgraph)
@@ -370,64 +634,49 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             for obj, faces in self.marked_faces.items():
                 if faces:
                     mark_faces_batch(obj, faces, use_depsgraph=self.use_depsgraph)
-            cursor_rotation = get_cursor_rotation_euler(context)
-            update_marked_faces_sphere(self.marked_faces,
-                                       context.scene.cursor.location,
-                                       cursor_rotation,
-                                       marked_points=self.marked_points,
-                                       use_depsgraph=self.use_depsgraph)
+            self._last_sphere_sig = None
+            self._sphere_dirty = True
             total = sum(len(v) for v in self.marked_faces.values())
             self.report({'INFO'}, f"Marked all polygons ({total}) of selected objects")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Snap mode 1=Vertex, 2=Edge, 3=Face (point mode only)
-        if self.point_mode and event.value == 'PRESS':
-            if event.type in ('ONE', 'NUMPAD_1'):
+        if self.point_mode and evalue == 'PRESS':
+            if etype in ('ONE', 'NUMPAD_1'):
                 self.snap_mode = 1
                 self.report({'INFO'}, "Snap: Vertex only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type in ('TWO', 'NUMPAD_2'):
+            if etype in ('TWO', 'NUMPAD_2'):
                 self.snap_mode = 2
                 self.report({'INFO'}, "Snap: Edge only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
-            if event.type in ('THREE', 'NUMPAD_3'):
+            if etype in ('THREE', 'NUMPAD_3'):
                 self.snap_mode = 3
                 self.report({'INFO'}, "Snap: Face only")
-                context.area.tag_redraw()
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
         
         # Reset cursor rotation to principal plane (R) - point mode only
-        if self.point_mode and event.type == 'R' and event.value == 'PRESS':
+        if self.point_mode and etype == 'R' and evalue == 'PRESS':
             self.cursor_plane_align = (self.cursor_plane_align + 1) % 3
             plane = CURSOR_PLANE_ALIGNMENTS[self.cursor_plane_align]
             set_cursor_rotation_to_principal_plane(context, plane)
             if self.limit_plane_mode:
-                self.limitation_plane_matrix = context.scene.cursor.matrix.copy()
+                self._set_limitation_plane(scene.cursor.matrix)
                 update_limitation_plane(self.limitation_plane_matrix)
-                origin = self.limitation_plane_matrix.to_translation()
-                normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                self.cached_limit_intersections = []
-                if self.marked_faces:
-                    objects = list(self.marked_faces.keys())
-                    self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                        objects, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
-                elif context.active_object and context.active_object.type == 'MESH':
-                    self.cached_limit_intersections = calculate_plane_edge_intersections(
-                        context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
+                self._refresh_limit_intersections(context)
             self.report({'INFO'}, f"Cursor: {plane}")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # E: Set cursor location only (to current hover/snap position) and update limitation plane
-        if self.point_mode and event.type == 'E' and event.value == 'PRESS':
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        if self.point_mode and etype == 'E' and evalue == 'PRESS':
+            face_data = self._raycast(context, event)
             if face_data:
-                cursor = context.scene.cursor
+                cursor = scene.cursor
                 if self.snap_enabled:
                     intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
                     snap_result = snap_cursor_to_closest_element(
@@ -437,8 +686,8 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                     if not snap_result['success']:
                         cursor.location = face_data['hit_location'].copy()
                 elif self.limit_plane_mode and self.limitation_plane_matrix:
-                    plane_origin = self.limitation_plane_matrix.to_translation()
-                    plane_normal = self.limitation_plane_matrix.col[2].to_3d()
+                    plane_origin = self._plane_origin
+                    plane_normal = self._plane_normal
                     proj_pt = project_point_to_plane_intersection(
                         face_data['hit_location'], face_data['face_normal'], plane_origin, plane_normal
                     )
@@ -449,60 +698,46 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 else:
                     cursor.location = face_data['hit_location'].copy()
                 if self.limit_plane_mode:
-                    self.limitation_plane_matrix = cursor.matrix.copy()
+                    self._set_limitation_plane(cursor.matrix)
                     update_limitation_plane(self.limitation_plane_matrix)
-                    origin = self.limitation_plane_matrix.to_translation()
-                    normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                    self.cached_limit_intersections = []
-                    if self.marked_faces:
-                        objects = list(self.marked_faces.keys())
-                        self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                            objects, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
-                    elif context.active_object and context.active_object.type == 'MESH':
-                        self.cached_limit_intersections = calculate_plane_edge_intersections(
-                            context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                        )
+                    self._refresh_limit_intersections(context)
                 self.report({'INFO'}, "Cursor location updated")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
         
         # Toggle Depsgraph (D)
-        if event.type == 'D' and event.value == 'PRESS':
+        if etype == 'D' and evalue == 'PRESS':
             self.use_depsgraph = not self.use_depsgraph
             # Rebuild visuals with new setting
             for obj, faces in self.marked_faces.items():
                 rebuild_marked_faces_visual_data(obj, faces, use_depsgraph=self.use_depsgraph)
             
             # Update Preview (Sphere)
-            cursor_rotation = get_cursor_rotation_euler(context)
-            update_marked_faces_sphere(self.marked_faces, 
-                                     context.scene.cursor.location,
-                                     cursor_rotation,
-                                     marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
+            self._last_sphere_sig = None
+            self._sphere_dirty = True
             
             self.report({'INFO'}, f"Depsgraph: {'ON' if self.use_depsgraph else 'OFF'}")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
         
         # Toggle Backface Rendering (P)
-        elif event.type == 'P' and event.value == 'PRESS':
+        elif etype == 'P' and evalue == 'PRESS':
              new_state = toggle_backface_rendering()
              state_str = "ON" if new_state else "OFF"
              self.report({'INFO'}, f"Backface Rendering: {state_str}")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
              
         # Toggle Preview Culling (O)
-        elif event.type == 'O' and event.value == 'PRESS':
+        elif etype == 'O' and evalue == 'PRESS':
              new_state = toggle_preview_culling()
              state_str = "ON" if new_state else "OFF"
              self.report({'INFO'}, f"Preview Culling: {state_str}")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
 
         # Coplanar Angle Presets (1-7)
-        elif event.type in {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN'} and event.value == 'PRESS':
+        elif etype in {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN'} and evalue == 'PRESS':
              angle_map = {
                  'ONE': 5,
                  'TWO': 15,
@@ -512,57 +747,61 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                  'SIX': 120,
                  'SEVEN': 180
              }
-             new_angle = angle_map[event.type]
-             context.scene.cursor_bbox_coplanar_angle = radians(new_angle)
+             new_angle = angle_map[etype]
+             scene.cursor_bbox_coplanar_angle = radians(new_angle)
              self.report({'INFO'}, f"Coplanar Angle Set: {new_angle}°")
-             context.area.tag_redraw()
+             self._redraw_pending = True
              return {'RUNNING_MODAL'}
         
         # Coplanar Angle Adjustment (Shift + Scroll)
-        if event.shift and event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
-            current_deg = degrees(context.scene.cursor_bbox_coplanar_angle)
-            step = 1 if event.ctrl else 5
+        if shift and etype in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            current_deg = degrees(scene.cursor_bbox_coplanar_angle)
+            step = 1 if ctrl else 5
             
-            if event.type == 'WHEELUPMOUSE':
+            if etype == 'WHEELUPMOUSE':
                 new_angle_deg = current_deg + step
             else:
                 new_angle_deg = current_deg - step
                 
             new_angle_deg = max(0.0, min(180.0, new_angle_deg))
-            context.scene.cursor_bbox_coplanar_angle = radians(new_angle_deg)
+            scene.cursor_bbox_coplanar_angle = radians(new_angle_deg)
             
             self.report({'INFO'}, f"Coplanar Angle: {int(round(new_angle_deg))}°")
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
 
         # Snap Threshold Adjustment (Ctrl + Scroll) - Must be before navigation pass-through
-        if event.ctrl and not event.shift and not event.alt:
-            if event.type == 'WHEELUPMOUSE':
+        if ctrl and not shift and not alt:
+            if etype == 'WHEELUPMOUSE':
                 self.snap_threshold += 10
                 self.report({'INFO'}, f"Snap Threshold: {self.snap_threshold}px")
-                context.area.tag_redraw()
-            elif event.type == 'WHEELDOWNMOUSE':
+                self._redraw_pending = True
+            elif etype == 'WHEELDOWNMOUSE':
                 self.snap_threshold = max(10, self.snap_threshold - 10)
                 self.report({'INFO'}, f"Snap Threshold: {self.snap_threshold}px")
-                context.area.tag_redraw()
+                self._redraw_pending = True
             
             return {'RUNNING_MODAL'}
 
         # Navigation
-        if event.type == 'MIDDLEMOUSE' or (event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and not event.shift and not event.alt and not event.ctrl):
+        # (the view changes under the mouse, so the cached raycast no longer applies)
+        if etype == 'MIDDLEMOUSE' or (etype in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and not shift and not alt and not ctrl):
+            self._last_rc = None
             return {'PASS_THROUGH'}
             
         # Create Sphere (Enter/Space)
-        if event.type in {'RET', 'NUMPAD_ENTER', 'SPACE'} and event.value == 'PRESS':
+        if etype in {'RET', 'NUMPAD_ENTER', 'SPACE'} and evalue == 'PRESS':
+            # The new sphere may now be what lies under the mouse
+            self._last_rc = None
             if self.marked_faces or self.marked_points:
                 self._push_undo()
-                if create_bounding_sphere_from_marked(self.marked_faces, self.marked_points, select_new_object=False, use_depsgraph=self.use_depsgraph):
+                if create_bounding_sphere_from_marked(self.marked_faces, self.marked_points.array, select_new_object=False, use_depsgraph=self.use_depsgraph):
                     self.report({'INFO'}, "Created Bounding Sphere. Ready for new selection.")
                     clear_all_markings()
                     clear_preview_faces()
                     self.marked_faces.clear()
                     self.marked_points.clear()
-                    context.area.tag_redraw()
+                    self._redraw_pending = True
                     return {'RUNNING_MODAL'}
                 else:
                     self.report({'WARNING'}, "Failed to create Sphere")
@@ -571,12 +810,12 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             return {'RUNNING_MODAL'}
             
         # Mark Face (LMB or F)
-        elif (event.type == 'LEFTMOUSE' and event.value == 'PRESS') or (event.type == 'F' and event.value == 'PRESS'):
+        elif (etype == 'LEFTMOUSE' and evalue == 'PRESS') or (etype == 'F' and evalue == 'PRESS'):
             if self.point_mode:
                 # Add Point Logic
                 
                 # Get face data from raycast
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+                face_data = self._raycast(context, event)
                 
                 loc, message = calculate_point_location(
                     context, event, face_data, self.snap_enabled, 
@@ -597,22 +836,19 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 add_marked_point(loc)
                 
                 # Update Preview
-                cursor_rotation = get_cursor_rotation_euler(context)
-                update_marked_faces_sphere(self.marked_faces, 
-                                         context.scene.cursor.location,
-                                         cursor_rotation,
-                                         marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
+                self._last_sphere_sig = None
+                self._sphere_dirty = True
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
             
             # Normal Mark Face Logic
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
+            face_data = self._raycast(context, event)
+            if face_data and self._is_target(face_data['object']):
                 obj = face_data['object']
                 face_idx = face_data['face_index']
                 
                 # Also place cursor for feedback
-                place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph)
+                place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph, face_data=face_data)
                 
                 if obj not in self.marked_faces:
                     self.marked_faces[obj] = set()
@@ -621,53 +857,38 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 is_unmarking = face_idx in self.marked_faces[obj]
                 
                 faces_to_process = get_faces_to_process(
-                    obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                    context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
+                    obj, face_idx, scene.cursor_bbox_select_coplanar,
+                    scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
                 )
 
-                for idx in faces_to_process:
-                    if is_unmarking:
-                        if idx in self.marked_faces[obj]:
-                            self.marked_faces[obj].remove(idx)
+                if is_unmarking:
+                    self.marked_faces[obj].difference_update(faces_to_process)
+                    if not self.marked_faces[obj]:
+                        del self.marked_faces[obj]
+                        rebuild_marked_faces_visual_data(obj, set(), use_depsgraph=self.use_depsgraph)
                     else:
-                        self.marked_faces[obj].add(idx)
-                
-                if not self.marked_faces[obj]:
-                    del self.marked_faces[obj]
-                    rebuild_marked_faces_visual_data(obj, set(), use_depsgraph=self.use_depsgraph)
+                        rebuild_marked_faces_visual_data(obj, self.marked_faces[obj], use_depsgraph=self.use_depsgraph)
                 else:
-                    rebuild_marked_faces_visual_data(obj, self.marked_faces[obj], use_depsgraph=self.use_depsgraph)
+                    # Only the newly covered faces' triangles are appended
+                    added = faces_to_process - self.marked_faces[obj]
+                    self.marked_faces[obj].update(added)
+                    append_marked_faces_visual(obj, added, use_depsgraph=self.use_depsgraph)
                 
                 # Update Preview (Use Sphere preview as it shows extent)
-                cursor_rotation = get_cursor_rotation_euler(context)
-                update_marked_faces_sphere(self.marked_faces, 
-                                         context.scene.cursor.location,
-                                         cursor_rotation,
-                                         marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
+                self._last_sphere_sig = None
+                self._sphere_dirty = True
+                self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Toggle Limitation Plane (C)
-        elif event.type == 'C' and event.value == 'PRESS':
+        elif etype == 'C' and evalue == 'PRESS':
             self.limit_plane_mode = not self.limit_plane_mode
             if self.limit_plane_mode:
                 # Always align limitation plane to cursor when pressing C
-                self.limitation_plane_matrix = context.scene.cursor.matrix.copy()
+                self._set_limitation_plane(scene.cursor.matrix)
                 update_limitation_plane(self.limitation_plane_matrix)
                 enable_limitation_plane(context, self.limitation_plane_matrix)
-                # Calculate and cache edge intersections for snapping
-                self.cached_limit_intersections = []
-                origin = self.limitation_plane_matrix.to_translation()
-                normal = Vector(self.limitation_plane_matrix.col[2][:3])
-                if self.marked_faces:
-                    objects = list(self.marked_faces.keys())
-                    self.cached_limit_intersections = calculate_plane_edge_intersections_multi(
-                        objects, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
-                elif context.active_object and context.active_object.type == 'MESH':
-                    self.cached_limit_intersections = calculate_plane_edge_intersections(
-                        context.active_object, origin, normal, use_depsgraph=self.use_depsgraph
-                    )
+                self._refresh_limit_intersections(context)
                 self.report({'INFO'}, f"Limitation Plane ON | {len(self.cached_limit_intersections)} pts")
             else:
                 clear_limitation_plane()
@@ -675,11 +896,11 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 self.cached_limit_intersections = []
                 self.report({'INFO'}, "Limitation Plane OFF")
             
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Add Point Mode Toggle (A)
-        elif event.type == 'A' and event.value == 'PRESS' and not event.ctrl:
+        elif etype == 'A' and evalue == 'PRESS' and not ctrl:
             self.point_mode = not self.point_mode
             if self.point_mode:
                 self.report({'INFO'}, "Entered Add Point Mode")
@@ -692,17 +913,17 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 self.limit_plane_mode = False
                 clear_limitation_plane()
             
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Left Mouse Click (Add Point in Mode OR Mark Face)
-        elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+        elif etype == 'LEFTMOUSE' and evalue == 'PRESS':
             self._push_undo()
             if self.point_mode:
                 # Add point at current preview location (which is updated in mousemove)
                 # Recalculate just in case
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                loc = context.scene.cursor.location.copy()
+                face_data = self._raycast(context, event)
+                loc = scene.cursor.location.copy()
                 
                 # If snap enabled, cursor is already at snap location from mousemove
                 # If snap disabled, cursor is at hit location from mousemove
@@ -712,7 +933,7 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 if self.snap_enabled:
                      snap_result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
                      if snap_result['success']:
-                         loc = context.scene.cursor.location.copy()
+                         loc = scene.cursor.location.copy()
                          self.report({'INFO'}, f"Added point snapped to {snap_result['type']}")
                      elif face_data:
                          try:
@@ -730,12 +951,9 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 add_marked_point(loc)
                 
                 # Update Sphere Preview
-                cursor_rotation = get_cursor_rotation_euler(context)
-                update_marked_faces_sphere(self.marked_faces, 
-                                         context.scene.cursor.location,
-                                         cursor_rotation,
-                                         marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                context.area.tag_redraw()
+                self._last_sphere_sig = None
+                self._sphere_dirty = True
+                self._redraw_pending = True
                 return {'RUNNING_MODAL'}
             
             # Normal Mark Face Logic (Only if not in Point Mode)
@@ -757,18 +975,18 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
 
         # Mark Face (LMB or F) - Modified to respect Point Mode
         # Mark Face (LMB or F) - Modified to respect Point Mode
-        elif (event.type == 'LEFTMOUSE' and event.value == 'PRESS') or (event.type == 'F' and event.value == 'PRESS'):
+        elif (etype == 'LEFTMOUSE' and evalue == 'PRESS') or (etype == 'F' and evalue == 'PRESS'):
             # If in point mode and it was a click (not F), check mode here.
             
-            if self.point_mode and event.type == 'LEFTMOUSE':
+            if self.point_mode and etype == 'LEFTMOUSE':
                  # ... Add point logic ...
-                 face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                 loc = context.scene.cursor.location.copy()
+                 face_data = self._raycast(context, event)
+                 loc = scene.cursor.location.copy()
                  
                  # Limit Plane Logic for Click
                  if self.limit_plane_mode and self.limitation_plane_matrix and face_data:
-                     plane_origin = self.limitation_plane_matrix.to_translation()
-                     plane_normal = self.limitation_plane_matrix.col[2].to_3d()
+                     plane_origin = self._plane_origin
+                     plane_normal = self._plane_normal
                      proj_pt = project_point_to_plane_intersection(
                          face_data['hit_location'], 
                          face_data['face_normal'],
@@ -787,7 +1005,7 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                  elif self.snap_enabled:
                      snap_result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
                      if snap_result['success']:
-                         loc = context.scene.cursor.location.copy()
+                         loc = scene.cursor.location.copy()
                  elif face_data:
                       try:
                          loc = face_data['hit_location']
@@ -798,62 +1016,51 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                  add_marked_point(loc)
                  
                  # Update Preview
-                 cursor_rotation = get_cursor_rotation_euler(context)
-                 update_marked_faces_sphere(self.marked_faces, 
-                                          context.scene.cursor.location,
-                                          cursor_rotation,
-                                          marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                 context.area.tag_redraw()
+                 self._last_sphere_sig = None
+                 self._sphere_dirty = True
+                 self._redraw_pending = True
                  return {'RUNNING_MODAL'}
             
             # ... Normal marking logic ...
 
-        elif event.type == 'WHEELUPMOUSE' and event.alt:
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
+        elif etype == 'WHEELUPMOUSE' and alt:
+            face_data = self._raycast(context, event)
+            if face_data and self._is_target(face_data['object']):
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, 1, self.current_edge_index
                 )
                 result = place_cursor_with_raycast_and_edge(
-                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph
+                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph, face_data=face_data
                 )
                 if result['success']:
                     # Update Preview (Sphere) if needed
                     # Note: Sphere preview is based on MARKED faces, not hover cursor.
                     # BUT cursor rotation changes here. So we MUST update preview if markers exist.
                     if self.marked_faces or self.marked_points:
-                        cursor_rotation = get_cursor_rotation_euler(context)
-                        update_marked_faces_sphere(self.marked_faces, 
-                                                 context.scene.cursor.location,
-                                                 cursor_rotation,
-                                                 marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
+                        self._sphere_dirty = True
 
-                    context.area.tag_redraw()
+                    self._redraw_pending = True
             return {'RUNNING_MODAL'}
         
-        elif event.type == 'WHEELDOWNMOUSE' and event.alt:
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-            if face_data and face_data['object'] in self.original_selected_objects:
+        elif etype == 'WHEELDOWNMOUSE' and alt:
+            face_data = self._raycast(context, event)
+            if face_data and self._is_target(face_data['object']):
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, -1, self.current_edge_index
                 )
                 result = place_cursor_with_raycast_and_edge(
-                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph
+                    context, event, self.align_to_face, self.current_edge_index, use_depsgraph=self.use_depsgraph, face_data=face_data
                 )
                 if result['success']:
                     if self.marked_faces or self.marked_points:
-                        cursor_rotation = get_cursor_rotation_euler(context)
-                        update_marked_faces_sphere(self.marked_faces, 
-                                                 context.scene.cursor.location,
-                                                 cursor_rotation,
-                                                 marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
+                        self._sphere_dirty = True
 
-                    context.area.tag_redraw()
+                    self._redraw_pending = True
             return {'RUNNING_MODAL'}
         
-        elif event.type == 'S' and event.value == 'PRESS':
+        elif etype == 'S' and evalue == 'PRESS':
             if self.point_mode:
                 self.snap_enabled = not self.snap_enabled
                 if not self.snap_enabled:
@@ -862,9 +1069,9 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 self.report({'INFO'}, f"Point Snap: {state_str}")
             else:
                  # Snap cursor to closest vertex, edge midpoint, or face center from current face
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+                face_data = self._raycast(context, event)
                 result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
-                if result['success'] and (not face_data or face_data['object'] in self.original_selected_objects):
+                if result['success'] and (not face_data or self._is_target(face_data['object'])):
                     if face_data:
                         self.report({'INFO'}, f"Cursor snapped to {result['type']} on {face_data['object'].name} ({result['distance']:.1f}px away)")
                     else:
@@ -872,120 +1079,24 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                     
                     # Update bbox preview after cursor snap
                     if self.marked_faces or self.marked_points:
-                        cursor_rotation = get_cursor_rotation_euler(context)
-                        update_marked_faces_sphere(self.marked_faces, 
-                                                 context.scene.cursor.location,
-                                                 cursor_rotation,
-                                                 marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-                    context.area.tag_redraw()
+                        self._sphere_dirty = True
+                    self._redraw_pending = True
                 else:
                     self.report({'WARNING'}, "No suitable snap target found")
             return {'RUNNING_MODAL'}
 
-        # Mouse Move - Update Preview (Hover)
-        elif event.type == 'MOUSEMOVE':
-            if self.point_mode:
-                # Point Mode Preview Logic
-                face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
-                current_loc = None
-                
-                if self.snap_enabled:
-                    # Snap Logic - use intersection points if limit plane mode is enabled
-                    intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
-                    snap_result = snap_cursor_to_closest_element(context, event, face_data, threshold=self.snap_threshold, intersection_points=intersection_pts, use_depsgraph=self.use_depsgraph, snap_mode=self.snap_mode)
-                    if snap_result['success']:
-                        current_loc = context.scene.cursor.location.copy() 
-                    else:
-                        # Fallback to raycast placement if no snap
-                        result = place_cursor_with_raycast_and_edge(
-                           context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-                        )
-                        if result['success']:
-                            current_loc = result['location']
-                        else:
-                            current_loc = None
-                elif self.limit_plane_mode and self.limitation_plane_matrix and face_data:
-                     # Limit Plane Mode (no snap)
-                     plane_origin = self.limitation_plane_matrix.to_translation()
-                     plane_normal = self.limitation_plane_matrix.col[2].to_3d() # Z axis
-                     
-                     proj_pt = project_point_to_plane_intersection(
-                         face_data['hit_location'], 
-                         face_data['face_normal'],
-                         plane_origin, 
-                         plane_normal
-                     )
-                     
-                     if proj_pt:
-                         current_loc = proj_pt
-                     else:
-                         current_loc = None
-                else:
-                    # Standard raycast placement (location + rotation)
-                    result = place_cursor_with_raycast_and_edge(
-                        context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-                    )
-                    if result['success']:
-                         current_loc = result['location']
-                    else:
-                         current_loc = None
-                
-                if current_loc:
-                    update_preview_point(current_loc)
-                if self.snap_enabled and (face_data or (self.limit_plane_mode and self.cached_limit_intersections)):
-                    intersection_pts = self.cached_limit_intersections if self.limit_plane_mode else None
-                    update_snap_targets_preview(face_data, self.snap_mode, intersection_points=intersection_pts)
-                else:
-                    clear_snap_targets_preview()
-                    
-                context.area.tag_redraw()
-                return {'RUNNING_MODAL'}
-
-            # Normal Hover Logic
-            result = place_cursor_with_raycast_and_edge(
-                context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph
-            )
-            
-            if result['success'] and result['face_data']['object'] in self.original_selected_objects:
-                self.current_face_data = result['face_data']
-
-                obj = result['face_data']['object']
-                face_idx = result['face_data']['face_index']
-                
-                faces_to_preview = get_faces_to_process(
-                    obj, face_idx, context.scene.cursor_bbox_select_coplanar,
-                    context.scene.cursor_bbox_coplanar_angle, use_depsgraph=self.use_depsgraph
-                )
-                
-                update_preview_faces(obj, faces_to_preview, use_depsgraph=self.use_depsgraph)
-                
-                # Also update sphere preview if we have marked stuff
-                if self.marked_faces or self.marked_points:
-                    cursor_rotation = get_cursor_rotation_euler(context)
-                    update_marked_faces_sphere(self.marked_faces, 
-                                             context.scene.cursor.location,
-                                             cursor_rotation,
-                                             marked_points=self.marked_points, use_depsgraph=self.use_depsgraph)
-
-                context.area.tag_redraw()
-            else:
-                clear_preview_faces()
-                self.current_face_data = None
-                context.area.tag_redraw()
-            return {'RUNNING_MODAL'}
-            
         # Clear (Z)
-        elif event.type == 'Z' and event.value == 'PRESS':
+        elif etype == 'Z' and evalue == 'PRESS':
             if self.marked_faces or self.marked_points:
                 self._push_undo()
             clear_all_markings()
             self.marked_faces.clear()
             self.marked_points.clear()
-            context.area.tag_redraw()
+            self._redraw_pending = True
             return {'RUNNING_MODAL'}
             
         # Cancel
-        elif event.type == 'ESC':
+        elif etype == 'ESC':
             disable_edge_highlight()
             disable_bbox_preview()
             disable_face_marking()
@@ -995,6 +1106,8 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             clear_snap_targets_preview()
             clear_limitation_plane()
             self.cleanup_all_instances(context)  # Clean up collection instances
+            self._remove_hover_timer(context)
+            disable_bvh_cache()
             restore_selection_state(context, self._restore_selected, self._restore_active)
             if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
                 self.hud_ctl.detach(context)
@@ -1002,7 +1115,7 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Finished
-        elif event.type == 'RIGHTMOUSE':
+        elif etype == 'RIGHTMOUSE':
             disable_edge_highlight()
             disable_bbox_preview()
             disable_face_marking()
@@ -1012,6 +1125,8 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
             clear_snap_targets_preview()
             clear_limitation_plane()
             self.cleanup_all_instances(context)  # Clean up collection instances
+            self._remove_hover_timer(context)
+            disable_bvh_cache()
             restore_selection_state(context, self._restore_selected, self._restore_active)
             if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
                 self.hud_ctl.detach(context)
@@ -1024,13 +1139,15 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
         # Initialize properties
         self.marked_faces = {}
         self.align_to_face = context.scene.cursor_bbox_align_face
-        self.marked_points = []
+        self.marked_points = MarkedPointBuffer()
         self.point_mode = False
         self.snap_enabled = True
         self.limit_plane_mode = False
-        self.limitation_plane_matrix = None
+        self._set_limitation_plane(None)
         self.instance_data = {}
         self.undo_stack = OperatorUndoStack()
+        # Meshes may have been edited since the last session
+        clear_coplanar_cache()
 
         # Get use_depsgraph from preferences
         prefs = get_preferences()
@@ -1047,7 +1164,7 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                 active_obj = context.active_object
                 # Switch to Object Mode to allow object creation and selection operations
                 bpy.ops.object.mode_set(mode='OBJECT')
-                if create_bounding_sphere_from_marked(self.marked_faces, self.marked_points, select_new_object=False):
+                if create_bounding_sphere_from_marked(self.marked_faces, self.marked_points.array, select_new_object=False):
                     # Restore Edit Mode
                     if active_obj:
                         context.view_layer.objects.active = active_obj
@@ -1094,12 +1211,28 @@ class CursorBBox_OT_interactive_sphere(bpy.types.Operator):
                     # Add real objects
                     for real_obj in real_objs:
                         self.original_selected_objects.add(real_obj)
+            self._original_ptrs = frozenset(
+                o.as_pointer() for o in self.original_selected_objects)
+            self._last_rc = None
+            self._last_snap = None
                 
             clear_preview_faces()
             enable_face_marking()
             enable_edge_highlight()
             enable_bbox_preview()
             self._setup_hud(context)
+            self._pending_mouse = None
+            self._redraw_pending = False
+            self._last_cursor_sig = None
+            self._last_cursor_rot = None
+            self._last_hover_key = None
+            self._last_preview_key = None
+            self._sphere_dirty = False
+            self._last_sphere_sig = None
+            self._marks_soa = None
+            self._mark_world_cache = {}
+            self._hover_timer = context.window_manager.event_timer_add(1 / 60, window=context.window)
+            enable_bvh_cache()
             context.window_manager.modal_handler_add(self)
             return {'RUNNING_MODAL'}
         else:
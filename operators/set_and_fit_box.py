@@ -1,5 +1,4 @@
 import bpy
-from mathutils import Vector
 from ..functions.utils import (
     get_face_edges_from_raycast, 
     select_edge_by_scroll, 
@@ -49,6 +48,7 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
     current_edge_index: bpy.props.IntProperty(default=0)
     current_face_data = None
     use_depsgraph = False
+    _last_rc = None  # (raycast key, face data) of the last raycast
     bbox_mode = None  # None, 'world', 'local', 'cursor'
     preview_target_obj = None
     
@@ -175,16 +175,11 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
                     world_rotation = Euler((0.0, 0.0, 0.0), 'XYZ')
                     update_bbox_preview(None, self.push_value, context.scene.cursor.location, world_rotation)
                     # Update bbox preview manually
-                    from ..functions.core import calculate_bbox_bounds_optimized, generate_bbox_geometry_optimized
+                    from ..functions.core import calculate_bbox_bounds_optimized, generate_bbox_geometry_optimized, apply_push_to_dimensions
                     local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
                         all_coords, context.scene.cursor.location, world_rotation
                     )
-                    epsilon = 0.0001
-                    dimensions = Vector((max(dimensions.x, epsilon), max(dimensions.y, epsilon), max(dimensions.z, epsilon)))
-                    safe_push = float(self.push_value)
-                    if safe_push > 0 or abs(safe_push) * 2 < min(dimensions):
-                        dimensions += Vector((2 * safe_push,) * 3)
-                    dimensions = Vector((max(dimensions.x, epsilon), max(dimensions.y, epsilon), max(dimensions.z, epsilon)))
+                    dimensions = apply_push_to_dimensions(dimensions, self.push_value)
                     world_center = context.scene.cursor.location + (cursor_rot_mat @ local_center)
                     edge_verts, face_verts = generate_bbox_geometry_optimized(world_center, dimensions, cursor_rot_mat, _state.bbox_geometry_cache)
                     _state.current_bbox_data = {'edges': edge_verts, 'faces': face_verts, 'center': world_center, 'dimensions': dimensions}
@@ -208,16 +203,11 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
                 if all_coords and preview_objs[0]:
                     # Use first object's local orientation
                     local_rotation = get_object_rotation_euler(preview_objs[0])
-                    from ..functions.core import calculate_bbox_bounds_optimized, generate_bbox_geometry_optimized
+                    from ..functions.core import calculate_bbox_bounds_optimized, generate_bbox_geometry_optimized, apply_push_to_dimensions
                     local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
                         all_coords, context.scene.cursor.location, local_rotation
                     )
-                    epsilon = 0.0001
-                    dimensions = Vector((max(dimensions.x, epsilon), max(dimensions.y, epsilon), max(dimensions.z, epsilon)))
-                    safe_push = float(self.push_value)
-                    if safe_push > 0 or abs(safe_push) * 2 < min(dimensions):
-                        dimensions += Vector((2 * safe_push,) * 3)
-                    dimensions = Vector((max(dimensions.x, epsilon), max(dimensions.y, epsilon), max(dimensions.z, epsilon)))
+                    dimensions = apply_push_to_dimensions(dimensions, self.push_value)
                     world_center = context.scene.cursor.location + (cursor_rot_mat @ local_center)
                     edge_verts, face_verts = generate_bbox_geometry_optimized(world_center, dimensions, cursor_rot_mat, _state.bbox_geometry_cache)
                     _state.current_bbox_data = {'edges': edge_verts, 'faces': face_verts, 'center': world_center, 'dimensions': dimensions}
@@ -238,17 +228,12 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
                         all_coords.extend([obj_mat @ v.co for v in mesh.vertices])
                 
                 if all_coords:
-                    from ..functions.core import calculate_bbox_bounds_optimized, generate_bbox_geometry_optimized
+                    from ..functions.core import calculate_bbox_bounds_optimized, generate_bbox_geometry_optimized, apply_push_to_dimensions
                     cursor_rotation = context.scene.cursor.rotation_euler
                     local_center, dimensions, cursor_rot_mat = calculate_bbox_bounds_optimized(
                         all_coords, context.scene.cursor.location, cursor_rotation
                     )
-                    epsilon = 0.0001
-                    dimensions = Vector((max(dimensions.x, epsilon), max(dimensions.y, epsilon), max(dimensions.z, epsilon)))
-                    safe_push = float(self.push_value)
-                    if safe_push > 0 or abs(safe_push) * 2 < min(dimensions):
-                        dimensions += Vector((2 * safe_push,) * 3)
-                    dimensions = Vector((max(dimensions.x, epsilon), max(dimensions.y, epsilon), max(dimensions.z, epsilon)))
+                    dimensions = apply_push_to_dimensions(dimensions, self.push_value)
                     world_center = context.scene.cursor.location + (cursor_rot_mat @ local_center)
                     edge_verts, face_verts = generate_bbox_geometry_optimized(world_center, dimensions, cursor_rot_mat, _state.bbox_geometry_cache)
                     _state.current_bbox_data = {'edges': edge_verts, 'faces': face_verts, 'center': world_center, 'dimensions': dimensions}
@@ -284,6 +269,19 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
             "Depsgraph", lambda: self.use_depsgraph, kind="bool"))
         self.hud_ctl.attach(context)
 
+    def _raycast_key(self, event):
+        return (event.mouse_region_x, event.mouse_region_y, self.use_depsgraph)
+
+    def _raycast(self, context, event):
+        """Face under the mouse, reusing the hover raycast if the mouse has
+        not moved since (clicks and keys land on the last hovered position)."""
+        key = self._raycast_key(event)
+        if self._last_rc is not None and self._last_rc[0] == key:
+            return self._last_rc[1]
+        face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+        self._last_rc = (key, face_data)
+        return face_data
+
     def modal(self, context, event):
         # HUD: capture event for cursor-follow + forward toggle/drag events.
         if hasattr(self, 'hud_ctl') and self.hud_ctl is not None:
@@ -291,6 +289,12 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
             if self.hud_ctl.handle_events(context, event):
                 return {'RUNNING_MODAL'}
 
+        # Only hover, click, snap and edge cycling reuse the last raycast;
+        # other events may move the view or create objects under the mouse
+        if not (event.type in {'MOUSEMOVE', 'LEFTMOUSE', 'S'}
+                or (event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and event.alt)):
+            self._last_rc = None
+
         # Allow navigation events to pass through
         if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and event.shift:
             return {'PASS_THROUGH'}
@@ -304,12 +308,13 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
         
         # LEFT MOUSE - Create box for currently previewed object/objects
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
-            # Place cursor first
-            result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph)
-            
-            if not result['success']:
+            # Place cursor first (the click may create a box under the mouse)
+            face_data = self._raycast(context, event)
+            self._last_rc = None
+            if not face_data:
                 self.report({'WARNING'}, "No surface hit")
                 return {'RUNNING_MODAL'}
+            result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False, use_depsgraph=self.use_depsgraph, face_data=face_data)
             
             # In extend mode, left click adds objects to extend list
             if self.extend_mode:
@@ -350,33 +355,34 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
             return {'RUNNING_MODAL'}
         
         elif event.type == 'WHEELUPMOUSE' and event.alt:
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+            face_data = self._raycast(context, event)
             if face_data:
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, 1, self.current_edge_index
                 )
-                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=True, use_depsgraph=self.use_depsgraph)
+                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=True, use_depsgraph=self.use_depsgraph, face_data=face_data)
                 if result['success']:
                     context.area.tag_redraw()
             return {'RUNNING_MODAL'}
         
         elif event.type == 'WHEELDOWNMOUSE' and event.alt:
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+            face_data = self._raycast(context, event)
             if face_data:
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, -1, self.current_edge_index
                 )
-                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=True, use_depsgraph=self.use_depsgraph)
+                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=True, use_depsgraph=self.use_depsgraph, face_data=face_data)
                 if result['success']:
                     context.area.tag_redraw()
             return {'RUNNING_MODAL'}
         
         elif event.type == 'MOUSEMOVE':
-            result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=True, use_depsgraph=self.use_depsgraph)
+            face_data = self._raycast(context, event)
             
-            if result['success']:
+            if face_data:
+                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=True, use_depsgraph=self.use_depsgraph, face_data=face_data)
                 self.current_face_data = result['face_data']
                 
                 # In extend mode, show preview including hovered object
@@ -404,7 +410,7 @@ class CursorBBox_OT_set_and_fit_box(bpy.types.Operator):
         
         elif event.type == 'S' and event.value == 'PRESS':
             # Snap cursor to closest vertex, edge midpoint, or face center from current face
-            face_data = get_face_edges_from_raycast(context, event, use_depsgraph=self.use_depsgraph)
+            face_data = self._raycast(context, event)
             result = snap_cursor_to_closest_element(context, event, face_data, use_depsgraph=self.use_depsgraph)
             if result['success']:
                 if face_data:
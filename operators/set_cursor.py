@@ -22,20 +22,30 @@ class CursorBBox_OT_set_cursor(bpy.types.Operator):
     
     current_edge_index: bpy.props.IntProperty(default=0)
     current_face_data = None
+    _last_rc = None  # (mouse position, face data) of the last raycast
     
+    def _raycast(self, context, event):
+        """Face under the mouse, reusing the hover raycast if the mouse has
+        not moved since (clicks land on the last hovered position)."""
+        key = (event.mouse_region_x, event.mouse_region_y)
+        if self._last_rc is not None and self._last_rc[0] == key:
+            return self._last_rc[1]
+        face_data = get_face_edges_from_raycast(context, event)
+        self._last_rc = (key, face_data)
+        return face_data
+
     def modal(self, context, event):
-        # Allow navigation events to pass through
-        if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and event.shift:
-            return {'PASS_THROUGH'}
-        if event.type == 'MIDDLEMOUSE':
-            return {'PASS_THROUGH'}
-        if event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and (event.ctrl or event.shift):
+        # Allow navigation events to pass through; they move the view under
+        # the mouse, so the cached raycast no longer applies
+        if event.type == 'MIDDLEMOUSE' or (
+                event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and (event.ctrl or event.shift)):
+            self._last_rc = None
             return {'PASS_THROUGH'}
         
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
-            result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False)
-            
-            if result['success']:
+            face_data = self._raycast(context, event)
+            if face_data:
+                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False, face_data=face_data)
                 self.report({'INFO'}, f"Cursor placed on {result['object'].name}")
             else:
                 self.report({'WARNING'}, "No surface hit")
@@ -46,43 +56,44 @@ class CursorBBox_OT_set_cursor(bpy.types.Operator):
 
         elif event.type == 'WHEELUPMOUSE' and not event.shift and not event.ctrl:
             # Get face data first
-            face_data = get_face_edges_from_raycast(context, event)
+            face_data = self._raycast(context, event)
             if face_data:
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, 1, self.current_edge_index
                 )
                 # Update cursor and highlight
-                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False)
+                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False, face_data=face_data)
                 if result['success']:
                     context.area.tag_redraw()
             return {'RUNNING_MODAL'}
         
         elif event.type == 'WHEELDOWNMOUSE' and not event.shift and not event.ctrl:
             # Get face data first
-            face_data = get_face_edges_from_raycast(context, event)
+            face_data = self._raycast(context, event)
             if face_data:
                 self.current_face_data = face_data
                 self.current_edge_index = select_edge_by_scroll(
                     face_data, -1, self.current_edge_index
                 )
                 # Update cursor and highlight
-                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False)
+                result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False, face_data=face_data)
                 if result['success']:
                     context.area.tag_redraw()
             return {'RUNNING_MODAL'}
         
         elif event.type == 'MOUSEMOVE':
             # Update preview as mouse moves
-            result = place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False)
-            if result['success']:
-                self.current_face_data = result['face_data']
+            face_data = self._raycast(context, event)
+            if face_data:
+                place_cursor_with_raycast_and_edge(context, event, self.align_to_face, self.current_edge_index, preview=False, face_data=face_data)
+                self.current_face_data = face_data
                 context.area.tag_redraw()
             return {'RUNNING_MODAL'}
         
         elif event.type == 'S' and event.value == 'PRESS':
             # Snap cursor to closest vertex, edge midpoint, or face center from current face
-            face_data = get_face_edges_from_raycast(context, event)
+            face_data = self._raycast(context, event)
             result = snap_cursor_to_closest_element(context, event, face_data)
             if result['success']:
                 if face_data:
@@ -110,6 +121,7 @@ class CursorBBox_OT_set_cursor(bpy.types.Operator):
         if context.area.type == 'VIEW_3D':
             self.current_edge_index = 0
             self.current_face_data = None
+            self._last_rc = None
             enable_edge_highlight()
             enable_bbox_preview()
             context.window_manager.modal_handler_add(self)
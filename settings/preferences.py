@@ -415,6 +415,16 @@ def get_preferences():
     except:
         return None
 
+def get_bbox_display_prefs(prefs=None):
+    """Return (show_wire, show_all_edges) for newly created boxes.
+
+    Pass an already fetched preferences object to skip the addon lookup.
+    """
+    if prefs is None:
+        prefs = get_preferences()
+    return (getattr(prefs, 'bbox_show_wire', True),
+            getattr(prefs, 'bbox_show_all_edges', True))
+
 def register():
     bpy.utils.register_class(CursorBBoxPreferences)
 
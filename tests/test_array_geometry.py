@@ -0,0 +1,479 @@
+"""Tests for the NumPy-only geometry helpers (no Blender required).
+
+Run with:
+    python tests/test_array_geometry.py
+"""
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Make the bpy-free helpers importable standalone (they are normally imported
+# as Cursor_BBox.functions.array_geometry inside Blender).
+_FUNCTIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "functions")
+if _FUNCTIONS_DIR not in sys.path:
+    sys.path.insert(0, _FUNCTIONS_DIR)
+
+import array_geometry as ag  # noqa: E402
+
+
+# --------------------------------------------------------------------- #
+#  Mesh fixtures: (vertices, polygons) as Blender would store them       #
+# --------------------------------------------------------------------- #
+
+# Unit cube, outward-wound quads
+CUBE_VERTS = [
+    (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+    (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+]
+CUBE_FACES = [
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+    (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+]
+
+
+def _prism(cells):
+    """Unit-height prism over a set of (x, y) grid cells, split per cell.
+
+    The top and bottom are one quad per cell, so an L of three cells gives
+    three coplanar top faces joined by interior edges.
+    """
+    verts = []
+    index = {}
+
+    def vid(x, y, z):
+        key = (x, y, z)
+        if key not in index:
+            index[key] = len(verts)
+            verts.append(key)
+        return index[key]
+
+    faces = []
+    for x, y in sorted(cells):
+        faces.append((vid(x, y, 1), vid(x + 1, y, 1), vid(x + 1, y + 1, 1), vid(x, y + 1, 1)))
+        faces.append((vid(x, y, 0), vid(x, y + 1, 0), vid(x + 1, y + 1, 0), vid(x + 1, y, 0)))
+        # Walls on the cell sides not shared with another cell
+        if (x, y - 1) not in cells:
+            faces.append((vid(x, y, 0), vid(x + 1, y, 0), vid(x + 1, y, 1), vid(x, y, 1)))
+        if (x + 1, y) not in cells:
+            faces.append((vid(x + 1, y, 0), vid(x + 1, y + 1, 0), vid(x + 1, y + 1, 1), vid(x + 1, y, 1)))
+        if (x, y + 1) not in cells:
+            faces.append((vid(x + 1, y + 1, 0), vid(x, y + 1, 0), vid(x, y + 1, 1), vid(x + 1, y + 1, 1)))
+        if (x - 1, y) not in cells:
+            faces.append((vid(x, y + 1, 0), vid(x, y, 0), vid(x, y, 1), vid(x, y + 1, 1)))
+    return verts, faces
+
+
+def _fan(angles_deg):
+    """Strip of quads hinged on shared edges, each tilted to the given angle.
+
+    Face i has its normal rotated angles_deg[i] about the X axis from +Z,
+    so the angle between any face and face 0 is known exactly.
+    """
+    verts = []
+    y = z = 0.0
+    for angle in angles_deg:
+        verts += [(0.0, y, z), (1.0, y, z)]
+        rad = math.radians(angle)
+        y += math.cos(rad)
+        z += math.sin(rad)
+    verts += [(0.0, y, z), (1.0, y, z)]
+    faces = [(2 * i, 2 * i + 1, 2 * i + 3, 2 * i + 2) for i in range(len(angles_deg))]
+    return verts, faces
+
+
+def _mesh_arrays(verts, faces):
+    """The arrays CoplanarCache reads with foreach_get: normals, loop_total,
+    loop edge indices and the edge count."""
+    verts = np.asarray(verts, dtype=np.float64)
+    edge_index = {}
+    loop_edges = []
+    normals = []
+    for face in faces:
+        for a, b in zip(face, face[1:] + face[:1]):
+            key = (min(a, b), max(a, b))
+            loop_edges.append(edge_index.setdefault(key, len(edge_index)))
+        # Newell's method, as Blender uses for polygon normals
+        n = np.zeros(3)
+        for a, b in zip(face, face[1:] + face[:1]):
+            p, q = verts[a], verts[b]
+            n += ((p[1] - q[1]) * (p[2] + q[2]),
+                  (p[2] - q[2]) * (p[0] + q[0]),
+                  (p[0] - q[0]) * (p[1] + q[1]))
+        length = np.linalg.norm(n)
+        normals.append(n / length if length > 1e-12 else n)
+    normals = np.asarray(normals, dtype=np.float32)
+    loop_total = np.array([len(f) for f in faces], dtype=np.int32)
+    return normals, loop_total, np.array(loop_edges, dtype=np.int32), len(edge_index)
+
+
+def _reference_coplanar(faces, normals, seed, angle_tolerance):
+    """The per-face BFS get_connected_coplanar_faces ran on a BMesh before
+    it moved to CSR arrays: neighbours through shared edges, each compared
+    to the seed normal, zero-length normals counting as parallel."""
+    edge_faces = {}
+    for fi, face in enumerate(faces):
+        for a, b in zip(face, face[1:] + face[:1]):
+            edge_faces.setdefault((min(a, b), max(a, b)), []).append(fi)
+
+    def angle(n1, n2):
+        l1, l2 = np.linalg.norm(n1), np.linalg.norm(n2)
+        if l1 < 1e-12 or l2 < 1e-12:
+            return 0.0  # mathutils raises ValueError; the BFS treated it as 0
+        return math.acos(max(-1.0, min(1.0, float(np.dot(n1, n2)) / (l1 * l2))))
+
+    start_normal = normals[seed]
+    visited = {seed}
+    result = {seed}
+    queue = [seed]
+    while queue:
+        current = queue.pop(0)
+        face = faces[current]
+        for a, b in zip(face, face[1:] + face[:1]):
+            for neighbor in edge_faces[(min(a, b), max(a, b))]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    if angle(start_normal, normals[neighbor]) < angle_tolerance:
+                        result.add(neighbor)
+                        queue.append(neighbor)
+    return result
+
+
+def _coplanar(verts, faces, seed, angle_tolerance):
+    """coplanar_from_normals the way get_connected_coplanar_faces calls it."""
+    normals, loop_total, loop_edges, edge_count = _mesh_arrays(verts, faces)
+    adjacency = ag.face_adjacency_csr(len(faces), loop_total, loop_edges, edge_count)
+    degenerate = np.einsum('ij,ij->i', normals, normals) < 1e-12
+    found = ag.coplanar_from_normals(normals, adjacency, seed,
+                                     np.cos(angle_tolerance), degenerate=degenerate)
+    return set(found.tolist()), normals
+
+
+class CoplanarFromNormalsTests(unittest.TestCase):
+    def assertMatchesReference(self, verts, faces, angle_tolerance, seeds=None):
+        for seed in range(len(faces)) if seeds is None else seeds:
+            found, normals = _coplanar(verts, faces, seed, angle_tolerance)
+            expected = _reference_coplanar(faces, normals.astype(np.float64), seed, angle_tolerance)
+            self.assertEqual(found, expected, f"seed {seed}")
+
+    def test_cube_faces_are_separate(self):
+        for seed in range(6):
+            found, _ = _coplanar(CUBE_VERTS, CUBE_FACES, seed, math.radians(5))
+            self.assertEqual(found, {seed})
+        self.assertMatchesReference(CUBE_VERTS, CUBE_FACES, math.radians(5))
+
+    def test_cube_wide_tolerance_spans_neighbours_only(self):
+        # 91 degrees admits the four side faces but not the opposite face,
+        # which is only reachable through them
+        found, _ = _coplanar(CUBE_VERTS, CUBE_FACES, 0, math.radians(91))
+        self.assertEqual(found, {0, 2, 3, 4, 5})
+        self.assertMatchesReference(CUBE_VERTS, CUBE_FACES, math.radians(91))
+
+    def test_l_shape_top_is_one_region(self):
+        verts, faces = _prism({(0, 0), (1, 0), (0, 1)})
+        top = {i for i, f in enumerate(faces) if all(verts[v][2] == 1 for v in f)}
+        bottom = {i for i, f in enumerate(faces) if all(verts[v][2] == 0 for v in f)}
+        self.assertEqual(len(top), 3)
+        for seed in top:
+            found, _ = _coplanar(verts, faces, seed, math.radians(1))
+            self.assertEqual(found, top)
+        for seed in bottom:
+            found, _ = _coplanar(verts, faces, seed, math.radians(1))
+            self.assertEqual(found, bottom)
+        self.assertMatchesReference(verts, faces, math.radians(1))
+        self.assertMatchesReference(verts, faces, math.radians(95))
+
+    def test_l_shape_walls_split_at_corners(self):
+        # Parallel walls on either side of the inner corner are not connected
+        # through coplanar faces, so they stay separate regions
+        verts, faces = _prism({(0, 0), (1, 0), (0, 1)})
+        self.assertMatchesReference(verts, faces, math.radians(30))
+
+    def test_angle_threshold_edges(self):
+        # Face i is tilted i * 10 degrees from face 0
+        verts, faces = _fan([0, 10, 20, 30, 40])
+        cases = (
+            (9.5, {0}),
+            (10.5, {0, 1}),
+            (29.5, {0, 1, 2}),
+            (30.5, {0, 1, 2, 3}),
+            (45.0, {0, 1, 2, 3, 4}),
+        )
+        for tolerance_deg, expected in cases:
+            found, _ = _coplanar(verts, faces, 0, math.radians(tolerance_deg))
+            self.assertEqual(found, expected, f"{tolerance_deg} deg")
+            self.assertMatchesReference(verts, faces, math.radians(tolerance_deg))
+
+    def test_threshold_compares_to_seed_not_neighbour(self):
+        # Each hinge is only 8 degrees, but the walk compares against the
+        # seed normal, so it stops once the accumulated tilt passes 20
+        verts, faces = _fan([0, 8, 16, 24, 32])
+        found, _ = _coplanar(verts, faces, 0, math.radians(20))
+        self.assertEqual(found, {0, 1, 2})
+        self.assertMatchesReference(verts, faces, math.radians(20))
+
+    def test_failing_face_blocks_the_walk(self):
+        # Faces beyond a face that fails the test are not reached, even when
+        # they are parallel to the seed
+        verts, faces = _fan([0, 0, 45, 0, 0])
+        found, _ = _coplanar(verts, faces, 0, math.radians(5))
+        self.assertEqual(found, {0, 1})
+        self.assertMatchesReference(verts, faces, math.radians(5))
+
+    def test_degenerate_face_counts_as_parallel(self):
+        # A zero-length middle face (the strip folds back on itself) passes
+        # and bridges to the faces behind it
+        verts, faces = _fan([0, 0, 0, 0])
+        verts = [list(v) for v in verts]
+        # Collapse face 2 to a line: move its far edge onto its near edge
+        verts[6] = list(verts[4])
+        verts[7] = list(verts[5])
+        for i in range(8, len(verts)):
+            verts[i][1] -= 1.0
+        normals, _, _, _ = _mesh_arrays(verts, faces)
+        self.assertLess(float(np.dot(normals[2], normals[2])), 1e-12)
+
+        found, _ = _coplanar(verts, faces, 0, math.radians(5))
+        self.assertEqual(found, {0, 1, 2, 3})
+        self.assertMatchesReference(verts, faces, math.radians(5))
+
+    def test_degenerate_seed_takes_the_connected_mesh(self):
+        verts, faces = _fan([0, 30, 60, 90])
+        verts = [list(v) for v in verts]
+        # Collapse face 0 onto its shared edge with face 1
+        verts[0] = list(verts[2])
+        verts[1] = list(verts[3])
+        found, _ = _coplanar(verts, faces, 0, math.radians(1))
+        self.assertEqual(found, {0, 1, 2, 3})
+        self.assertMatchesReference(verts, faces, math.radians(1), seeds=[0])
+
+
+class FaceAdjacencyCSRTests(unittest.TestCase):
+    def test_cube_neighbours(self):
+        normals, loop_total, loop_edges, edge_count = _mesh_arrays(CUBE_VERTS, CUBE_FACES)
+        face_start, neighbors = ag.face_adjacency_csr(6, loop_total, loop_edges, edge_count)
+        for f in range(6):
+            got = set(neighbors[face_start[f]:face_start[f + 1]].tolist())
+            opposite = {0: 1, 1: 0, 2: 4, 4: 2, 3: 5, 5: 3}[f]
+            self.assertEqual(got, set(range(6)) - {f, opposite})
+
+    def test_concat_ranges(self):
+        starts = np.array([5, 0, 9])
+        lengths = np.array([2, 3, 0])
+        self.assertEqual(ag.concat_ranges(starts, lengths).tolist(), [5, 6, 0, 1, 2])
+
+
+class Vec:
+    """Just enough of mathutils.Vector for project_point_to_plane_intersection."""
+
+    def __init__(self, *xyz):
+        self.v = np.array(xyz, dtype=np.float64)
+
+    def cross(self, other):
+        return Vec(*np.cross(self.v, other.v))
+
+    def dot(self, other):
+        return float(self.v @ other.v)
+
+    @property
+    def length_squared(self):
+        return self.dot(self)
+
+    def __add__(self, other):
+        return Vec(*(self.v + other.v))
+
+    def __sub__(self, other):
+        return Vec(*(self.v - other.v))
+
+    def __rmul__(self, scalar):
+        return Vec(*(scalar * self.v))
+
+    def __truediv__(self, scalar):
+        return Vec(*(self.v / scalar))
+
+
+class ProjectPointToPlaneIntersectionTests(unittest.TestCase):
+    def assertOnPlane(self, point, origin, normal):
+        self.assertAlmostEqual(normal.dot(point - origin), 0.0, places=9)
+
+    def check(self, hit, face_normal, plane_origin, plane_normal):
+        result = ag.project_point_to_plane_intersection(hit, face_normal, plane_origin, plane_normal)
+        self.assertIsNotNone(result)
+        self.assertOnPlane(result, hit, face_normal)
+        self.assertOnPlane(result, plane_origin, plane_normal)
+        # The closest point on the line: hit - result is perpendicular to it
+        line_dir = face_normal.cross(plane_normal)
+        self.assertAlmostEqual((hit - result).dot(line_dir), 0.0, places=9)
+        return result
+
+    def test_perpendicular_planes(self):
+        result = self.check(Vec(2, 3, 0), Vec(0, 0, 1), Vec(0, 1, 0), Vec(0, 1, 0))
+        np.testing.assert_allclose(result.v, [2, 1, 0], atol=1e-12)
+
+    def test_planes_at_45_degrees(self):
+        s = math.sqrt(0.5)
+        # Floor z = 0 against the plane y = z through (0, 1, 1) tilted 45 degrees
+        result = self.check(Vec(5, 4, 0), Vec(0, 0, 1), Vec(0, 1, 1), Vec(0, s, -s))
+        np.testing.assert_allclose(result.v, [5, 0, 0], atol=1e-12)
+
+    def test_oblique_unnormalized_normals(self):
+        # Normals are not unit length and planes are offset from the origin;
+        # the function skips normalization so this must still land on both
+        self.check(Vec(1.5, -2.0, 0.25), Vec(3, 1, 2), Vec(4, -1, 7), Vec(-2, 5, 0.5))
+        s = math.sqrt(0.5)
+        self.check(Vec(-3, 2, 1), Vec(s, 0, s), Vec(1, 1, 1), Vec(0, 2, 2))
+
+    def test_parallel_planes_return_none(self):
+        self.assertIsNone(ag.project_point_to_plane_intersection(
+            Vec(0, 0, 0), Vec(0, 0, 1), Vec(0, 0, 5), Vec(0, 0, -2)))
+        # Nearly parallel: the cross product is under the 1e-6 threshold
+        self.assertIsNone(ag.project_point_to_plane_intersection(
+            Vec(0, 0, 0), Vec(0, 0, 1), Vec(0, 0, 5), Vec(0, 1e-4, 1)))
+
+
+def _rotation(axis, angle_deg):
+    """3x3 rotation matrix about a unit axis (Rodrigues)."""
+    x, y, z = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    k = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    a = math.radians(angle_deg)
+    return np.eye(3) + math.sin(a) * k + (1 - math.cos(a)) * (k @ k)
+
+
+def _reference_sphere(points, cursor_location, cursor_rot_mat):
+    """The per-vertex loop create_bounding_sphere_from_marked ran before it
+    shared the array version: invert the cursor matrix, take min/max one
+    component at a time, then the largest distance from the box centre."""
+    cursor_matrix = np.eye(4)
+    cursor_matrix[:3, :3] = cursor_rot_mat
+    cursor_matrix[:3, 3] = cursor_location
+    cursor_matrix_inv = np.linalg.inv(cursor_matrix)
+    local_verts = [(cursor_matrix_inv @ np.append(v, 1.0))[:3] for v in points]
+
+    min_co = list(local_verts[0])
+    max_co = list(local_verts[0])
+    for v in local_verts:
+        for axis in range(3):
+            min_co[axis] = min(min_co[axis], v[axis])
+            max_co[axis] = max(max_co[axis], v[axis])
+    local_center = (np.array(min_co) + np.array(max_co)) / 2.0
+
+    radius = 0.0
+    for v in local_verts:
+        dist = float(np.linalg.norm(v - local_center))
+        if dist > radius:
+            radius = dist
+    world_center = (cursor_matrix @ np.append(local_center, 1.0))[:3]
+    return local_center, world_center, radius
+
+
+class CursorLocalBoundingSphereTests(unittest.TestCase):
+    def assertMatchesReference(self, points, cursor_location, cursor_rot_mat):
+        local_center, radius = ag.cursor_local_bounding_sphere(points, cursor_location, cursor_rot_mat)
+        ref_local, ref_world, ref_radius = _reference_sphere(points, cursor_location, cursor_rot_mat)
+        np.testing.assert_allclose(local_center, ref_local, atol=1e-9)
+        self.assertAlmostEqual(radius, ref_radius, places=9)
+        # core.cursor_aligned_bounding_sphere maps the centre back as c + R @ local
+        world_center = np.asarray(cursor_location) + np.asarray(cursor_rot_mat) @ local_center
+        np.testing.assert_allclose(world_center, ref_world, atol=1e-9)
+        return local_center, radius
+
+    def test_identity_cursor(self):
+        points = np.array([(0, 0, 0), (2, 0, 0), (0, 4, 0), (0, 0, 6)], dtype=np.float64)
+        local_center, radius = self.assertMatchesReference(points, (0, 0, 0), np.eye(3))
+        np.testing.assert_allclose(local_center, [1, 2, 3])
+
+    def test_rotated_cursor_box_centre(self):
+        # A box aligned to a cursor rotated 30 degrees about Z: the sphere is
+        # centred on the box, not on the world-axis bounds of the corners
+        rot = _rotation((0, 0, 1), 30)
+        location = np.array([1.0, -2.0, 0.5])
+        corners = np.array([(x, y, z) for x in (0, 4) for y in (0, 2) for z in (0, 1)], dtype=np.float64)
+        points = location + corners @ rot.T
+        local_center, radius = self.assertMatchesReference(points, location, rot)
+        np.testing.assert_allclose(local_center, [2, 1, 0.5], atol=1e-12)
+        self.assertAlmostEqual(radius, math.sqrt(4 + 1 + 0.25))
+
+    def test_random_clouds_oblique_cursor(self):
+        rng = np.random.default_rng(7)
+        for axis, angle in (((1, 1, 0), 45), ((0.3, -0.8, 0.5), 137), ((0, 1, 0), -90)):
+            points = rng.normal(size=(50, 3)) * (3.0, 0.5, 1.0) + (10.0, -4.0, 2.0)
+            self.assertMatchesReference(points, rng.normal(size=3), _rotation(axis, angle))
+
+    def test_single_point(self):
+        local_center, radius = self.assertMatchesReference(
+            np.array([(1.0, 2.0, 3.0)]), (1.0, 1.0, 1.0), _rotation((0, 0, 1), 90))
+        self.assertEqual(radius, 0.0)
+
+
+class PointBufferTests(unittest.TestCase):
+    def test_grows_past_initial_capacity(self):
+        buf = ag.PointBuffer()
+        points = [(i, -i, 0.5 * i) for i in range(150)]
+        for p in points:
+            buf.append(p)
+        self.assertEqual(len(buf), 150)
+        self.assertGreaterEqual(len(buf._buf), 150)
+        np.testing.assert_array_equal(buf.array, np.array(points, dtype=np.float64))
+
+    def test_growth_keeps_rows_written_before_it(self):
+        buf = ag.PointBuffer(capacity=2)
+        for i in range(5):
+            buf.append((i, i, i))
+            np.testing.assert_array_equal(buf.array[:, 0], np.arange(i + 1))
+        self.assertEqual(len(buf._buf), 8)
+
+    def test_append_takes_first_three_components(self):
+        buf = ag.PointBuffer()
+        buf.append((1.0, 2.0, 3.0, 1.0))
+        buf.append(np.array([4.0, 5.0, 6.0]))
+        np.testing.assert_array_equal(buf.array, [[1, 2, 3], [4, 5, 6]])
+
+    def test_empty_buffer_is_falsy(self):
+        buf = ag.PointBuffer()
+        self.assertFalse(buf)
+        self.assertEqual(buf.array.shape, (0, 3))
+        self.assertEqual(list(buf), [])
+        buf.append((0, 0, 0))
+        self.assertTrue(buf)
+
+    def test_clear_resets_count_and_keeps_capacity(self):
+        buf = ag.PointBuffer()
+        for i in range(100):
+            buf.append((i, 0, 0))
+        capacity = len(buf._buf)
+        buf.clear()
+        self.assertEqual(len(buf), 0)
+        self.assertFalse(buf)
+        self.assertEqual(buf.array.shape, (0, 3))
+        self.assertEqual(len(buf._buf), capacity)
+        buf.append((7, 8, 9))
+        np.testing.assert_array_equal(buf.array, [[7, 8, 9]])
+
+    def test_array_is_a_view_until_growth(self):
+        buf = ag.PointBuffer(capacity=4)
+        buf.append((1, 1, 1))
+        view = buf.array
+        snapshot = buf.array.copy()
+        # Overwriting after clear shows through the view, not the copy
+        buf.clear()
+        buf.append((9, 9, 9))
+        np.testing.assert_array_equal(view, [[9, 9, 9]])
+        np.testing.assert_array_equal(snapshot, [[1, 1, 1]])
+        # Once the buffer grows the old view no longer tracks it
+        for i in range(4):
+            buf.append((i, i, i))
+        buf._buf[0] = (5, 5, 5)
+        np.testing.assert_array_equal(view, [[9, 9, 9]])
+
+    def test_iterates_rows_in_append_order(self):
+        buf = ag.PointBuffer()
+        for i in range(70):
+            buf.append((i, 2 * i, 3 * i))
+        rows = [tuple(row) for row in buf]
+        self.assertEqual(rows, [(i, 2 * i, 3 * i) for i in range(70)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from gpu_extras.batch import batch_for_shader
 from mathutils import Vector
 from ..settings.preferences import get_preferences
 from functools import lru_cache
+import numpy as np
 
 # ===== GPU DRAWING MANAGER =====
 
@@ -22,12 +23,18 @@ class GPUDrawingManager:
         return self.shader_cache[shader_type]
     
     def get_cached_batch(self, cache_key, geometry_type, vertices):
-        """Get cached GPU batch, create if not exists or data changed"""
-        if not vertices:
+        """Get cached GPU batch, create if not exists or data changed
+
+        vertices may be a sequence of Vectors or an (N, 3) float array.
+        """
+        if vertices is None or len(vertices) == 0:
             return None
             
         # Create hash of vertex data for change detection
-        data_hash = hash(tuple(tuple(v) for v in vertices))
+        if isinstance(vertices, np.ndarray):
+            data_hash = hash(vertices.tobytes())
+        else:
+            data_hash = hash(tuple(tuple(v) for v in vertices))
         
         # Check if we need to update the batch
         if (cache_key not in self.batch_cache or 
@@ -292,7 +299,7 @@ def draw_preview_faces(gpu_manager, preview_faces_visual_cache, show_backfaces=F
     shader.uniform_float("color", preview_color)
     
     for obj_name, face_vertices in preview_faces_visual_cache.items():
-        if face_vertices:
+        if len(face_vertices):
             batch = gpu_manager.get_cached_batch(
                 f'preview_faces_{obj_name}', 'TRIS', face_vertices
             )
@@ -335,7 +342,7 @@ def draw_marked_faces(gpu_manager, marked_faces_visual_cache, marked_points, sho
         shader.uniform_float("color", face_color)
         
         for obj_name, face_vertices in marked_faces_visual_cache.items():
-            if face_vertices:
+            if len(face_vertices):
                 batch = gpu_manager.get_cached_batch(
                     f'marked_faces_{obj_name}', 'TRIS', face_vertices
                 )
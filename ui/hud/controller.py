@@ -63,11 +63,13 @@ class HUDController:
         self.hud.draw(ctx, self._event_snap)
         self.help.draw(ctx, self._event_snap)
 
-    def update_event(self, event, context) -> None:
+    def update_event(self, event, context, redraw: bool = True) -> None:
         """Capture event into a snapshot and tag the region for redraw.
-        Call this at the top of `modal()` on every event."""
+        Call this at the top of `modal()` on every event. Operators that
+        batch their viewport redraws (e.g. onto a timer tick) pass
+        `redraw=False` and include the HUD in their own redraw."""
         self._event_snap = capture_event(event, self._event_snap)
-        if context.area is not None:
+        if redraw and context.area is not None:
             context.area.tag_redraw()
 
     def handle_events(self, context, event) -> bool:
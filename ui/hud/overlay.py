@@ -72,6 +72,8 @@ class HUDOverlay:
         self._smooth_origin: tuple[float, float] | None = None
         self._recovering: bool = False
         self._was_nav_frozen: bool = False
+        self._layout_key: tuple | None = None
+        self._layout: tuple[int, int, int, int] = (0, 0, 0, 0)
         self.visible: bool = True
         self.params_visible: bool = True
         self.mode_override: str | None = None
@@ -170,7 +172,36 @@ class HUDOverlay:
         return out
 
     # --- measurement ---
-    def _measure(self, theme, sections, param_sections, draw_params: bool):
+    def _param_rows(self, param_sections):
+        """Evaluate every visible param once per draw: a list of
+        (section title, [(name, value text, active), ...]). Measurement,
+        the layout key and rendering all read this snapshot, so the
+        value getters are not called twice per frame."""
+        return [(sec.title,
+                 [(p.name, p.value_text(), p.is_active())
+                  for p in sec.params if p.is_visible()])
+                for sec in param_sections]
+
+    def _layout_for(self, theme, sections, param_rows, draw_params: bool):
+        """Return the measured layout, re-measuring only when the visible
+        text or the theme metrics changed since the last draw. Most redraws
+        (mouse motion) leave every string identical."""
+        key = (
+            self.title, tuple(self._header_lines), draw_params,
+            tuple((sec.title, tuple((it.key, it.label) for it in sec.items))
+                  for sec in sections),
+            tuple((title, tuple(rows)) for title, rows in param_rows),
+            tuple(theme.text_sizes.items()), theme.font_path,
+            theme.hud.row_spacing, theme.hud.section_spacing,
+            theme.hud.key_label_spacing,
+        )
+        if key != self._layout_key:
+            self._layout = self._measure(theme, sections, param_rows,
+                                         draw_params)
+            self._layout_key = key
+        return self._layout
+
+    def _measure(self, theme, sections, param_rows, draw_params: bool):
         title_h = theme.text_size("hud_header")
         row_h = max(theme.text_size("hud_key"),
                     theme.text_size("hud_label"))
@@ -217,28 +248,24 @@ class HUDOverlay:
                 max_w = max(max_w, row_w)
                 h += row_h + theme.hud.row_spacing
 
-        for sec in param_sections:
-            for p in sec.params:
-                if not p.is_visible():
-                    continue
-                nw, _ = hud_text.measure(p.name + ":", theme=theme,
+        for _title, rows in param_rows:
+            for name, _value, _active in rows:
+                nw, _ = hud_text.measure(name + ":", theme=theme,
                                          size_token="normal")
                 widest_param_name = max(widest_param_name, int(nw))
         param_name_col_w = widest_param_name + gap
 
-        for i, sec in enumerate(param_sections):
+        for i, (title, rows) in enumerate(param_rows):
             if (i > 0 or self._header_lines or self.title
                     or sections):
                 h += theme.hud.section_spacing
-            if sec.title:
-                tw, _ = hud_text.measure(sec.title, theme=theme,
+            if title:
+                tw, _ = hud_text.measure(title, theme=theme,
                                          size_token="title")
                 max_w = max(max_w, int(tw))
                 h += title_h + theme.hud.row_spacing
-            for p in sec.params:
-                if not p.is_visible():
-                    continue
-                vw, _ = hud_text.measure(p.value_text(), theme=theme,
+            for _name, value, _active in rows:
+                vw, _ = hud_text.measure(value, theme=theme,
                                          size_token="normal")
                 row_w = param_name_col_w + int(vw)
                 max_w = max(max_w, row_w)
@@ -267,8 +294,9 @@ class HUDOverlay:
         region = self._find_bound_region() or context.region
         if region is None:
             return
-        w, h, key_col_w, param_name_col_w = self._measure(
-            theme, sections, param_sections, self.params_visible)
+        param_rows = self._param_rows(param_sections)
+        w, h, key_col_w, param_name_col_w = self._layout_for(
+            theme, sections, param_rows, self.params_visible)
         size = (w, h)
         self._last_size = size
         self._last_key_col_w = key_col_w
@@ -323,9 +351,9 @@ class HUDOverlay:
             origin = (int(sx), int(sy))
             self._last_origin = origin
         self._was_nav_frozen = nav_frozen
-        self._render(theme, origin, size, sections, param_sections)
+        self._render(theme, origin, size, sections, param_rows)
 
-    def _render(self, theme, origin, size, sections, param_sections) -> None:
+    def _render(self, theme, origin, size, sections, param_rows) -> None:
         x0, y0 = origin
         w, h = size
         if theme.hud.bg_enabled and w > 0 and h > 0:
@@ -388,24 +416,21 @@ class HUDOverlay:
                 y -= theme.hud.row_spacing
 
         prev_block = bool(self.title or self._header_lines or sections)
-        for i, sec in enumerate(param_sections):
+        for i, (title, rows) in enumerate(param_rows):
             if i > 0 or prev_block:
                 y -= theme.hud.section_spacing
-            if sec.title:
+            if title:
                 y -= title_h
-                hud_text.draw(sec.title, x0, y, theme=theme,
+                hud_text.draw(title, x0, y, theme=theme,
                               role=Role.HUD_HEADER, size_token="hud_header")
                 y -= theme.hud.row_spacing
-            for p in sec.params:
-                if not p.is_visible():
-                    continue
+            for name, value, active in rows:
                 y -= row_h
-                active = p.is_active()
                 name_role = Role.HUD_LABEL if active else Role.HUD_LABEL_INACTIVE
                 value_role = Role.HUD_ACTIVE_VALUE if active else Role.HUD_LABEL_INACTIVE
-                hud_text.draw(p.name + ":", x0, y, theme=theme,
+                hud_text.draw(name + ":", x0, y, theme=theme,
                               role=name_role, size_token="normal")
-                hud_text.draw(p.value_text(), x0 + param_name_col_w, y,
+                hud_text.draw(value, x0 + param_name_col_w, y,
                               theme=theme, role=value_role,
                               size_token="normal")
                 y -= theme.hud.row_spacing